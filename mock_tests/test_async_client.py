@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+
+def test_async_client_no_request_before_connect(httpserver: HTTPServer):
+    weaviate.AsyncClient(MOCK_SERVER_URL)
+    assert len(httpserver.log) == 0
+
+
+def test_async_query(weaviate_no_auth_mock):
+    def handler(request: Request):
+        assert "Get" in request.json["query"]
+        return Response(json.dumps({"data": {"Get": {"Test": [{"name": "test"}]}}}))
+
+    weaviate_no_auth_mock.expect_request("/v1/graphql").respond_with_handler(handler)
+
+    async def query() -> dict:
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            return await client.query.get("Test", ["name"]).do()
+
+    assert asyncio.run(query()) == {"data": {"Get": {"Test": [{"name": "test"}]}}}
+
+
+def test_async_data_and_schema(weaviate_no_auth_mock):
+    uuid = "7e4dd6f4-4a7c-4ac1-9e0e-95a2bb5e7c62"
+    weaviate_no_auth_mock.expect_request("/v1/objects", method="POST").respond_with_json(
+        {"id": uuid}
+    )
+    weaviate_no_auth_mock.expect_request(f"/v1/objects/Test/{uuid}").respond_with_json(
+        {"id": uuid, "properties": {"name": "test"}}
+    )
+    weaviate_no_auth_mock.expect_request("/v1/schema").respond_with_json({"classes": []})
+
+    async def run() -> tuple:
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            created = await client.data_object.create({"name": "test"}, "Test", uuid)
+            obj = await client.data_object.get_by_id(uuid, class_name="Test")
+            return created, obj, await client.schema.contains()
+
+    created, obj, contains = asyncio.run(run())
+    assert created == uuid
+    assert obj["properties"] == {"name": "test"}
+    assert contains is False
+
+
+def test_async_batch(weaviate_no_auth_mock):
+    objects_per_request = []
+
+    def objects_handler(request: Request):
+        objects_per_request.append(len(request.json["objects"]))
+        return Response(json.dumps([{"result": {}} for _ in request.json["objects"]]))
+
+    references_sent = []
+
+    def references_handler(request: Request):
+        # references are only sent after all objects were created
+        assert sum(objects_per_request) == 25
+        references_sent.extend(request.json)
+        return Response(json.dumps([{"result": {}} for _ in request.json]))
+
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_no_auth_mock.expect_request("/v1/batch/references").respond_with_handler(
+        references_handler
+    )
+
+    async def run() -> None:
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            async with client.batch.configure(batch_size=10, num_workers=2) as batch:
+                uuids = [await batch.add_data_object({"index": i}, "Test") for i in range(25)]
+                for uuid in uuids[1:]:
+                    await batch.add_reference(uuids[0], "Test", "ref", uuid, "Test")
+
+    asyncio.run(run())
+    assert objects_per_request == [10, 10, 5]
+    assert len(references_sent) == 24
+
+
+def test_async_batch_error_is_raised(weaviate_no_auth_mock):
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_response(
+        Response("Error", status=500)
+    )
+
+    async def run() -> None:
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            async with client.batch.configure(batch_size=2) as batch:
+                for i in range(3):
+                    await batch.add_data_object({"index": i}, "Test")
+
+    with pytest.raises(weaviate.UnexpectedStatusCodeException):
+        asyncio.run(run())
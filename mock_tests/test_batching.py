@@ -0,0 +1,667 @@
+import json
+import threading
+import time
+import uuid
+
+import pytest
+from pytest_httpserver import HTTPServer
+from requests import ReadTimeout
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from weaviate.exceptions import UnexpectedStatusCodeException
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_SERVER_URL
+
+
+def test_streaming_sends_references_after_objects(weaviate_mock):
+    """Test that streaming workers send all objects and create references only after their objects."""
+    lock = threading.Lock()
+    added_objects = []
+    missing_references = []
+
+    def handler_objects(request: Request):
+        time.sleep(0.05)
+        with lock:
+            added_objects.extend(obj["id"] for obj in request.json["objects"])
+        return Response(json.dumps([]))
+
+    def handler_references(request: Request):
+        with lock:
+            for ref in request.json:
+                if ref["from"].split("/")[-2] not in added_objects:
+                    missing_references.append(ref)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler_objects)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(handler_references)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=10, dynamic=False, num_workers=4, streaming=True)
+
+    n = 200
+    with client.batch as batch:
+        for _ in range(n):
+            uuid_ = batch.add_data_object({"name": "test"}, "Test", uuid.uuid4())
+            batch.add_reference(uuid_, "Test", "ref", uuid_, "Test")
+        batch.flush()
+        assert len(added_objects) == n
+
+    assert len(missing_references) == 0
+    assert client.batch.shape == (0, 0)
+
+
+def test_streaming_raises_worker_errors_on_flush(weaviate_mock):
+    """Test that an exception in a streaming worker is raised in the main thread."""
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_response(
+        Response(json.dumps({"error": [{"message": "failed"}]}), status=500)
+    )
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=5, dynamic=False, num_workers=2, streaming=True)
+
+    for _ in range(5):
+        client.batch.add_data_object({"name": "test"}, "Test")
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.batch.flush()
+    client.batch.shutdown()
+
+
+def test_add_data_objects_columnar(weaviate_mock):
+    """Test that columnar objects are split into batch requests of the configured size."""
+    np = pytest.importorskip("numpy")
+    requests = []
+
+    def handler_objects(request: Request):
+        requests.append(request.json["objects"])
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler_objects)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=4, dynamic=False)
+
+    n = 10
+    vectors = np.arange(n * 3, dtype=np.float32).reshape(n, 3)
+    with client.batch as batch:
+        batch.add_data_object({"name": "single"}, "Test")
+        uuids = batch.add_data_objects_columnar(
+            "test",
+            columns={"name": [f"name{i}" for i in range(n)], "count": np.arange(n)},
+            vectors=vectors,
+        )
+
+    assert [len(objects) for objects in requests] == [4, 4, 3]
+    sent = [obj for objects in requests for obj in objects][1:]
+    assert [obj["id"] for obj in sent] == uuids
+    assert sent[2] == {
+        "class": "Test",
+        "properties": {"name": "name2", "count": 2},
+        "id": uuids[2],
+        "vector": [6.0, 7.0, 8.0],
+    }
+
+
+def test_spool_resumes_unacknowledged_items(weaviate_mock, tmp_path):
+    """Test that only the items of failed batch requests are re-added from the spool."""
+    sent_objects = []
+    sent_references = []
+    fail = True
+
+    def handler_objects(request: Request):
+        if fail and len(sent_objects) > 0:
+            return Response(json.dumps({"error": [{"message": "failed"}]}), status=500)
+        sent_objects.append([obj["id"] for obj in request.json["objects"]])
+        return Response(json.dumps([]))
+
+    def handler_references(request: Request):
+        sent_references.extend(request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler_objects)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(handler_references)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    spool = weaviate.BatchSpool(str(tmp_path), segment_size=3)
+    client.batch.configure(batch_size=5, dynamic=False, spool=spool)
+
+    uuids = [str(uuid.uuid4()) for _ in range(9)]
+    client.batch.add_reference(uuids[0], "Test", "ref", uuids[1], "Test")
+    for uuid_ in uuids[:8]:
+        client.batch.add_data_object({"name": "test"}, "Test", uuid_)
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.batch.add_data_object({"name": "test"}, "Test", uuids[8])
+    spool.close()
+    assert sent_objects == [uuids[:4]]
+    assert len(sent_references) == 1
+
+    # a new process resumes from the same directory
+    fail = False
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    spool = weaviate.BatchSpool(str(tmp_path), segment_size=3)
+    assert spool.num_pending == 5
+    client.batch.configure(batch_size=5, dynamic=False, spool=spool)
+    with client.batch as batch:
+        assert batch.resume_from_spool() == 5
+
+    assert sent_objects[1:] == [uuids[4:]]
+    assert len(sent_references) == 1
+    assert spool.num_pending == 0
+    spool.close()
+    assert len(list(tmp_path.iterdir())) == 1
+    assert weaviate.BatchSpool(str(tmp_path)).num_pending == 0
+
+
+def test_dead_letters_are_stored_and_replayed(weaviate_mock, tmp_path):
+    """Test that objects that keep failing end up in the dead-letter store and can be replayed."""
+    failing = {"bad"}
+
+    def handler_objects(request: Request):
+        results = []
+        for obj in request.json["objects"]:
+            result = {}
+            if obj["properties"]["name"] in failing:
+                result = {"errors": {"error": [{"message": "vectorizer timeout"}]}}
+            results.append({**obj, "result": result})
+        return Response(json.dumps(results))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler_objects)
+
+    path = str(tmp_path / "dead_letters.jsonl")
+    dead_letters = weaviate.DeadLetterStore(path=path)
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=10,
+        dynamic=False,
+        weaviate_error_retries=weaviate.WeaviateErrorRetryConf(number_retries=1),
+        dead_letters=dead_letters,
+        callback=None,
+    )
+    with client.batch as batch:
+        for name in ["good", "bad", "good"]:
+            bad_uuid = batch.add_data_object({"name": name}, "Test")
+            if name == "bad":
+                uuid_ = bad_uuid
+
+    assert client.batch.dead_letters is dead_letters
+    letters = dead_letters.letters
+    assert len(letters) == 1
+    assert letters[0].item["id"] == uuid_
+    assert letters[0].errors == ["vectorizer timeout"]
+    assert letters[0].attempts == 2
+
+    # the letters survive a restart
+    dead_letters = weaviate.DeadLetterStore(path=path)
+    assert dead_letters.letters == letters
+    client.batch.configure(
+        batch_size=10,
+        dynamic=False,
+        weaviate_error_retries=weaviate.WeaviateErrorRetryConf(number_retries=1),
+        dead_letters=dead_letters,
+        callback=None,
+    )
+
+    assert client.batch.replay_dead_letters() == 1
+    assert dead_letters.letters[0].attempts == 4
+    assert dead_letters.letters[0].first_failed_at == letters[0].first_failed_at
+
+    failing.clear()
+    assert client.batch.replay_dead_letters(num_workers=2) == 1
+    assert len(dead_letters) == 0
+    assert len(weaviate.DeadLetterStore(path=path)) == 0
+
+
+def test_dead_letters_of_excluded_errors(weaviate_mock, tmp_path):
+    """Test that items with errors that are not retried are stored as dead letters right away."""
+
+    def handler_objects(request: Request):
+        results = []
+        for obj in request.json["objects"]:
+            message = obj["properties"]["name"]
+            results.append({**obj, "result": {"errors": {"error": [{"message": message}]}}})
+        return Response(json.dumps(results))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler_objects)
+
+    dead_letters = weaviate.DeadLetterStore(path=str(tmp_path / "dead_letters.jsonl"))
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=10,
+        dynamic=False,
+        weaviate_error_retries=weaviate.WeaviateErrorRetryConf(
+            number_retries=1, errors_to_exclude=["invalid"]
+        ),
+        dead_letters=dead_letters,
+        callback=None,
+    )
+    with client.batch as batch:
+        for name in ["invalid", "vectorizer timeout"]:
+            batch.add_data_object({"name": name}, "Test")
+
+    letters = {letter.errors[0]: letter.attempts for letter in dead_letters.letters}
+    assert letters == {"invalid": 1, "vectorizer timeout": 2}
+
+
+def test_batch_size_controller(weaviate_mock):
+    """Test that the batch size controller sets the recommended batch sizes after every request."""
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=10,
+        dynamic=True,
+        batch_size_controller=weaviate.AIMDController(increase=5),
+    )
+    with client.batch as batch:
+        for _ in range(10):
+            batch.add_data_object({"name": "test"}, "Test")
+        assert batch.recommended_num_objects == 15
+        batch.add_data_object({"name": "test"}, "Test")
+    assert client.batch.recommended_num_objects == 20
+
+
+def test_dynamic_batching_thread_failure(ready_mock):
+    """Test that producers waiting for an overloaded weaviate resume if the background thread dies."""
+    calls = []
+
+    def handler_nodes(request: Request):
+        calls.append(request)
+        if len(calls) > 1:
+            return Response("", status=500)
+        # weaviate is overloaded, sending is stopped
+        stats = {"queueLength": 1000, "ratePerSecond": 1}
+        return Response(json.dumps({"nodes": [{"name": "node1", "batchStats": stats}]}))
+
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.20"})
+    ready_mock.expect_request("/v1/nodes").respond_with_handler(handler_nodes)
+    ready_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=1, dynamic=True)
+    done = threading.Event()
+
+    def add_objects():
+        with client.batch as batch:
+            for _ in range(3):
+                batch.add_data_object({"name": "test"}, "Test")
+        done.set()
+
+    threading.Thread(target=add_objects, daemon=True).start()
+    assert done.wait(timeout=10)
+    assert len(calls) > 1
+
+
+def test_node_router(ready_mock):
+    """Test that objects and references are sent to the nodes owning their shards."""
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.20"})
+    ready_mock.expect_request("/v1/nodes").respond_with_json(
+        {
+            "nodes": [
+                {
+                    "name": "node1",
+                    "status": "HEALTHY",
+                    "shards": [
+                        {"name": "tenantA", "class": "Multi"},
+                        {"name": "single", "class": "Single"},
+                        {"name": "shard1", "class": "Sharded"},
+                    ],
+                },
+                {
+                    "name": "node2",
+                    "status": "HEALTHY",
+                    "shards": [
+                        {"name": "tenantB", "class": "Multi"},
+                        {"name": "shard2", "class": "Sharded"},
+                    ],
+                },
+            ]
+        }
+    )
+    sent = {}
+
+    def handler(request: Request):
+        items = request.json["objects"] if "objects" in request.path else request.json
+        sent.setdefault(request.path, []).extend(items)
+        return Response(json.dumps([{**item, "result": {}} for item in items]))
+
+    for prefix in ["", "/node1", "/node2"]:
+        for data_type in ["objects", "references"]:
+            ready_mock.expect_request(f"{prefix}/v1/batch/{data_type}").respond_with_handler(
+                handler
+            )
+
+    results = []
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    router = weaviate.NodeRouter(
+        {"node1": MOCK_SERVER_URL + "/node1", "node2": MOCK_SERVER_URL + "/node2/"}
+    )
+    client.batch.configure(batch_size=None, dynamic=False, node_router=router)
+    client.batch.add_data_object({}, "Multi", tenant="tenantA")
+    client.batch.add_data_object({}, "Multi", tenant="tenantB")
+    client.batch.add_data_object({}, "Single")
+    client.batch.add_data_object({}, "Sharded")
+    results.extend(client.batch.create_objects())
+    client.batch.add_reference(
+        str(uuid.uuid4()), "Multi", "ref", str(uuid.uuid4()), "Multi", tenant="tenantB"
+    )
+    client.batch.create_references()
+
+    assert [obj["class"] for obj in sent["/node1/v1/batch/objects"]] == ["Multi", "Single"]
+    assert [obj.get("tenant") for obj in sent["/node2/v1/batch/objects"]] == ["tenantB"]
+    assert [obj["class"] for obj in sent["/v1/batch/objects"]] == ["Sharded"]
+    assert len(sent["/node2/v1/batch/references"]) == 1
+    assert len(results) == 4
+
+
+def test_node_router_partial_failure(ready_mock):
+    """Test that the items of a failed node are returned as failed next to the created ones."""
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.20"})
+    ready_mock.expect_request("/v1/nodes").respond_with_json(
+        {
+            "nodes": [
+                {
+                    "name": "node1",
+                    "status": "HEALTHY",
+                    "shards": [{"name": "tenantA", "class": "Multi"}],
+                },
+                {
+                    "name": "node2",
+                    "status": "HEALTHY",
+                    "shards": [{"name": "tenantB", "class": "Multi"}],
+                },
+            ]
+        }
+    )
+    ready_mock.expect_request("/node1/v1/batch/objects").respond_with_handler(
+        lambda request: Response(
+            json.dumps([{**item, "result": {}} for item in request.json["objects"]])
+        )
+    )
+    ready_mock.expect_request("/node2/v1/batch/objects").respond_with_data("", status=500)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    router = weaviate.NodeRouter(
+        {"node1": MOCK_SERVER_URL + "/node1", "node2": MOCK_SERVER_URL + "/node2"}
+    )
+    client.batch.configure(batch_size=None, dynamic=False, node_router=router)
+    created = client.batch.add_data_object({}, "Multi", tenant="tenantA")
+    failed = client.batch.add_data_object({}, "Multi", tenant="tenantB")
+    results = client.batch.create_objects()
+
+    assert [result["id"] for result in results] == [created, failed]
+    assert results[0]["result"] == {}
+    assert results[1]["result"]["errors"]["error"][0]["message"].endswith("status code 500")
+
+
+def test_node_router_partial_timeout(ready_mock):
+    """Test that the items of a node that timed out are reconciled and sent again."""
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.20"})
+    ready_mock.expect_request("/v1/nodes").respond_with_json(
+        {
+            "nodes": [
+                {
+                    "name": "node1",
+                    "status": "HEALTHY",
+                    "shards": [{"name": "tenantA", "class": "Multi"}],
+                },
+                {
+                    "name": "node2",
+                    "status": "HEALTHY",
+                    "shards": [{"name": "tenantB", "class": "Multi"}],
+                },
+            ]
+        }
+    )
+    sent = []
+
+    def handler_objects(request: Request):
+        sent.append([item["tenant"] for item in request.json["objects"]])
+        return Response(json.dumps([{**item, "result": {}} for item in request.json["objects"]]))
+
+    ready_mock.expect_request("/node1/v1/batch/objects").respond_with_handler(handler_objects)
+    ready_mock.expect_request("/node2/v1/batch/objects").respond_with_handler(handler_objects)
+    # the object of node2 was not created
+    ready_mock.expect_request("/v1/graphql").respond_with_json({"data": {"Get": {"Multi": []}}})
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    post = client._connection.post
+    timed_out = []
+
+    def post_with_timeout(path, weaviate_object=None, params=None, base_url=None):
+        if base_url is not None and base_url.endswith("/node2") and len(timed_out) == 0:
+            timed_out.append(base_url)
+            raise ReadTimeout("node2 timed out")
+        return post(path=path, weaviate_object=weaviate_object, params=params, base_url=base_url)
+
+    client._connection.post = post_with_timeout
+    router = weaviate.NodeRouter(
+        {"node1": MOCK_SERVER_URL + "/node1", "node2": MOCK_SERVER_URL + "/node2"}
+    )
+    client.batch.configure(batch_size=None, dynamic=False, node_router=router, timeout_retries=1)
+    created = client.batch.add_data_object({}, "Multi", tenant="tenantA")
+    resent = client.batch.add_data_object({}, "Multi", tenant="tenantB")
+    results = client.batch.create_objects()
+
+    assert sorted(sent) == [["tenantA"], ["tenantB"]]
+    assert sorted(result["id"] for result in results) == sorted([created, resent])
+    assert all(result["result"] == {} for result in results)
+
+
+def test_references_do_not_wait_for_unrelated_objects():
+    """Test that a reference is sent while objects it does not depend on are still being sent."""
+    # the handler of the slow objects blocks, so the server must handle requests concurrently
+    server = HTTPServer(host=MOCK_IP, port=MOCK_PORT + 1, threaded=True)
+    server.start()
+    server.expect_request("/v1/.well-known/ready").respond_with_json({})
+    server.expect_request("/v1/meta").respond_with_json({"version": "1.16"})
+    server.expect_request("/v1/nodes").respond_with_json({"nodes": [{"gitHash": "ABC"}]})
+
+    release_slow_batch = threading.Event()
+    slow_batch_done = threading.Event()
+    references_sent_during_slow_batch = []
+
+    def handler_objects(request: Request):
+        if len(request.json["objects"]) > 0 and request.json["objects"][0]["properties"]["slow"]:
+            release_slow_batch.wait(timeout=5)
+            slow_batch_done.set()
+        return Response(json.dumps([]))
+
+    def handler_references(request: Request):
+        if not slow_batch_done.is_set():
+            references_sent_during_slow_batch.extend(request.json)
+        release_slow_batch.set()
+        return Response(json.dumps([]))
+
+    server.expect_request("/v1/batch/objects").respond_with_handler(handler_objects)
+    server.expect_request("/v1/batch/references").respond_with_handler(handler_references)
+
+    try:
+        client = weaviate.Client(url=f"http://{MOCK_IP}:{MOCK_PORT + 1}")
+        client.batch.configure(batch_size=2, dynamic=False, num_workers=3)
+        with client.batch as batch:
+            slow = [batch.add_data_object({"slow": True}, "Test") for _ in range(2)]
+            fast = [batch.add_data_object({"slow": False}, "Test") for _ in range(2)]
+            batch.add_reference(fast[0], "Test", "ref", fast[1], "Test")
+            batch.add_reference(slow[0], "Test", "ref", fast[1], "Test")
+    finally:
+        server.stop()
+
+    assert len(references_sent_during_slow_batch) == 1
+    assert fast[0] in references_sent_during_slow_batch[0]["from"]
+
+
+def test_max_batch_bytes(weaviate_mock):
+    """Test that batch requests are cut when they would exceed the byte budget."""
+    request_sizes = []
+
+    def handler(request: Request):
+        request_sizes.append((len(request.json["objects"]), len(request.data)))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=100, dynamic=False, max_batch_bytes=5000)
+    with client.batch as batch:
+        for _ in range(10):
+            batch.add_data_object({"text": "a" * 1000}, "Test")
+        batch.add_data_object({"text": "a" * 10000}, "Test")
+        batch.add_data_object({"text": "a"}, "Test")
+
+    assert [num_objects for num_objects, _ in request_sizes] == [4, 4, 2, 1, 1]
+    assert all(num_bytes <= 5000 for num_objects, num_bytes in request_sizes if num_objects > 1)
+
+
+def test_rate_limiter(weaviate_mock):
+    """Test that a rate limiter shared by two batches limits the objects sent by both."""
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    limiter = weaviate.RateLimiter(objects_per_second=200, burst=0.05)
+    clients = [weaviate.Client(url=MOCK_SERVER_URL) for _ in range(2)]
+    start = time.time()
+    for client in clients:
+        client.batch.configure(batch_size=10, dynamic=False, num_workers=2, rate_limiter=limiter)
+        with client.batch as batch:
+            for _ in range(30):
+                batch.add_data_object({"name": "test"}, "Test")
+    # 60 objects, 10 of them in the initial burst
+    assert time.time() - start > 0.2
+
+
+def test_batch_stats(weaviate_mock):
+    """Test the metrics of the batch requests and the stats listener."""
+    responses = iter([Response("Error", status=503), Response(json.dumps([]))])
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(
+        lambda request: next(responses, Response(json.dumps([])))
+    )
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_json([])
+
+    events = []
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=None, dynamic=False, stats_listener=events.append)
+    client.batch.add_data_object({"name": "test"}, "Test")
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.batch.create_objects()
+    client.batch.empty_objects()
+
+    client.batch.configure(batch_size=3, dynamic=False, stats_listener=events.append)
+    with client.batch as batch:
+        uuids = [batch.add_data_object({"name": "test"}, "Test") for _ in range(2)]
+        batch.add_reference(uuids[0], "Test", "ref", uuids[1], "Test")
+
+    assert [(event.data_type, event.outcome) for event in events] == [
+        ("objects", "status_code"),
+        ("objects", "success"),
+        ("references", "success"),
+    ]
+    assert events[0].status_code == 503
+    assert all(event.num_bytes > 0 and event.network_time > 0 for event in events)
+
+    stats = client.batch.stats()
+    assert stats.requests == {"objects": 2, "references": 1}
+    assert stats.items == {"objects": 2, "references": 1}
+    assert stats.outcomes == {"status_code": 1, "success": 2}
+    assert stats.bytes_sent == sum(event.num_bytes for event in events)
+    assert stats.latency.count == 3 and sum(stats.latency.counts) == 3
+    assert stats.payload_size.counts[0] == 3
+    assert stats.active_workers == 0 and stats.queued_requests == 0
+    assert stats.recommended_sizes[-1][1:] == (
+        client.batch.recommended_num_objects,
+        client.batch.recommended_num_references,
+    )
+
+
+def test_worker_autoscaler(weaviate_mock):
+    """Test that the autoscaler sends every object and is capped by the connection pool."""
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    autoscaler = weaviate.WorkerAutoscaler(min_workers=1, max_workers=8, interval=0.01)
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(session_pool_maxsize=3)
+        ),
+    )
+    client.batch.configure(batch_size=5, dynamic=False, worker_autoscaler=autoscaler)
+    with client.batch as batch:
+        for _ in range(200):
+            batch.add_data_object({"name": "test"}, "Test")
+
+    assert autoscaler.max_workers == 3
+    assert 1 <= autoscaler.num_workers <= 3
+    assert client.batch.stats().items["objects"] == 200
+
+
+def test_worker_autoscaler_backoff_releases_slot(weaviate_mock, monkeypatch):
+    """Test that a batch request waiting to be retried does not hold a slot of the autoscaler."""
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    autoscaler = weaviate.WorkerAutoscaler(min_workers=1, max_workers=1)
+    in_flight_during_backoff = []
+
+    def sleep(seconds):
+        in_flight_during_backoff.append(autoscaler._in_flight)
+
+    monkeypatch.setattr("weaviate.batch.crud_batch.time.sleep", sleep)
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    post = client._connection.post
+    calls = []
+
+    def post_failing_once(*args, **kwargs):
+        calls.append(kwargs["path"])
+        if len(calls) == 1:
+            raise RequestsConnectionError("connection reset")
+        return post(*args, **kwargs)
+
+    client._connection.post = post_failing_once
+    client.batch.configure(batch_size=5, dynamic=False, worker_autoscaler=autoscaler)
+    with client.batch as batch:
+        for _ in range(5):
+            batch.add_data_object({"name": "test"}, "Test")
+
+    assert calls == ["/batch/objects", "/batch/objects"]
+    assert in_flight_during_backoff == [0]
+
+
+def test_callback_delivery(weaviate_mock):
+    """Test that a slow callback does not block sending and that flush waits for it."""
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    results = []
+
+    def slow_callback(response):
+        time.sleep(0.05)
+        results.append(response)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=1,
+        dynamic=False,
+        callback=slow_callback,
+        callback_delivery="ordered",
+        callback_queue_size=20,
+    )
+    start = time.time()
+    for _ in range(10):
+        client.batch.add_data_object({"name": "test"}, "Test")
+    assert time.time() - start < 0.25
+    client.batch.flush()
+    assert len(results) == 10
+
+    stats = client.batch.stats()
+    assert stats.callback_time >= 0.5
+    assert stats.callback_queue_length == 0
+
+    def failing_callback(response):
+        raise ValueError("callback failed")
+
+    client.batch.configure(
+        batch_size=1, dynamic=False, callback=failing_callback, callback_delivery="unordered"
+    )
+    client.batch.add_data_object({"name": "test"}, "Test")
+    with pytest.raises(ValueError, match="callback failed"):
+        client.batch.flush()
+    client.batch.shutdown()
+
+    with pytest.raises(ValueError):
+        client.batch.configure(callback_delivery="sometimes")
@@ -1,12 +1,16 @@
+import gzip
 import json
 import time
 from typing import Dict
 
 import pytest
 from pytest_httpserver import HTTPServer
+from requests.exceptions import ConnectionError as RequestsConnectionError, ConnectTimeout
+from requests.exceptions import ReadTimeout
 from werkzeug import Request, Response
 
 import weaviate
+from weaviate.connect.endpoints import _EndpointPool
 from mock_tests.conftest import MOCK_SERVER_URL, MOCK_IP, MOCK_PORT
 
 
@@ -72,3 +76,299 @@ def test_wait_for_weaviate(httpserver: HTTPServer):
 def test_user_pw_in_url(weaviate_mock):
     """Test that user and pw can be in the url."""
     weaviate.Client(url="http://user:pw@" + MOCK_IP + ":" + str(MOCK_PORT))  # no exception
+
+
+@pytest.mark.parametrize("codec", [None, weaviate.JsonCodec(), weaviate.OrjsonCodec()])
+def test_json_codec(weaviate_mock, codec):
+    """Test that request and response bodies go through the configured codec."""
+    np = pytest.importorskip("numpy")
+
+    def handler(request: Request):
+        assert request.headers["content-type"] == "application/json"
+        return Response(json.dumps({"received": json.loads(request.data)}))
+
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_handler(handler)
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(json_codec=codec)
+        ),
+    )
+    payload = {"class": "Test", "vector": [0.5, 1.5]}
+    if isinstance(codec, weaviate.OrjsonCodec):
+        payload["vector"] = np.array([0.5, 1.5], dtype=np.float32)
+
+    response = client._connection.post(path="/objects", weaviate_object=payload)
+    assert response.json() == {"received": {"class": "Test", "vector": [0.5, 1.5]}}
+
+    response = client._connection.post(path="/objects", weaviate_object=b'{"class": "Test"}')
+    assert response.json() == {"received": {"class": "Test"}}
+
+
+def test_json_codec_decode_error(weaviate_mock):
+    weaviate_mock.expect_request("/v1/schema").respond_with_data("not json")
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(json_codec=weaviate.OrjsonCodec())
+        ),
+    )
+    with pytest.raises(weaviate.exceptions.ResponseCannotBeDecodedException):
+        client.schema.get()
+
+
+def test_json_codec_invalid_type():
+    with pytest.raises(TypeError):
+        weaviate.ConnectionConfig(json_codec="orjson")
+
+
+@pytest.mark.parametrize("compression,threshold", [("gzip", 0), ("gzip", 1024), (None, 0)])
+def test_request_compression(weaviate_mock, compression, threshold):
+    """Test that request bodies above the threshold are compressed."""
+    payload = {"class": "Test", "vector": [0.1] * 256}
+
+    def handler(request: Request):
+        body = request.get_data()
+        if compression is not None and len(json.dumps(payload)) >= threshold:
+            assert request.headers["content-encoding"] == "gzip"
+            assert "gzip" in request.headers["accept-encoding"]
+            body = gzip.decompress(body)
+        else:
+            assert "content-encoding" not in request.headers
+        assert json.loads(body) == payload
+        return Response(json.dumps({}))
+
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_handler(handler)
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(
+                compression=compression, compression_threshold=threshold
+            )
+        ),
+    )
+    client._connection.post(path="/objects", weaviate_object=payload)
+    client._connection.post(path="/objects", weaviate_object=json.dumps(payload).encode())
+
+
+def test_request_compression_invalid():
+    with pytest.raises(ValueError):
+        weaviate.ConnectionConfig(compression="brotli")
+    with pytest.raises(ValueError):
+        weaviate.ConnectionConfig(compression_threshold=-1)
+
+
+def test_lazy_connection(weaviate_no_auth_mock: HTTPServer):
+    """Test that a lazy client makes no request until it is used."""
+    weaviate_no_auth_mock.expect_request("/v1/schema").respond_with_json({})
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(lazy=True, check_client_version=False)
+        ),
+    )
+    assert len(weaviate_no_auth_mock.log) == 0
+
+    client.schema.delete_all()
+    paths = [request.path for request, _ in weaviate_no_auth_mock.log]
+    assert paths == ["/v1/.well-known/openid-configuration", "/v1/schema"]
+
+    assert client._connection.server_version == "1.16"
+    assert client._connection.server_version == "1.16"
+    paths = [request.path for request, _ in weaviate_no_auth_mock.log]
+    assert paths.count("/v1/meta") == 1
+
+
+def test_lazy_connection_unreachable():
+    """Test that a lazy client that cannot reach weaviate is not ready and does not wait."""
+    client = weaviate.Client(
+        url="http://localhost:1",
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(lazy=True, check_client_version=False)
+        ),
+    )
+    start = time.perf_counter()
+    for _ in range(2):
+        assert client.is_ready() is False
+        assert client.is_live() is False
+    assert time.perf_counter() - start < 1
+
+
+def test_lazy_connection_invalid():
+    with pytest.raises(TypeError):
+        weaviate.ConnectionConfig(lazy="yes")
+    with pytest.raises(TypeError):
+        weaviate.ConnectionConfig(check_client_version=None)
+
+
+def test_http2_transport(weaviate_no_auth_mock: HTTPServer):
+    """Test that the requests of the HTTP/2 transport behave like the ones of requests."""
+    pytest.importorskip("h2")
+    weaviate_no_auth_mock.expect_request(
+        "/v1/objects", method="POST", query_string="consistency_level=ALL"
+    ).respond_with_json({"id": "1"})
+    weaviate_no_auth_mock.expect_request("/v1/schema", method="DELETE").respond_with_data(
+        "", status=500
+    )
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(transport="http2")
+        ),
+    )
+    response = client._connection.post(
+        "/objects", {"class": "Test"}, params={"consistency_level": "ALL"}
+    )
+    assert response.json() == {"id": "1"}
+    assert response.request.body == b'{"class": "Test"}'
+
+    response = client._connection.delete("/schema", {})
+    assert response.status_code == 500
+
+    with pytest.raises(RequestsConnectionError):
+        client._connection._session.get("http://localhost:1", timeout=(1, 1))
+    client._connection.close()
+
+
+def test_http2_transport_invalid():
+    with pytest.raises(ValueError):
+        weaviate.ConnectionConfig(transport="http3")
+
+
+def test_load_balancing(weaviate_no_auth_mock: HTTPServer):
+    """Test that requests fail over to the nodes that can be reached."""
+    weaviate_no_auth_mock.expect_request("/v1/schema").respond_with_json({})
+
+    client = weaviate.Client(
+        url=["http://localhost:1", MOCK_SERVER_URL],
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(check_client_version=False)
+        ),
+    )
+    for _ in range(5):
+        assert client.schema.get() == {}
+    assert client._connection._endpoints.healthy_urls == [MOCK_SERVER_URL]
+    client._connection.close()
+
+    # a request that timed out is not outstanding anymore
+    weaviate_no_auth_mock.expect_request("/v1/slow").respond_with_handler(
+        lambda request: time.sleep(0.5) or Response(json.dumps({}))
+    )
+    client = weaviate.Client(
+        url=[MOCK_SERVER_URL, MOCK_SERVER_URL + "/"],
+        timeout_config=(2, 0.1),
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(check_client_version=False)
+        ),
+    )
+    with pytest.raises(ReadTimeout):
+        client._connection.get("/slow")
+    assert [endpoint.outstanding for endpoint in client._connection._endpoints._endpoints] == [0, 0]
+    client._connection.close()
+
+    with pytest.raises(TypeError):
+        weaviate.Client(url=[])
+    with pytest.raises(ValueError):
+        weaviate.ConnectionConfig(load_balancing="random")
+    with pytest.raises(ValueError):
+        weaviate.ConnectionConfig(health_check_interval=0)
+
+
+def test_retry_policy(weaviate_no_auth_mock: HTTPServer):
+    """Test that idempotent requests are retried and the others are not."""
+    responses = [Response(status=503), Response(json.dumps({}))]
+    weaviate_no_auth_mock.expect_request("/v1/schema").respond_with_handler(
+        lambda request: responses.pop(0)
+    )
+    weaviate_no_auth_mock.expect_request("/v1/objects", method="POST").respond_with_data(
+        "", status=503
+    )
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(
+                check_client_version=False,
+                retry_policy=weaviate.RetryPolicy(backoff_base=0.01),
+            )
+        ),
+    )
+    assert client.schema.get() == {}
+    assert client._connection.post("/objects", {}).status_code == 503
+    paths = [request.path for request, _ in weaviate_no_auth_mock.log]
+    assert paths.count("/v1/schema") == 2
+    assert paths.count("/v1/objects") == 1
+
+
+def test_retry_deadline(weaviate_no_auth_mock: HTTPServer):
+    """Test that a call does not retry beyond its deadline."""
+    weaviate_no_auth_mock.expect_request("/v1/schema").respond_with_data("", status=503)
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(
+                check_client_version=False,
+                retry_policies={
+                    "schema": weaviate.RetryPolicy(max_retries=100, backoff_base=0.1, deadline=0.5)
+                },
+            )
+        ),
+    )
+    start = time.perf_counter()
+    assert client._connection.get("/schema").status_code == 503
+    assert time.perf_counter() - start < 0.5
+
+
+def test_circuit_breaker(weaviate_no_auth_mock: HTTPServer):
+    """Test that requests fail fast while the circuit breaker is open."""
+    weaviate_no_auth_mock.expect_request("/v1/schema").respond_with_data("", status=503)
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(
+                check_client_version=False,
+                circuit_breaker=weaviate.CircuitBreakerConfig(failure_threshold=2),
+            )
+        ),
+    )
+    for _ in range(2):
+        assert client._connection.get("/schema").status_code == 503
+    with pytest.raises(weaviate.WeaviateCircuitOpenError):
+        client._connection.get("/schema")
+    assert client.is_ready() is False
+    paths = [request.path for request, _ in weaviate_no_auth_mock.log]
+    assert paths.count("/v1/schema") == 2
+
+
+def test_retry_deadline_failover(weaviate_no_auth_mock: HTTPServer):
+    """Test that failing over to other nodes stops at the deadline of the call."""
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(
+                check_client_version=False,
+                retry_policy=weaviate.RetryPolicy(max_retries=0, deadline=0.3),
+            )
+        ),
+    )
+    connection = client._connection
+    connection._endpoints = _EndpointPool(
+        [MOCK_SERVER_URL] * 5, "least_outstanding", 5, lambda url: True
+    )
+
+    def connect_timeout(url, **kwargs):
+        time.sleep(0.2)
+        raise ConnectTimeout()
+
+    connection._session.get = connect_timeout
+    with pytest.raises(ConnectTimeout):
+        connection.get("/schema")
+    # the second node used up the deadline, the others were not tried
+    assert sum(not endpoint.healthy for endpoint in connection._endpoints._endpoints) == 2
@@ -32,11 +32,11 @@ def test_no_retry_on_timeout(weaviate_no_auth_mock):
 def test_retry_on_timeout(weaviate_no_auth_mock):
     """Tests that clients resends objects that haven't been added due to a timeout.
 
-    After the timeout, the client checks if
-    - An object with the given UUID already exists (using HEAD). Here 50% return that they do NOT exist, eg have to be
-    resent.
-    - If an object exists, it is checked if the current version in weaviate is identical to the one that is
-    sent in the batch. If not, the object in the batch is an update and has to be resent again
+    After the timeout, the client fetches the objects with the given UUIDs (using one GraphQL query
+    for all objects) and compares them to the objects in the batch.
+    - Here 50% do NOT exist, eg have to be resent.
+    - If an object exists, but is not identical to the one that is sent in the batch, the object in
+    the batch is an update and has to be resent again
 
     In total 75% are resend.
     """
@@ -60,29 +60,18 @@ def test_retry_on_timeout(weaviate_no_auth_mock):
         handler_batch_objects
     )
 
-    # 50% of objects have not been added
-    def handler_exists(request: Request):
-        if added_uuids.index(request.url.split("/")[-1]) % 2 == 0:
-            return Response(json.dumps({}), status=404)
-        else:
-            return Response(json.dumps({}), status=200)
-
-    weaviate_no_auth_mock.expect_request(
-        re.compile("^/v1/objects/Test/"), method="HEAD"
-    ).respond_with_handler(handler_exists)
-
-    # 50% of objects are an update to an existing objects and have to be resent
-    flip = False
+    # 50% of objects have not been added, 50% of the existing objects are outdated
+    def handler_graphql(request: Request):
+        query = request.json["query"]
+        assert "name _additional{id}" in query
+        existing = [
+            {"name": "test" if i % 4 == 1 else "other", "_additional": {"id": uuid_}}
+            for i, uuid_ in enumerate(added_uuids)
+            if i % 2 == 1 and uuid_ in query
+        ]
+        return Response(json.dumps({"data": {"Get": {"Test": existing}}}))
 
-    def handler_get_object(request: Request):
-        nonlocal flip
-        val = "test" if flip else "other"
-        flip = not flip
-        return Response(json.dumps({"properties": {"name": val}}))
-
-    weaviate_no_auth_mock.expect_request(
-        re.compile("^/v1/objects/Test/"), method="GET"
-    ).respond_with_handler(handler_get_object)
+    weaviate_no_auth_mock.expect_request("/v1/graphql").respond_with_handler(handler_graphql)
 
     client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(1, 1))
     with client.batch(batch_size=n, timeout_retries=1, dynamic=False) as batch:
@@ -108,15 +97,42 @@ def test_retry_on_timeout_all_succesfull(weaviate_no_auth_mock):
     )
 
     # return that all objects are already added successful
-    weaviate_no_auth_mock.expect_request(
-        re.compile("^/v1/objects/Test/"), method="HEAD"
-    ).respond_with_response(Response(json.dumps({}), status=200))
-    weaviate_no_auth_mock.expect_request(
-        re.compile("^/v1/objects/Test/"), method="GET"
-    ).respond_with_json({"properties": {"name": "test"}})
+    def handler_graphql(request: Request):
+        ids = json.loads(re.search(r"valueText: (\[.*?\])", request.json["query"]).group(1))
+        objects = [{"name": "test", "_additional": {"id": id_}} for id_ in ids]
+        return Response(json.dumps({"data": {"Get": {"Test": objects}}}))
+
+    weaviate_no_auth_mock.expect_request("/v1/graphql").respond_with_handler(handler_graphql)
 
     client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(1, 1))
     with client.batch(batch_size=n, timeout_retries=1, dynamic=False) as batch:
         for _ in range(n):
             batch.add_data_object({"name": "test"}, "test", uuid.uuid4())
     weaviate_no_auth_mock.check_assertions()
+
+
+def test_retry_on_timeout_without_bulk_query(weaviate_no_auth_mock):
+    """Test that every object is resent if weaviate cannot fetch the objects in bulk."""
+    n = 10
+    resent = []
+
+    def handler_batch_objects(request: Request):
+        if len(resent) == 0:
+            resent.append(0)
+            time.sleep(1.5)  # cause timeout
+        else:
+            resent.append(len(request.json["objects"]))
+        return Response(json.dumps([]))
+
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_handler(
+        handler_batch_objects
+    )
+    weaviate_no_auth_mock.expect_request("/v1/graphql").respond_with_json(
+        {"errors": [{"message": "Unknown operator ContainsAny"}]}
+    )
+
+    client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(1, 1))
+    with client.batch(batch_size=n, timeout_retries=1, dynamic=False) as batch:
+        for _ in range(n):
+            batch.add_data_object({"name": "test"}, "test", uuid.uuid4())
+    assert resent == [0, n]
@@ -0,0 +1,118 @@
+"""
+Test the 'weaviate.batch.autoscaler' functions/classes.
+"""
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from weaviate.batch.autoscaler import WorkerAutoscaler
+
+
+class TestWorkerAutoscaler(unittest.TestCase):
+    """
+    Test the `WorkerAutoscaler` class.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        patcher = patch("weaviate.batch.autoscaler.time")
+        patcher.start().monotonic.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+
+    def run_interval(self, autoscaler, num_items, timed_out=False):
+        """
+        Send `num_items` items in one interval of 1 second.
+        """
+
+        self.now += 1
+        autoscaler._observe(num_items, 0.1, timed_out)
+
+    def test_hill_climbing(self):
+        """
+        Test that workers are added while the throughput grows and removed when it drops.
+        """
+
+        autoscaler = WorkerAutoscaler(min_workers=1, max_workers=4, interval=1)
+        autoscaler._bind(limit=20)
+        self.assertEqual(autoscaler.num_workers, 1)
+        for num_items, num_workers in [(100, 2), (200, 3), (300, 4), (300, 3), (250, 4)]:
+            self.run_interval(autoscaler, num_items)
+            self.assertEqual(autoscaler.num_workers, num_workers)
+
+        # the throughput dropped, turn around
+        self.run_interval(autoscaler, 100)
+        self.assertEqual(autoscaler.num_workers, 3)
+        # timeouts always remove a worker
+        self.run_interval(autoscaler, 1000, timed_out=True)
+        self.assertEqual(autoscaler.num_workers, 2)
+
+    def test_bounds(self):
+        """
+        Test that the number of workers stays between the bounds and the connection pool size.
+        """
+
+        autoscaler = WorkerAutoscaler(min_workers=2, max_workers=10, interval=1)
+        autoscaler._bind(limit=3)
+        self.assertEqual(autoscaler.max_workers, 3)
+        for num_items in [100, 200, 300, 400]:
+            self.run_interval(autoscaler, num_items)
+            self.assertLessEqual(autoscaler.num_workers, 3)
+
+        for _ in range(3):
+            self.run_interval(autoscaler, 0, timed_out=True)
+        self.assertEqual(autoscaler.num_workers, 2)
+        # a constant throughput at the lower bound probes one more worker
+        self.run_interval(autoscaler, 0)
+        self.assertEqual(autoscaler.num_workers, 3)
+
+    def test_interval(self):
+        """
+        Test that the number of workers only changes at the end of an interval.
+        """
+
+        autoscaler = WorkerAutoscaler(min_workers=1, max_workers=4, interval=5)
+        autoscaler._bind(limit=20)
+        for _ in range(4):
+            self.run_interval(autoscaler, 100)
+        self.assertEqual(autoscaler.num_workers, 1)
+        self.run_interval(autoscaler, 100)
+        self.assertEqual(autoscaler.num_workers, 2)
+
+    def test_acquire_blocks(self):
+        """
+        Test that at most `num_workers` slots are taken at once.
+        """
+
+        autoscaler = WorkerAutoscaler(min_workers=1, max_workers=2)
+        autoscaler._bind(limit=20)
+        autoscaler._acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            autoscaler._acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        self.assertFalse(acquired.is_set())
+        autoscaler._release()
+        self.assertTrue(acquired.wait(timeout=1))
+        thread.join(timeout=1)
+
+    def test_init_errors(self):
+        """
+        Test the arguments of the WorkerAutoscaler.
+        """
+
+        with self.assertRaises(ValueError):
+            WorkerAutoscaler(min_workers=0)
+        with self.assertRaises(TypeError):
+            WorkerAutoscaler(max_workers=2.5)
+        with self.assertRaises(ValueError):
+            WorkerAutoscaler(min_workers=4, max_workers=2)
+        with self.assertRaises(ValueError):
+            WorkerAutoscaler(interval=0)
+        with self.assertRaises(ValueError):
+            WorkerAutoscaler(max_latency=-1)
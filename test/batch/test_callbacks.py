@@ -0,0 +1,73 @@
+"""
+Test the 'weaviate.batch.callbacks' functions/classes.
+"""
+import threading
+import time
+import unittest
+
+from weaviate.batch.callbacks import _CallbackDispatcher
+
+
+class TestCallbackDispatcher(unittest.TestCase):
+    """
+    Test the `_CallbackDispatcher` class.
+    """
+
+    def test_ordered(self):
+        """
+        Test that the results are delivered by one thread in the order they were submitted.
+        """
+
+        results, threads, times = [], set(), []
+
+        def callback(response):
+            results.append(response[0]["id"])
+            threads.add(threading.current_thread().name)
+
+        dispatcher = _CallbackDispatcher(callback, "ordered", 5, 4, on_callback=times.append)
+        for i in range(20):
+            dispatcher.submit([{"id": i}])
+        dispatcher.join()
+        self.assertEqual(results, list(range(20)))
+        self.assertEqual(threads, {"batchCallback"})
+        self.assertEqual(len(times), 20)
+        dispatcher.shutdown()
+
+    def test_unordered(self):
+        """
+        Test that slow callbacks run concurrently and the senders only wait when the queue is
+        full.
+        """
+
+        results = []
+        dispatcher = _CallbackDispatcher(
+            lambda response: (time.sleep(0.1), results.append(response)),
+            "unordered",
+            8,
+            4,
+            on_callback=lambda _: None,
+        )
+        start = time.monotonic()
+        waited = sum(dispatcher.submit([{"id": i}]) for i in range(8))
+        self.assertLess(waited, 0.05)
+        dispatcher.join()
+        # 4 threads deliver 8 results that take 0.1s each
+        self.assertLess(time.monotonic() - start, 0.35)
+        self.assertEqual(len(results), 8)
+        dispatcher.shutdown()
+
+    def test_error(self):
+        """
+        Test that the first exception of the callback is re-raised once.
+        """
+
+        def callback(response):
+            raise ValueError(response[0]["id"])
+
+        dispatcher = _CallbackDispatcher(callback, "ordered", 5, 1, on_callback=lambda _: None)
+        dispatcher.submit([{"id": 1}])
+        dispatcher.submit([{"id": 2}])
+        with self.assertRaisesRegex(ValueError, "1"):
+            dispatcher.join()
+        dispatcher.join()
+        dispatcher.shutdown()
@@ -0,0 +1,94 @@
+"""
+Test the 'weaviate.batch.controller' functions/classes.
+"""
+import unittest
+
+from weaviate.batch.controller import AIMDController, BatchObservation, LatencyTargetController
+
+
+def _observation(
+    latency: float = 1.0,
+    num_items: int = 100,
+    timed_out: bool = False,
+    queue_length: int = None,
+) -> BatchObservation:
+    return BatchObservation(
+        data_type="objects",
+        num_items=num_items,
+        latency=latency,
+        num_bytes=None,
+        timed_out=timed_out,
+        queue_length=queue_length,
+    )
+
+
+class TestAIMDController(unittest.TestCase):
+    """
+    Test the `AIMDController` class.
+    """
+
+    def test_next_batch_size(self):
+        """
+        Test the additive increase and the multiplicative decrease.
+        """
+
+        controller = AIMDController(
+            increase=10, decrease_factor=0.5, max_latency=5, max_queue_length=1000
+        )
+        self.assertEqual(controller.next_batch_size(100, _observation()), 110)
+        self.assertEqual(controller.next_batch_size(100, _observation(timed_out=True)), 50)
+        self.assertEqual(controller.next_batch_size(100, _observation(latency=6)), 50)
+        self.assertEqual(controller.next_batch_size(100, _observation(queue_length=1001)), 50)
+        self.assertEqual(controller.next_batch_size(1, _observation(timed_out=True)), 1)
+        self.assertEqual(
+            AIMDController(max_batch_size=120).next_batch_size(100, _observation()), 120
+        )
+
+    def test_init_errors(self):
+        """
+        Test the arguments of the AIMDController.
+        """
+
+        with self.assertRaises(ValueError):
+            AIMDController(decrease_factor=1)
+        with self.assertRaises(TypeError):
+            AIMDController(increase=1.5)
+        with self.assertRaises(ValueError):
+            AIMDController(max_latency=0)
+
+
+class TestLatencyTargetController(unittest.TestCase):
+    """
+    Test the `LatencyTargetController` class.
+    """
+
+    def test_next_batch_size(self):
+        """
+        Test that the batch size follows the 95th percentile of the time per item.
+        """
+
+        controller = LatencyTargetController(target_latency=2, window=20, max_growth=2)
+        # 10ms per item -> 200 items in 2s, but it grows at most by max_growth
+        self.assertEqual(
+            controller.next_batch_size(50, _observation(latency=1, num_items=100)), 100
+        )
+        self.assertEqual(
+            controller.next_batch_size(150, _observation(latency=1, num_items=100)), 200
+        )
+        # a slow request dominates the 95th percentile
+        self.assertEqual(
+            controller.next_batch_size(200, _observation(latency=4, num_items=100)), 50
+        )
+        self.assertEqual(controller.next_batch_size(200, _observation(timed_out=True)), 100)
+
+    def test_init_errors(self):
+        """
+        Test the arguments of the LatencyTargetController.
+        """
+
+        with self.assertRaises(ValueError):
+            LatencyTargetController(max_growth=1)
+        with self.assertRaises(ValueError):
+            LatencyTargetController(target_latency=0)
+        with self.assertRaises(TypeError):
+            LatencyTargetController(window=2.5)
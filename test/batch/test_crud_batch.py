@@ -0,0 +1,132 @@
+"""
+Test the 'weaviate.batch.crud_batch' functions/classes.
+"""
+import io
+import json
+import unittest
+from contextlib import redirect_stderr
+
+from weaviate.batch.crud_batch import (
+    _BatchResponseList,
+    _ClusterBatchStats,
+    _batch_retry_delay,
+    _get_cluster_batch_stats,
+    _get_property_fields,
+    _is_object_up_to_date,
+)
+
+
+class TestClusterBatchStats(unittest.TestCase):
+    """
+    Test the `_get_cluster_batch_stats` function.
+    """
+
+    def test_aggregation(self):
+        """
+        Test that the rates are summed up and the most congested node determines the ratio.
+        """
+
+        nodes = [
+            {"name": "node1", "batchStats": {"queueLength": 0, "ratePerSecond": 500}},
+            {"name": "node2", "batchStats": {"queueLength": 300, "ratePerSecond": 100}},
+            {"name": "node3", "batchStats": {"queueLength": 400, "ratePerSecond": 400}},
+        ]
+        self.assertEqual(_get_cluster_batch_stats(nodes), _ClusterBatchStats(400, 1000, 3))
+
+    def test_missing_stats(self):
+        """
+        Test nodes without batch stats or without a rate yet.
+        """
+
+        self.assertIsNone(_get_cluster_batch_stats([{"name": "node1", "stats": {}}]))
+        self.assertIsNone(_get_cluster_batch_stats([]))
+
+        nodes = [
+            {"name": "node1", "stats": {}},
+            {"name": "node2", "batchStats": {"queueLength": 20, "ratePerSecond": 0}},
+        ]
+        self.assertEqual(_get_cluster_batch_stats(nodes), _ClusterBatchStats(20, 0, 20))
+
+
+class TestBatchRetryDelay(unittest.TestCase):
+    """
+    Test the `_batch_retry_delay` function.
+    """
+
+    def test_backoff(self):
+        """
+        Test that the delay is jittered, grows exponentially and is capped.
+        """
+
+        error = ConnectionError()
+        for retry, low, high in [(0, 1, 2), (1, 2, 4), (3, 8, 16), (10, 30, 60)]:
+            with redirect_stderr(io.StringIO()):
+                delay = _batch_retry_delay(retry, 20, error)
+            self.assertGreaterEqual(delay, low)
+            self.assertLessEqual(delay, high)
+
+        with self.assertRaises(ConnectionError):
+            _batch_retry_delay(3, 3, error)
+
+
+class TestObjectComparison(unittest.TestCase):
+    """
+    Test the comparison of timed-out batch items to the objects fetched with GraphQL.
+    """
+
+    def test_property_fields(self):
+        """
+        Test which properties can be fetched and compared.
+        """
+
+        properties = {"name": "a", "tags": ["b"], "location": {"latitude": 1, "longitude": 2}}
+        self.assertEqual(
+            _get_property_fields(properties),
+            {"name": set(), "tags": set(), "location": {"latitude", "longitude"}},
+        )
+        self.assertIsNone(_get_property_fields({"ref": [{"beacon": "weaviate://localhost/1"}]}))
+        self.assertIsNone(_get_property_fields({"nested": {"inner": {"value": 1}}}))
+
+    def test_up_to_date(self):
+        """
+        Test the comparison of the properties and the vector.
+        """
+
+        obj = {
+            "id": "1",
+            "properties": {"name": "a", "count": 1, "phone": {"input": "020 1234567"}},
+            "vector": [1.0, 2.0],
+        }
+        obj_weav = {
+            "name": "a",
+            "count": 1.0,
+            "phone": {"input": "020 1234567", "valid": True},
+            "other": None,
+            "_additional": {"id": "1", "vector": [1.0, 2.0]},
+        }
+        self.assertTrue(_is_object_up_to_date(obj, obj_weav))
+        self.assertFalse(_is_object_up_to_date(obj, {**obj_weav, "name": "b"}))
+        self.assertFalse(_is_object_up_to_date(obj, {**obj_weav, "other": "c"}))
+        self.assertFalse(_is_object_up_to_date(obj, {**obj_weav, "phone": {"input": "1"}}))
+        self.assertFalse(
+            _is_object_up_to_date(obj, {**obj_weav, "_additional": {"id": "1", "vector": [1.0]}})
+        )
+
+
+class TestBatchResponseList(unittest.TestCase):
+    """
+    Test the `_BatchResponseList` class.
+    """
+
+    def test_items(self):
+        """
+        Test that the items are returned without decoding and encoded only if the body is read.
+        """
+
+        items = [{"id": "1", "result": {}}]
+        response = _BatchResponseList(items)
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.json(), items)
+        self.assertIs(response._content, False)
+        self.assertEqual(json.loads(response.content), items)
+        self.assertEqual(json.loads(response.text), items)
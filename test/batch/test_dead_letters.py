@@ -0,0 +1,99 @@
+"""
+Test the 'weaviate.batch.dead_letters' functions/classes.
+"""
+import os
+import tempfile
+import unittest
+
+from weaviate.batch.dead_letters import DeadLetterStore
+
+
+def failed_response(uuids):
+    """
+    A batch response in which all objects failed.
+    """
+
+    return [
+        {
+            "class": "Test",
+            "id": f"00000000-0000-0000-0000-{int(uuid):012d}",
+            "properties": {},
+            "result": {"errors": {"error": [{"message": "failed"}]}},
+        }
+        for uuid in uuids
+    ]
+
+
+class TestDeadLetterStore(unittest.TestCase):
+    """
+    Test the `DeadLetterStore` class.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "dead_letters.jsonl")
+
+    def num_lines(self):
+        with open(self.path, "rb") as file:
+            return len(file.readlines())
+
+    def ids(self, store):
+        return [str(int(letter.item["id"].split("-")[-1])) for letter in store.letters]
+
+    def test_file_is_bounded(self):
+        """
+        Test that the file is compacted to the letters in memory.
+        """
+
+        store = DeadLetterStore(max_size=3, path=self.path)
+        for i in range(10):
+            store._add_from_response("objects", failed_response([f"{i}"]), attempts=1)
+            self.assertLessEqual(self.num_lines(), 6)
+        self.assertEqual(self.ids(store), ["7", "8", "9"])
+        self.assertEqual(self.ids(DeadLetterStore(max_size=3, path=self.path)), ["7", "8", "9"])
+
+    def test_same_item_replaces_letter(self):
+        store = DeadLetterStore(path=self.path)
+        store._add_from_response("objects", failed_response(["1", "2"]), attempts=1)
+        store._add_from_response("objects", failed_response(["1"]), attempts=2)
+        self.assertEqual(self.ids(store), ["2", "1"])
+        self.assertEqual(store.letters[1].attempts, 2)
+
+        # the file is compacted when it is read
+        self.assertEqual(self.num_lines(), 3)
+        self.assertEqual(self.ids(DeadLetterStore(path=self.path)), ["2", "1"])
+        self.assertEqual(self.num_lines(), 2)
+
+    def test_interrupted_replay(self):
+        """
+        Test that letters that failed again during an interrupted replay are not duplicated.
+        """
+
+        store = DeadLetterStore(max_size=2, path=self.path)
+        store._add_from_response("objects", failed_response(["1", "2"]), attempts=1)
+        store._take()
+        store._add_from_response("objects", failed_response(["1"]), attempts=1)
+        # the file is not compacted during the replay, it still holds the letters being replayed
+        store._add_from_response("objects", failed_response(["3", "4"]), attempts=1)
+        self.assertEqual(self.num_lines(), 5)
+
+        # the process dies before the replay finished
+        store = DeadLetterStore(max_size=3, path=self.path)
+        self.assertEqual(self.ids(store), ["1", "3", "4"])
+        self.assertEqual(store.letters[0].attempts, 2)
+        self.assertEqual(self.num_lines(), 3)
+
+    def test_reference_keeps_tenant(self):
+        store = DeadLetterStore(path=self.path)
+        response = [
+            {
+                "from": "weaviate://localhost/Test/00000000-0000-0000-0000-000000000001/ref",
+                "to": "weaviate://localhost/Test/00000000-0000-0000-0000-000000000002",
+                "tenant": "tenantA",
+                "result": {"errors": {"error": [{"message": "failed"}]}},
+            }
+        ]
+        store._add_from_response("references", response, attempts=1)
+        self.assertEqual(store.letters[0].item["tenant"], "tenantA")
+        self.assertEqual(DeadLetterStore(path=self.path).letters[0].item["tenant"], "tenantA")
@@ -0,0 +1,57 @@
+"""
+Test the 'weaviate.batch.dependencies' functions/classes.
+"""
+import unittest
+
+from weaviate.batch.dependencies import _ReferenceDependencies
+
+UUID_1 = "11111111-1111-1111-1111-111111111111"
+UUID_2 = "22222222-2222-2222-2222-222222222222"
+UUID_3 = "33333333-3333-3333-3333-333333333333"
+
+
+def _reference(from_uuid: str, to_uuid: str) -> dict:
+    return {
+        "from": f"weaviate://localhost/Test/{from_uuid}/ref",
+        "to": f"weaviate://localhost/Test/{to_uuid}",
+    }
+
+
+class TestReferenceDependencies(unittest.TestCase):
+    """
+    Test the `_ReferenceDependencies` class.
+    """
+
+    def test_references_wait_for_their_objects(self):
+        """
+        Test that references are held back until both endpoints are finished.
+        """
+
+        dependencies = _ReferenceDependencies()
+        dependencies.start_objects([UUID_1])
+        dependencies.start_objects([UUID_2])
+        dependencies.start_objects([UUID_2])
+
+        ready = _reference(UUID_3, UUID_3)
+        to_second = _reference(UUID_3, UUID_2)
+        from_first = _reference(UUID_1, UUID_3)
+        self.assertEqual(dependencies.add_references([ready, to_second, from_first]), [ready])
+        self.assertEqual(dependencies.num_blocked, 2)
+
+        self.assertEqual(dependencies.finish_objects([UUID_1]), [from_first])
+        # the UUID is still part of another request in flight
+        self.assertEqual(dependencies.finish_objects([UUID_2]), [])
+        self.assertEqual(dependencies.finish_objects([UUID_2]), [to_second])
+        self.assertEqual(dependencies.num_blocked, 0)
+
+    def test_declared_existing(self):
+        """
+        Test that references to declared objects are never held back.
+        """
+
+        dependencies = _ReferenceDependencies()
+        dependencies.start_objects([UUID_1])
+        dependencies.declare_existing([UUID_1])
+        reference = _reference(UUID_1, UUID_2)
+        self.assertEqual(dependencies.add_references([reference]), [reference])
+        dependencies.wait_until_ready([reference])
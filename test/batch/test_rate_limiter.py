@@ -0,0 +1,61 @@
+"""
+Test the 'weaviate.batch.rate_limiter' functions/classes.
+"""
+import threading
+import time
+import unittest
+
+from weaviate.batch.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Test the `RateLimiter` class.
+    """
+
+    def test_acquire_waits_for_tokens(self):
+        """
+        Test that a burst is sent at once and the rest at the configured rate.
+        """
+
+        limiter = RateLimiter(objects_per_second=100, bytes_per_second=10_000, burst=0.1)
+        self.assertLess(limiter.acquire(10, 1000), 0.01)
+        # objects are the limit
+        self.assertGreater(limiter.acquire(5), 0.03)
+        # bytes are the limit, more bytes than fit into the bucket are taken once it is full
+        start = time.monotonic()
+        limiter.acquire(1, 2000)
+        limiter.acquire(1, 1)
+        self.assertGreater(time.monotonic() - start, 0.12)
+        # no limit
+        self.assertLess(RateLimiter().acquire(1_000_000, 1_000_000), 0.01)
+
+    def test_change_limits_at_runtime(self):
+        """
+        Test that waiting threads pick up changed limits.
+        """
+
+        limiter = RateLimiter(objects_per_second=1)
+        limiter.acquire(1)
+        waited = []
+        thread = threading.Thread(target=lambda: waited.append(limiter.acquire(1)))
+        thread.start()
+        time.sleep(0.05)
+        limiter.objects_per_second = None
+        thread.join(timeout=1)
+        self.assertLess(waited[0], 0.5)
+        self.assertIsNone(limiter.objects_per_second)
+
+    def test_init_errors(self):
+        """
+        Test the arguments of the RateLimiter.
+        """
+
+        with self.assertRaises(ValueError):
+            RateLimiter(objects_per_second=0)
+        with self.assertRaises(TypeError):
+            RateLimiter(bytes_per_second="1")
+        with self.assertRaises(ValueError):
+            RateLimiter(burst=-1)
+        with self.assertRaises(ValueError):
+            RateLimiter().objects_per_second = -5
@@ -1,11 +1,23 @@
 """
 Test the 'weaviate.batch.requests' functions/classes.
 """
+import json
 import unittest
 from unittest.mock import patch
 
 from test.util import check_error_message
-from weaviate.batch.requests import ReferenceBatchRequest, ObjectsBatchRequest
+from weaviate.batch.requests import (
+    ReferenceBatchRequest,
+    ObjectsBatchRequest,
+    _get_property_schemas,
+)
+
+try:
+    from weaviate.proto.v1 import batch_pb2
+
+    has_grpc = True
+except ImportError:
+    has_grpc = False
 
 
 class TestBatchReferences(unittest.TestCase):
@@ -303,3 +315,316 @@ class TestBatchObjects(unittest.TestCase):
         batch.empty()
         self.assertEqual(len(batch), 0)
         self.assertTrue(batch.is_empty())
+
+
+@unittest.skipIf(not has_grpc, "gRPC is not available")
+class TestBatchObjectsGrpc(unittest.TestCase):
+    """
+    Test the gRPC conversion of the `ObjectsBatchRequest` class.
+    """
+
+    def test_get_grpc_request_body(self):
+        batch = ObjectsBatchRequest()
+        batch.add(
+            {
+                "name": "Marie Curie",
+                "awards": 2,
+                "years": [1903, 1911],
+                "scores": [1.5, 2],
+                "fields": ["physics", "chemistry"],
+                "address": {"city": "Paris"},
+                "children": [{"name": "Irene"}],
+                "hasSpouse": [
+                    {"beacon": "weaviate://localhost/Person/d087b7c6-a115-5c89-8cb2-f25bdeb9bf92"}
+                ],
+            },
+            "Chemist",
+            uuid="d087b7c6-a115-5c89-8cb2-f25bdeb9bf93",
+            vector=[1.0, 2.0],
+            tenant="tenantA",
+        )
+
+        request = batch.get_grpc_request_body("QUORUM")
+        self.assertEqual(len(request.objects), 1)
+        obj = request.objects[0]
+        self.assertEqual(obj.uuid, "d087b7c6-a115-5c89-8cb2-f25bdeb9bf93")
+        self.assertEqual(obj.collection, "Chemist")
+        self.assertEqual(obj.tenant, "tenantA")
+        self.assertEqual(list(obj.vector), [1.0, 2.0])
+
+        props = obj.properties
+        self.assertEqual(dict(props.non_ref_properties), {"name": "Marie Curie", "awards": 2})
+        self.assertEqual(props.int_array_properties[0].prop_name, "years")
+        self.assertEqual(list(props.int_array_properties[0].values), [1903, 1911])
+        self.assertEqual(list(props.number_array_properties[0].values), [1.5, 2.0])
+        self.assertEqual(list(props.text_array_properties[0].values), ["physics", "chemistry"])
+        self.assertEqual(props.object_properties[0].prop_name, "address")
+        self.assertEqual(
+            dict(props.object_properties[0].value.non_ref_properties), {"city": "Paris"}
+        )
+        self.assertEqual(props.object_array_properties[0].prop_name, "children")
+        self.assertEqual(
+            list(props.single_target_ref_props[0].uuids),
+            ["d087b7c6-a115-5c89-8cb2-f25bdeb9bf92"],
+        )
+
+    def test_get_grpc_request_body_with_schema(self):
+        schemas = _get_property_schemas(
+            [
+                {"name": "scores", "dataType": ["number[]"]},
+                {"name": "dates", "dataType": ["date[]"]},
+                {"name": "hasSpouse", "dataType": ["Person"]},
+                {"name": "knows", "dataType": ["Person", "Chemist"]},
+                {
+                    "name": "children",
+                    "dataType": ["object[]"],
+                    "nestedProperties": [{"name": "ages", "dataType": ["number[]"]}],
+                },
+            ]
+        )
+        batch = ObjectsBatchRequest()
+        batch.add(
+            {
+                "scores": [1, 2],
+                "dates": ["2023-01-01T00:00:00Z"],
+                "other": [1, 2],
+                "hasSpouse": [
+                    {"beacon": "weaviate://localhost/d087b7c6-a115-5c89-8cb2-f25bdeb9bf92"}
+                ],
+                "knows": [
+                    {"beacon": "weaviate://localhost/Person/d087b7c6-a115-5c89-8cb2-f25bdeb9bf92"},
+                    {"beacon": "weaviate://localhost/Chemist/d087b7c6-a115-5c89-8cb2-f25bdeb9bf94"},
+                    {"beacon": "weaviate://localhost/Person/d087b7c6-a115-5c89-8cb2-f25bdeb9bf95"},
+                ],
+                "children": [{"ages": [3]}],
+            },
+            "Chemist",
+            uuid="d087b7c6-a115-5c89-8cb2-f25bdeb9bf93",
+        )
+
+        props = (
+            batch.get_grpc_request_body(property_schemas={"Chemist": schemas}).objects[0].properties
+        )
+        self.assertEqual(
+            [(prop.prop_name, list(prop.values)) for prop in props.number_array_properties],
+            [("scores", [1.0, 2.0])],
+        )
+        # properties that are not in the schema get the type of their values
+        self.assertEqual(
+            [(prop.prop_name, list(prop.values)) for prop in props.int_array_properties],
+            [("other", [1, 2])],
+        )
+        self.assertEqual(props.text_array_properties[0].prop_name, "dates")
+        self.assertEqual(
+            list(props.single_target_ref_props[0].uuids), ["d087b7c6-a115-5c89-8cb2-f25bdeb9bf92"]
+        )
+        self.assertEqual(
+            [
+                (ref.prop_name, ref.target_collection, list(ref.uuids))
+                for ref in props.multi_target_ref_props
+            ],
+            [
+                (
+                    "knows",
+                    "Person",
+                    [
+                        "d087b7c6-a115-5c89-8cb2-f25bdeb9bf92",
+                        "d087b7c6-a115-5c89-8cb2-f25bdeb9bf95",
+                    ],
+                ),
+                ("knows", "Chemist", ["d087b7c6-a115-5c89-8cb2-f25bdeb9bf94"]),
+            ],
+        )
+        child = props.object_array_properties[0].values[0]
+        self.assertEqual(child.number_array_properties[0].prop_name, "ages")
+
+        # multi-target references need the class of the referenced object
+        batch = ObjectsBatchRequest()
+        batch.add(
+            {"knows": [{"beacon": "weaviate://localhost/d087b7c6-a115-5c89-8cb2-f25bdeb9bf92"}]},
+            "Chemist",
+        )
+        with self.assertRaises(ValueError):
+            batch.get_grpc_request_body(property_schemas={"Chemist": schemas})
+
+    def test_get_grpc_request_body_object_like_types(self):
+        schemas = _get_property_schemas(
+            [
+                {"name": "location", "dataType": ["geoCoordinates"]},
+                {"name": "phone", "dataType": ["phoneNumber"]},
+                {
+                    "name": "address",
+                    "dataType": ["object"],
+                    "nestedProperties": [{"name": "city", "dataType": ["text"]}],
+                },
+            ]
+        )
+        location = {"latitude": 48.86, "longitude": 2.35}
+        phone = {"input": "020 1234567", "defaultCountry": "nl"}
+        batch = ObjectsBatchRequest()
+        batch.add(
+            {"location": location, "phone": phone, "address": {"city": "Paris"}},
+            "Chemist",
+            uuid="d087b7c6-a115-5c89-8cb2-f25bdeb9bf93",
+        )
+
+        props = (
+            batch.get_grpc_request_body(property_schemas={"Chemist": schemas}).objects[0].properties
+        )
+        # only 'object' properties are nested objects, the others are sent as a generic struct
+        self.assertEqual(dict(props.non_ref_properties["location"]), location)
+        self.assertEqual(dict(props.non_ref_properties["phone"]), phone)
+        self.assertEqual(
+            [prop.prop_name for prop in props.object_properties],
+            ["address"],
+        )
+
+    def test_get_grpc_response(self):
+        batch = ObjectsBatchRequest()
+        batch.add({"name": "A"}, "Test", uuid="d087b7c6-a115-5c89-8cb2-f25bdeb9bf92", vector=[1])
+        batch.add({"name": "B"}, "Test", uuid="d087b7c6-a115-5c89-8cb2-f25bdeb9bf93", vector=[2])
+
+        reply = batch_pb2.BatchObjectsReply(
+            errors=[batch_pb2.BatchObjectsReply.BatchError(index=1, error="failed")]
+        )
+        response = batch.get_grpc_response(reply)
+        self.assertEqual(
+            response,
+            [
+                {
+                    "class": "Test",
+                    "properties": {"name": "A"},
+                    "id": "d087b7c6-a115-5c89-8cb2-f25bdeb9bf92",
+                    "result": {},
+                },
+                {
+                    "class": "Test",
+                    "properties": {"name": "B"},
+                    "id": "d087b7c6-a115-5c89-8cb2-f25bdeb9bf93",
+                    "vector": [2],
+                    "result": {"errors": {"error": [{"message": "failed"}]}},
+                },
+            ],
+        )
+
+        # failed objects can be retried
+        retry = ObjectsBatchRequest()
+        successful = retry.add_failed_objects_from_response(response, None, None)
+        self.assertEqual(len(successful), 1)
+        self.assertEqual(len(retry), 1)
+        self.assertEqual(retry.get_request_body()["objects"][0]["vector"], [2])
+
+
+class TestBatchObjectsColumns(unittest.TestCase):
+    """
+    Test the `ObjectsBatchRequest.add_columns` method.
+    """
+
+    def test_add_columns(self):
+        batch = ObjectsBatchRequest()
+        uuids = batch.add_columns(
+            "Chemist",
+            {"name": ["Marie Curie", "Linus Pauling"], "awards": [2, 2]},
+            vectors=[[1.0, 2.0], [3.0, 4.0]],
+            uuids=["d087b7c6-a115-5c89-8cb2-f25bdeb9bf92", "d087b7c6-a115-5c89-8cb2-f25bdeb9bf93"],
+            tenant="tenantA",
+        )
+        self.assertEqual(
+            uuids, ["d087b7c6-a115-5c89-8cb2-f25bdeb9bf92", "d087b7c6-a115-5c89-8cb2-f25bdeb9bf93"]
+        )
+        self.assertEqual(
+            batch.get_request_body()["objects"],
+            [
+                {
+                    "class": "Chemist",
+                    "properties": {"name": "Marie Curie", "awards": 2},
+                    "id": "d087b7c6-a115-5c89-8cb2-f25bdeb9bf92",
+                    "vector": [1.0, 2.0],
+                    "tenant": "tenantA",
+                },
+                {
+                    "class": "Chemist",
+                    "properties": {"name": "Linus Pauling", "awards": 2},
+                    "id": "d087b7c6-a115-5c89-8cb2-f25bdeb9bf93",
+                    "vector": [3.0, 4.0],
+                    "tenant": "tenantA",
+                },
+            ],
+        )
+
+        # no properties, only vectors
+        uuids = batch.add_columns("Chemist", {}, vectors=[[5.0], [6.0]])
+        self.assertEqual(len(uuids), 2)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.get_request_body()["objects"][3]["properties"], {})
+
+        with self.assertRaises(ValueError):
+            batch.add_columns("Chemist", {"name": ["A", "B"]}, vectors=[[1.0]])
+        with self.assertRaises(TypeError):
+            batch.add_columns(1, {"name": ["A"]})
+
+
+class TestBatchObjectsOwnership(unittest.TestCase):
+    """
+    Test the `copy_object` argument of `ObjectsBatchRequest.add`.
+    """
+
+    def test_add_without_copy(self):
+        batch = ObjectsBatchRequest()
+        data_object = {"name": "Marie Curie", "address": {"city": "Paris"}}
+        batch.add(data_object, "Chemist", copy_object=False)
+        self.assertIs(batch.get_request_body()["objects"][0]["properties"], data_object)
+
+        batch.add(data_object, "Chemist")
+        self.assertIsNot(batch.get_request_body()["objects"][1]["properties"], data_object)
+        self.assertEqual(batch.get_request_body()["objects"][1]["properties"], data_object)
+
+
+class TestBatchObjectsNumBytes(unittest.TestCase):
+    """
+    Test the size estimation and splitting of `ObjectsBatchRequest`.
+    """
+
+    def test_split_by_num_bytes(self):
+        batch = ObjectsBatchRequest()
+        self.assertEqual(batch._get_num_bytes(), 0)
+        small = [batch.add({"text": "a"}, "Test") for _ in range(3)]
+        small_size = batch._get_num_bytes() // 3
+        self.assertEqual(small_size, len(json.dumps(batch.get_request_body()["objects"][0])) + 1)
+
+        large = batch.add({"text": "a" * 1000}, "Test")
+        batch.add({"text": "a"}, "Test")
+        self.assertGreater(batch._get_num_bytes(), 1000)
+
+        requests = batch._split_by_num_bytes(2 * small_size)
+        self.assertEqual([len(request) for request in requests], [2, 1, 1, 1])
+        self.assertEqual(
+            [item["id"] for request in requests for item in request._items],
+            small + [large, batch._items[-1]["id"]],
+        )
+        self.assertEqual(sum(request._get_num_bytes() for request in requests), batch._num_bytes)
+        self.assertEqual(batch._split_by_num_bytes(batch._num_bytes), [batch])
+
+        batch.pop()
+        self.assertLess(batch._get_num_bytes(), sum(request._num_bytes for request in requests))
+
+    def test_num_bytes_incremental(self):
+        """
+        Test that every item is encoded once, also after `pop` and `_split_by_num_bytes`.
+        """
+
+        batch = ObjectsBatchRequest()
+        for i in range(5):
+            batch.add({"text": "a" * (i + 1)}, "Test")
+        num_bytes = batch._get_num_bytes()
+        sizes = list(batch._item_sizes)
+        with patch("weaviate.batch.requests._estimate_num_bytes") as estimate:
+            batch.pop(1)
+            batch.pop()
+            self.assertEqual(batch._get_num_bytes(), num_bytes - sizes[1] - sizes[4])
+            self.assertEqual(batch._item_sizes, [sizes[0], sizes[2], sizes[3]])
+            requests = batch._split_by_num_bytes(sizes[0] + sizes[2])
+            self.assertEqual(
+                [request._item_sizes for request in requests], [sizes[:1] + sizes[2:3], sizes[3:4]]
+            )
+            estimate.assert_not_called()
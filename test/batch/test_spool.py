@@ -0,0 +1,80 @@
+"""
+Test the 'weaviate.batch.spool' functions/classes.
+"""
+import os
+import tempfile
+import unittest
+
+from weaviate.batch.spool import BatchSpool
+
+
+class TestBatchSpool(unittest.TestCase):
+    """
+    Test the `BatchSpool` class.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_recover(self):
+        """
+        Test that only unacknowledged items are recovered, even after an incomplete write.
+        """
+
+        spool = BatchSpool(self.directory.name, segment_size=2)
+        objects = [{"class": "Test", "id": str(i)} for i in range(5)]
+        reference = {"from": "weaviate://localhost/Test/0/ref", "to": "weaviate://localhost/1"}
+        spool.append("objects", objects)
+        spool.append("references", [reference])
+        spool.ack(objects[:3])
+        # acknowledging unknown items does nothing
+        spool.ack([{"class": "Test", "id": "0"}])
+        self.assertEqual(spool.num_pending, 3)
+        spool.close()
+
+        segments = sorted(os.listdir(self.directory.name))
+        with open(os.path.join(self.directory.name, segments[-1]), "ab") as file:
+            file.write(b'{"seq": 10, "type": "obj')
+
+        spool = BatchSpool(self.directory.name, segment_size=2)
+        self.assertEqual(spool.num_pending, 3)
+        recovered = spool._recover()
+        self.assertEqual(
+            recovered,
+            [("objects", objects[3]), ("objects", objects[4]), ("references", reference)],
+        )
+        self.assertEqual(spool._recover(), [])
+
+        spool.ack([item for _, item in recovered])
+        self.assertEqual(spool.num_pending, 0)
+        spool.close()
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+        self.assertEqual(BatchSpool(self.directory.name).num_pending, 0)
+
+    def test_segments_are_removed_in_order(self):
+        """
+        Test that a segment is only removed once all older segments are acknowledged.
+        """
+
+        spool = BatchSpool(self.directory.name, segment_size=2)
+        objects = [{"class": "Test", "id": str(i)} for i in range(6)]
+        spool.append("objects", objects)
+        self.assertEqual(len(os.listdir(self.directory.name)), 3)
+
+        spool.ack(objects[2:4])
+        self.assertEqual(len(os.listdir(self.directory.name)), 3)
+        spool.ack(objects[:2])
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+    def test_init_errors(self):
+        """
+        Test the arguments of the BatchSpool.
+        """
+
+        with self.assertRaises(ValueError):
+            BatchSpool(self.directory.name, segment_size=0)
+        with self.assertRaises(TypeError):
+            BatchSpool(self.directory.name, segment_size=1.5)
+        with self.assertRaises(TypeError):
+            BatchSpool(self.directory.name, codec="json")
@@ -0,0 +1,40 @@
+"""
+Test the 'weaviate.connect.compression' functions.
+"""
+import gzip
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from weaviate.connect.compression import get_compressor, has_zstd
+
+if has_zstd:
+    import zstandard
+
+
+class TestCompressors(unittest.TestCase):
+    """
+    Test the compressors returned by `get_compressor`.
+    """
+
+    def compress_concurrently(self, compressor):
+        bodies = [(str(i) * 10_000).encode() for i in range(64)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return bodies, list(executor.map(compressor, bodies))
+
+    def test_gzip(self):
+        bodies, compressed = self.compress_concurrently(get_compressor("gzip"))
+        self.assertEqual([gzip.decompress(body) for body in compressed], bodies)
+
+    @unittest.skipIf(not has_zstd, "zstandard is not installed")
+    def test_zstd_threads(self):
+        """
+        Test that one zstd compressor can be used by several threads at the same time.
+        """
+
+        bodies, compressed = self.compress_concurrently(get_compressor("zstd"))
+        decompressor = zstandard.ZstdDecompressor()
+        self.assertEqual([decompressor.decompress(body) for body in compressed], bodies)
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            get_compressor("brotli")
@@ -0,0 +1,98 @@
+"""
+Test the 'weaviate.connect.endpoints' functions/classes.
+"""
+import unittest
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from weaviate.connect.endpoints import _EndpointPool, _is_connect_error
+
+URLS = ["http://node-0:8080", "http://node-1:8080", "http://node-2:8080"]
+
+
+class TestEndpointPool(unittest.TestCase):
+    """
+    Test the `_EndpointPool` class.
+    """
+
+    def pool(self, strategy="least_outstanding", ready=None):
+        ready = set(URLS) if ready is None else ready
+        return _EndpointPool(
+            URLS, strategy=strategy, health_check_interval=5, is_ready=lambda url: url in ready
+        )
+
+    def test_least_outstanding(self):
+        """
+        Test that the node with the fewest requests in flight is picked.
+        """
+
+        pool = self.pool()
+        endpoints = [pool.acquire() for _ in range(3)]
+        self.assertEqual(sorted(endpoint.url for endpoint in endpoints), URLS)
+
+        pool.release(endpoints[1])
+        self.assertIs(pool.acquire(), endpoints[1])
+
+    def test_power_of_two(self):
+        """
+        Test that the less busy of two random nodes is picked.
+        """
+
+        pool = self.pool(strategy="power_of_two")
+        busy, idle, _ = pool._endpoints
+        busy.outstanding = 3
+        with patch("weaviate.connect.endpoints.random.sample", return_value=[busy, idle]):
+            self.assertIs(pool.acquire(), idle)
+        self.assertEqual(idle.outstanding, 1)
+
+    def test_ejection(self):
+        """
+        Test that failed nodes are skipped until the health check adds them back.
+        """
+
+        pool = self.pool(ready={URLS[1], URLS[2]})
+        endpoint = pool.acquire()
+        pool.release(endpoint, failed=True)
+        self.assertNotIn(endpoint.url, pool.healthy_urls)
+        for _ in range(10):
+            self.assertIsNot(pool.acquire(), endpoint)
+
+        pool.check_health()
+        self.assertEqual(pool.healthy_urls, [URLS[1], URLS[2]])
+        pool._is_ready = lambda url: True
+        pool.check_health()
+        self.assertEqual(pool.healthy_urls, URLS)
+
+    def test_exclude(self):
+        """
+        Test that the nodes a request already failed on are picked last.
+        """
+
+        pool = self.pool()
+        tried = []
+        for _ in range(3):
+            endpoint = pool.acquire(exclude=tried)
+            pool.release(endpoint, failed=True)
+            self.assertNotIn(endpoint, tried)
+            tried.append(endpoint)
+
+        # every node is ejected, requests still go to one of them
+        self.assertEqual(pool.healthy_urls, [])
+        self.assertIn(pool.acquire(exclude=tried).url, URLS)
+
+
+class TestIsConnectError(unittest.TestCase):
+    def test_is_connect_error(self):
+        """
+        Test that only errors before the request was sent count as connect errors.
+        """
+
+        refused = MaxRetryError(None, "/v1", NewConnectionError(None, "refused"))
+        self.assertTrue(_is_connect_error(RequestsConnectionError(refused)))
+        self.assertTrue(_is_connect_error(ConnectTimeout()))
+        aborted = ProtocolError("Connection aborted.", ConnectionResetError())
+        self.assertFalse(_is_connect_error(RequestsConnectionError(aborted)))
+        self.assertFalse(_is_connect_error(RequestsConnectionError(MaxRetryError(None, "/v1"))))
@@ -0,0 +1,110 @@
+"""
+Test the 'weaviate.connect.retry' functions/classes.
+"""
+import unittest
+from unittest.mock import patch
+
+from weaviate.config import CircuitBreakerConfig, RetryPolicy
+from weaviate.connect.retry import _backoff_delay, _CircuitBreaker, _is_idempotent
+from weaviate.exceptions import WeaviateCircuitOpenError
+
+
+class TestRetry(unittest.TestCase):
+    def test_backoff_delay(self):
+        """
+        Test that the delay grows exponentially, is capped and jittered.
+        """
+
+        for retry, backoff in [(0, 0.5), (1, 1), (2, 2), (3, 4), (10, 5)]:
+            for _ in range(10):
+                delay = _backoff_delay(retry, base=0.5, maximum=5)
+                self.assertGreaterEqual(delay, backoff / 2)
+                self.assertLessEqual(delay, backoff)
+
+    def test_is_idempotent(self):
+        for method in ["get", "head", "put", "delete"]:
+            self.assertTrue(_is_idempotent(method, "/objects"))
+        self.assertTrue(_is_idempotent("post", "/graphql"))
+        self.assertTrue(_is_idempotent("post", "/graphql/batch"))
+        self.assertFalse(_is_idempotent("post", "/objects"))
+        self.assertFalse(_is_idempotent("post", "/batch/objects"))
+        self.assertFalse(_is_idempotent("patch", "/objects/123"))
+
+    def test_retry_policy_errors(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_retries=-1)
+        with self.assertRaises(TypeError):
+            RetryPolicy(backoff_base="1")
+        with self.assertRaises(ValueError):
+            RetryPolicy(deadline=0)
+        with self.assertRaises(TypeError):
+            RetryPolicy(retry_status_codes=[503])
+        with self.assertRaises(ValueError):
+            CircuitBreakerConfig(failure_threshold=0)
+        with self.assertRaises(TypeError):
+            CircuitBreakerConfig(recovery_time=None)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        patcher = patch("weaviate.connect.retry.time")
+        patcher.start().monotonic.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+        self.breaker = _CircuitBreaker(
+            "http://localhost:8080", CircuitBreakerConfig(failure_threshold=3, recovery_time=10)
+        )
+
+    def fail(self, times):
+        for _ in range(times):
+            self.breaker.before_request()
+            self.breaker.record(failed=True)
+
+    def test_open_after_consecutive_failures(self):
+        self.fail(2)
+        self.breaker.record(failed=False)
+        self.fail(2)
+        self.assertFalse(self.breaker.is_open)
+        self.fail(1)
+        self.assertTrue(self.breaker.is_open)
+        with self.assertRaises(WeaviateCircuitOpenError):
+            self.breaker.before_request()
+
+    def test_half_open(self):
+        """
+        Test that one trial request is let through after the recovery time.
+        """
+
+        self.fail(3)
+        self.now = 10
+        self.breaker.before_request()
+        # only one trial at a time
+        with self.assertRaises(WeaviateCircuitOpenError):
+            self.breaker.before_request()
+
+        # the trial failed, the circuit stays open for another recovery time
+        self.breaker.record(failed=True)
+        self.now = 15
+        with self.assertRaises(WeaviateCircuitOpenError):
+            self.breaker.before_request()
+
+        self.now = 20
+        self.breaker.before_request()
+        self.breaker.record(failed=False)
+        self.assertFalse(self.breaker.is_open)
+        self.breaker.before_request()
+
+    def test_interrupted_trial(self):
+        """
+        Test that an interrupted trial request does not close the circuit.
+        """
+
+        self.fail(3)
+        self.now = 10
+        self.breaker.before_request()
+        self.breaker.cancel()
+        self.assertTrue(self.breaker.is_open)
+        # the next request is the trial
+        self.breaker.before_request()
+        with self.assertRaises(WeaviateCircuitOpenError):
+            self.breaker.before_request()
@@ -0,0 +1,71 @@
+"""
+Test that `import weaviate` does not import the optional dependencies that are slow to import.
+"""
+import subprocess
+import sys
+
+import pytest
+
+# imported on first use: gRPC calls, OIDC authentication, URL validation and the AsyncClient
+LAZY_MODULES = [
+    "grpc",
+    "google.protobuf",
+    "weaviate.proto.v1.weaviate_pb2_grpc",
+    "authlib",
+    "validators",
+    "httpx",
+    "weaviate.async_client",
+]
+
+IMPORT_WEAVIATE = "import weaviate"
+
+
+def _imported_modules(code: str) -> set:
+    """Run `code` in a new interpreter and return the lazily imported modules it imported."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\nprint(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    assert _imported_modules(IMPORT_WEAVIATE) == set()
+
+
+def test_client_construction_is_lazy():
+    code = (
+        "import weaviate\n"
+        "weaviate.Client(\n"
+        "    'http://localhost:1',\n"
+        "    additional_config=weaviate.Config(\n"
+        "        connection_config=weaviate.ConnectionConfig(lazy=True, check_client_version=False)\n"
+        "    ),\n"
+        ")"
+    )
+    assert _imported_modules(code) == set()
+
+
+def test_lazy_attributes():
+    import weaviate
+
+    assert "AsyncClient" in dir(weaviate)
+    assert weaviate.AsyncClient.__module__ == "weaviate.async_client"
+    with pytest.raises(AttributeError):
+        weaviate.DoesNotExist
+
+
+def test_import_time(benchmark):
+    """Benchmark `import weaviate` in a new interpreter, run with `pytest --benchmark-only`."""
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", IMPORT_WEAVIATE],),
+        kwargs={"check": True},
+        rounds=10,
+    )
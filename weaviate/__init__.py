@@ -34,6 +34,7 @@ __version__ : str
 
 __all__ = [
     "Client",
+    "AsyncClient",
     "AuthClientCredentials",
     "AuthClientPassword",
     "AuthBearerToken",
@@ -43,11 +44,27 @@ __all__ = [
     "AuthenticationFailedException",
     "SchemaValidationException",
     "WeaviateStartUpError",
+    "WeaviateCircuitOpenError",
     "ConsistencyLevel",
     "WeaviateErrorRetryConf",
+    "BatchSpool",
+    "DeadLetterStore",
+    "BatchSizeController",
+    "BatchObservation",
+    "AIMDController",
+    "LatencyTargetController",
+    "NodeRouter",
+    "RateLimiter",
+    "BatchStats",
+    "BatchRequestEvent",
+    "WorkerAutoscaler",
     "EmbeddedOptions",
     "Config",
     "ConnectionConfig",
+    "RetryPolicy",
+    "CircuitBreakerConfig",
+    "JsonCodec",
+    "OrjsonCodec",
     "AdditionalProperties",
     "LinkTo",
     "Shard",
@@ -55,9 +72,10 @@ __all__ = [
     "TenantActivityStatus",
 ]
 
+import importlib
 import sys
-
 from importlib.metadata import version, PackageNotFoundError
+from typing import Any, List, TYPE_CHECKING
 
 try:
     __version__ = version("weaviate-client")
@@ -66,7 +84,22 @@ except PackageNotFoundError:
 
 from .auth import AuthClientCredentials, AuthClientPassword, AuthBearerToken, AuthApiKey
 from .batch.crud_batch import WeaviateErrorRetryConf, Shard
+from .batch.autoscaler import WorkerAutoscaler
+from .batch.controller import (
+    AIMDController,
+    BatchObservation,
+    BatchSizeController,
+    LatencyTargetController,
+)
+from .batch.dead_letters import DeadLetterStore
+from .batch.rate_limiter import RateLimiter
+from .batch.routing import NodeRouter
+from .batch.spool import BatchSpool
+from .batch.stats import BatchRequestEvent, BatchStats
 from .client import Client
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
 from .data.replication import ConsistencyLevel
 from .schema.crud_schema import Tenant, TenantActivityStatus
 from .embedded import EmbeddedOptions
@@ -76,10 +109,30 @@ from .exceptions import (
     AuthenticationFailedException,
     SchemaValidationException,
     WeaviateStartUpError,
+    WeaviateCircuitOpenError,
 )
-from .config import Config, ConnectionConfig
+from .codec import JsonCodec, OrjsonCodec
+from .config import Config, ConnectionConfig, RetryPolicy, CircuitBreakerConfig
 from .gql.get import AdditionalProperties, LinkTo
 
+# imported on first access, they pull in optional dependencies that are slow to import (httpx)
+_LAZY_IMPORTS = {
+    "AsyncClient": ".async_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 if not sys.warnoptions:
     import warnings
 
@@ -0,0 +1,179 @@
+"""
+AsyncClient class definition.
+"""
+from typing import Any, Optional, Union
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from .auth import AuthCredentials
+from .batch.async_crud_batch import AsyncBatch
+from .client import TIMEOUT_TYPE
+from .config import Config
+from .connect.async_connection import AsyncConnection
+from .connect.connection import TIMEOUT_TYPE_RETURN
+from .data.async_crud_data import AsyncDataObject
+from .exceptions import WeaviateStartUpError
+from .gql.async_query import AsyncQuery
+from .schema.async_crud_schema import AsyncSchema
+from .util import _get_valid_timeout_config
+
+
+class AsyncClient:
+    """
+    A Weaviate Client for asyncio applications. Its attributes have the same methods as the ones
+    of `weaviate.Client`, but they are coroutines that have to be awaited. Requests are sent with
+    `httpx`, install it with `pip install weaviate-client[ASYNC]`.
+
+    The connection is established by `connect` or by the first request and has to be closed with
+    `close`. Both are done when using the client as an asynchronous context manager.
+
+    Attributes
+    ----------
+    batch : weaviate.batch.async_crud_batch.AsyncBatch
+        An AsyncBatch object instance connected to the same Weaviate instance as the Client.
+    data_object : weaviate.data.async_crud_data.AsyncDataObject
+        An AsyncDataObject object instance connected to the same Weaviate instance as the Client.
+    schema : weaviate.schema.async_crud_schema.AsyncSchema
+        An AsyncSchema object instance connected to the same Weaviate instance as the Client.
+    query : weaviate.gql.async_query.AsyncQuery
+        An AsyncQuery object instance connected to the same Weaviate instance as the Client.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth_client_secret: Optional[AuthCredentials] = None,
+        timeout_config: TIMEOUT_TYPE = (10, 60),
+        proxies: Union[dict, str, None] = None,
+        trust_env: bool = False,
+        additional_headers: Optional[dict] = None,
+        startup_period: Optional[int] = 5,
+        additional_config: Optional[Config] = None,
+    ) -> None:
+        """
+        Initialize an AsyncClient class instance. The arguments are the same as the ones of
+        `weaviate.Client`, except that embedded databases are not supported.
+
+        Examples
+        --------
+        >>> async with weaviate.AsyncClient("http://localhost:8080") as client:
+        ...     await client.data_object.create({"name": "John"}, "Person")
+        ...     result = await client.query.get("Person", ["name"]).do()
+
+        Raises
+        ------
+        TypeError
+            If arguments are of a wrong data type.
+        ImportError
+            If `httpx` is not installed.
+        """
+
+        if not isinstance(url, str):
+            raise TypeError(f"URL is expected to be string but is {type(url)}")
+        config = Config() if additional_config is None else additional_config
+
+        self._connection = AsyncConnection(
+            url=url.strip("/"),
+            auth_client_secret=auth_client_secret,
+            timeout_config=_get_valid_timeout_config(timeout_config),
+            proxies=proxies,
+            trust_env=trust_env,
+            additional_headers=additional_headers,
+            startup_period=startup_period,
+            connection_config=config.connection_config,
+            grpc_port=config.grpc_port_experimental,
+        )
+        self.schema = AsyncSchema(self._connection)
+        self.batch = AsyncBatch(self._connection)
+        self.data_object = AsyncDataObject(self._connection)
+        self.query = AsyncQuery(self._connection)
+
+    async def connect(self) -> None:
+        """
+        Wait for Weaviate to start, authenticate and check the version of Weaviate, see
+        `weaviate.connect.async_connection.AsyncConnection.connect`.
+        """
+
+        await self._connection.connect()
+
+    async def close(self) -> None:
+        """
+        Close the connection to Weaviate.
+        """
+
+        await self._connection.close()
+
+    async def is_ready(self) -> bool:
+        """
+        Ping Weaviate's ready state
+
+        Returns
+        -------
+        bool
+            True if Weaviate is ready to accept requests,
+            False otherwise.
+        """
+
+        try:
+            response = await self._connection.get(path="/.well-known/ready")
+            if response.status_code == 200:
+                return True
+            return False
+        except (RequestsConnectionError, WeaviateStartUpError):
+            return False
+
+    async def is_live(self) -> bool:
+        """
+        Ping Weaviate's live state.
+
+        Returns
+        --------
+        bool
+            True if weaviate is live and should not be killed,
+            False otherwise.
+        """
+
+        response = await self._connection.get(path="/.well-known/live")
+        if response.status_code == 200:
+            return True
+        return False
+
+    async def get_meta(self) -> dict:
+        """
+        Get the meta endpoint description of weaviate.
+
+        Returns
+        -------
+        dict
+            The dict describing the weaviate configuration.
+
+        Raises
+        ------
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        return await self._connection.get_meta()
+
+    @property
+    def timeout_config(self) -> TIMEOUT_TYPE_RETURN:
+        """
+        Getter/setter for `timeout_config`, see `weaviate.Client.timeout_config`.
+        """
+
+        return self._connection.timeout_config
+
+    @timeout_config.setter
+    def timeout_config(self, timeout_config: TIMEOUT_TYPE) -> None:
+        """
+        Setter for `timeout_config`. (docstring should be only in the Getter)
+        """
+
+        self._connection.timeout_config = _get_valid_timeout_config(timeout_config)
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
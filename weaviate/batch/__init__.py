@@ -3,5 +3,32 @@ Module for uploading objects and references to Weaviate in batches.
 """
 
 from .crud_batch import Batch
+from .autoscaler import WorkerAutoscaler
+from .controller import (
+    AIMDController,
+    BatchObservation,
+    BatchSizeController,
+    LatencyTargetController,
+)
+from .dead_letters import DeadLetter, DeadLetterStore
+from .rate_limiter import RateLimiter
+from .routing import NodeRouter
+from .spool import BatchSpool
+from .stats import BatchRequestEvent, BatchStats, Histogram
 
-__all__ = ["Batch"]
+__all__ = [
+    "Batch",
+    "BatchSpool",
+    "DeadLetter",
+    "DeadLetterStore",
+    "BatchSizeController",
+    "BatchObservation",
+    "AIMDController",
+    "LatencyTargetController",
+    "NodeRouter",
+    "RateLimiter",
+    "BatchStats",
+    "BatchRequestEvent",
+    "Histogram",
+    "WorkerAutoscaler",
+]
@@ -0,0 +1,389 @@
+"""
+AsyncBatch class definition.
+"""
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence, Set, Union, cast
+
+from requests import ReadTimeout, Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.connect.async_connection import AsyncConnection
+from weaviate.data.replication import ConsistencyLevel
+from weaviate.types import UUID
+from .crud_batch import (
+    _batch_retry_delay,
+    _check_non_negative,
+    _get_to_object_class_name,
+)
+from .requests import BatchRequest, ObjectsBatchRequest, ReferenceBatchRequest, BatchResponse
+from ..exceptions import UnexpectedStatusCodeException
+from ..util import (
+    _capitalize_first_letter,
+    check_batch_result,
+    _check_positive_num,
+    _decode_json_response_list,
+)
+
+
+class AsyncBatch:
+    """
+    AsyncBatch class used to add multiple objects and references at once to weaviate from asyncio
+    code. Objects and references are collected until `batch_size` of them were added, then the
+    batch is sent in the background while new items are added. At most `num_workers` batches are
+    sent concurrently, adding an item that fills a batch waits until one of them finished.
+    References are only sent once all objects that were added before them have been created.
+
+    Use it as an asynchronous context manager to send the remaining items when leaving the block:
+
+    >>> async with client.batch.configure(batch_size=100, num_workers=2) as batch:
+    ...     for i in range(1000):
+    ...         await batch.add_data_object({"index": i}, "Test")
+
+    Exceptions raised while sending a batch in the background are re-raised by the next call of
+    `add_data_object`, `add_reference` or `flush`.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncBatch class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.connect.async_connection.AsyncConnection
+            Connection object to an active and running weaviate instance.
+        """
+
+        self._connection = connection
+        self._objects_batch = ObjectsBatchRequest()
+        self._reference_batch = ReferenceBatchRequest()
+        self._objects_tasks: Set["asyncio.Task[Optional[Response]]"] = set()
+        self._tasks: Set["asyncio.Task[Optional[Response]]"] = set()
+        # created lazily, it has to belong to the running event loop
+        self._workers: Optional[asyncio.Semaphore] = None
+        self._error: Optional[Exception] = None
+
+        self._callback: Optional[Callable[[BatchResponse], None]] = check_batch_result
+        self._batch_size = 100
+        self._num_workers = 1
+        self._timeout_retries = 3
+        self._connection_error_retries = 3
+        self._consistency_level: Optional[ConsistencyLevel] = None
+
+    def configure(
+        self,
+        batch_size: int = 100,
+        num_workers: int = 1,
+        timeout_retries: int = 3,
+        connection_error_retries: int = 3,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        callback: Optional[Callable[[BatchResponse], None]] = check_batch_result,
+    ) -> "AsyncBatch":
+        """
+        Configure the AsyncBatch. It must not be called while batches are being sent, i.e.
+        between adding items and `flush`.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The number of objects or references in a batch, by default 100
+        num_workers : int, optional
+            The maximal number of batches that are sent concurrently, by default 1
+        timeout_retries : int, optional
+            Number of retries to create a Batch that failed with ReadTimeout, by default 3
+        connection_error_retries : int, optional
+            Number of retries to create a Batch that failed with ConnectionError, by default 3
+        consistency_level : weaviate.data.replication.ConsistencyLevel, optional
+            The consistency level of the batch requests, by default None
+        callback : Optional[Callable[[list], None]], optional
+            A callback function on the results of each (objects and references) batch types.
+            By default `weaviate.util.check_batch_result`
+
+        Returns
+        -------
+        AsyncBatch
+            Updated self.
+
+        Raises
+        ------
+        TypeError
+            If one of the arguments is of a wrong type.
+        ValueError
+            If the value of one of the arguments is wrong.
+        """
+
+        _check_positive_num(batch_size, "batch_size", int)
+        _check_positive_num(num_workers, "num_workers", int)
+        _check_non_negative(timeout_retries, "timeout_retries", int)
+        _check_non_negative(connection_error_retries, "connection_error_retries", int)
+
+        self._batch_size = batch_size
+        if num_workers != self._num_workers:
+            self._num_workers = num_workers
+            self._workers = None
+        self._timeout_retries = timeout_retries
+        self._connection_error_retries = connection_error_retries
+        self._consistency_level = (
+            ConsistencyLevel(consistency_level) if consistency_level is not None else None
+        )
+        self._callback = callback
+        return self
+
+    async def add_data_object(
+        self,
+        data_object: dict,
+        class_name: str,
+        uuid: Optional[UUID] = None,
+        vector: Optional[Sequence] = None,
+        tenant: Optional[str] = None,
+    ) -> str:
+        """
+        Add one object to this batch, see `weaviate.batch.Batch.add_data_object`. Sends the batch
+        in the background if it is full.
+
+        Returns
+        -------
+        str
+            The UUID of the added object. If one was not provided a UUIDv3 will be generated.
+        """
+
+        self._raise_error()
+        uuid = self._objects_batch.add(
+            class_name=_capitalize_first_letter(class_name),
+            data_object=data_object,
+            uuid=uuid,
+            vector=vector,
+            tenant=tenant,
+        )
+        if len(self._objects_batch) >= self._batch_size:
+            await self._send_objects()
+        return uuid
+
+    async def add_reference(
+        self,
+        from_object_uuid: UUID,
+        from_object_class_name: str,
+        from_property_name: str,
+        to_object_uuid: UUID,
+        to_object_class_name: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Add one reference to this batch, see `weaviate.batch.Batch.add_reference`. Sends the batch
+        in the background if it is full.
+        """
+
+        self._raise_error()
+        to_object_class_name = _get_to_object_class_name(
+            self._connection.server_version, to_object_class_name
+        )
+        self._reference_batch.add(
+            from_object_class_name=_capitalize_first_letter(from_object_class_name),
+            from_object_uuid=from_object_uuid,
+            from_property_name=from_property_name,
+            to_object_uuid=to_object_uuid,
+            to_object_class_name=to_object_class_name,
+            tenant=tenant,
+        )
+        if len(self._reference_batch) >= self._batch_size:
+            await self._send_references()
+
+    async def create_objects(self) -> list:
+        """
+        Creates the objects of this batch at once and waits for the response.
+
+        Returns
+        -------
+        list
+            A list with the status of every object that was created.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if len(self._objects_batch) == 0:
+            return []
+        batch_request, self._objects_batch = self._objects_batch, ObjectsBatchRequest()
+        response = await self._create_data("objects", batch_request)
+        return _decode_json_response_list(response, "batch add objects") or []
+
+    async def create_references(self) -> list:
+        """
+        Creates the references of this batch at once and waits for the response. The objects of
+        this batch and the ones that are still being sent in the background are created first.
+
+        Returns
+        -------
+        list
+            A list with the status of every reference added.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if len(self._reference_batch) == 0:
+            return []
+        await self.create_objects()
+        await self._wait(self._objects_tasks)
+        batch_request, self._reference_batch = self._reference_batch, ReferenceBatchRequest()
+        response = await self._create_data("references", batch_request)
+        return _decode_json_response_list(response, "Create references") or []
+
+    async def flush(self) -> None:
+        """
+        Send all remaining objects and references and wait until all batches were created.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if len(self._objects_batch) > 0:
+            await self._send_objects()
+        if len(self._reference_batch) > 0:
+            await self._send_references()
+        await self._wait(self._tasks)
+        self._raise_error()
+
+    async def _send_objects(self) -> None:
+        batch_request, self._objects_batch = self._objects_batch, ObjectsBatchRequest()
+        task = await self._start(self._create_data("objects", batch_request))
+        self._objects_tasks.add(task)
+        task.add_done_callback(self._objects_tasks.discard)
+
+    async def _send_references(self) -> None:
+        if len(self._objects_batch) > 0:
+            await self._send_objects()
+        batch_request, self._reference_batch = self._reference_batch, ReferenceBatchRequest()
+        # the objects added before these references are already being sent, so waiting for them
+        # inside of the task cannot block the workers they need
+        pending_objects = set(self._objects_tasks)
+
+        async def create_references() -> Response:
+            await self._wait(pending_objects)
+            return await self._create_data("references", batch_request)
+
+        await self._start(create_references())
+
+    async def _start(self, coro: Any) -> "asyncio.Task[Optional[Response]]":
+        """
+        Run the batch creation `coro` in the background once a worker is free.
+        """
+
+        if self._workers is None:
+            self._workers = asyncio.Semaphore(self._num_workers)
+        workers = self._workers
+        try:
+            await workers.acquire()
+        except BaseException:
+            coro.close()
+            raise
+
+        async def run() -> Optional[Response]:
+            try:
+                return cast(Response, await coro)
+            except Exception as error:
+                # re-raised by the next call of add_*/flush, nobody awaits the task itself
+                if self._error is None:
+                    self._error = error
+                return None
+            finally:
+                workers.release()
+
+        task = asyncio.ensure_future(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @staticmethod
+    async def _wait(tasks: Set["asyncio.Task[Optional[Response]]"]) -> None:
+        if len(tasks) > 0:
+            await asyncio.gather(*tasks)
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def _create_data(self, data_type: str, batch_request: BatchRequest) -> Response:
+        """
+        Create data in batches, either Objects or References, see
+        `weaviate.batch.Batch._create_data`. Batches that timed out are sent again as a whole,
+        the objects have fixed UUIDs so they are overwritten.
+        """
+
+        params = {}
+        if self._consistency_level is not None:
+            params["consistency_level"] = self._consistency_level.value
+
+        timeout_count = connection_count = 0
+        try:
+            while True:
+                try:
+                    response = await self._connection.post(
+                        path="/batch/" + data_type,
+                        weaviate_object=batch_request.get_request_body(),
+                        params=params,
+                    )
+                except ReadTimeout as error:
+                    delay = _batch_retry_delay(timeout_count, self._timeout_retries, error)
+                    timeout_count += 1
+                    await asyncio.sleep(delay)
+                except RequestsConnectionError as error:
+                    delay = _batch_retry_delay(
+                        connection_count, self._connection_error_retries, error
+                    )
+                    connection_count += 1
+                    await asyncio.sleep(delay)
+                else:
+                    break
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Batch was not added to weaviate.") from conn_err
+        except ReadTimeout:
+            message = (
+                f"The '{data_type}' creation was cancelled because it took "
+                f"longer than the configured timeout of {self._connection.timeout_config[1]}s. "
+                f"Try reducing the batch size (currently {len(batch_request)}) to a lower value. "
+                "Aim to on average complete batch request within less than 10s"
+            )
+            raise ReadTimeout(message) from None
+
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException(f"Create {data_type} in batch", response)
+        if self._callback is not None:
+            response_json: Union[List[dict], None] = _decode_json_response_list(
+                response, "batch response"
+            )
+            assert response_json is not None
+            self._callback(response_json)
+        return response
+
+    @property
+    def num_objects(self) -> int:
+        """
+        The number of objects that were added and not sent yet.
+        """
+        return len(self._objects_batch)
+
+    @property
+    def num_references(self) -> int:
+        """
+        The number of references that were added and not sent yet.
+        """
+        return len(self._reference_batch)
+
+    async def __aenter__(self) -> "AsyncBatch":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.flush()
@@ -0,0 +1,198 @@
+"""
+WorkerAutoscaler class definition.
+"""
+import threading
+import time
+from numbers import Real
+from typing import Optional
+
+from weaviate.util import _check_positive_num
+
+
+class WorkerAutoscaler:
+    """
+    Adapts the number of batch requests a `weaviate.batch.Batch` sends concurrently, between
+    `min_workers` and `max_workers`, instead of the fixed `num_workers`.
+
+    The autoscaler hill-climbs on the throughput: every `interval` seconds it compares the objects
+    and references sent per second with the previous interval and moves the number of workers by
+    one in the direction that improved the throughput. If the throughput dropped it turns around,
+    if it stayed within `tolerance` it removes a worker, because the extra worker did not help.
+    Timeouts, and a mean latency above `max_latency`, always remove a worker.
+
+    The number of workers never exceeds `ConnectionConfig.session_pool_maxsize`, so the workers do
+    not open and close connections beyond the pool of the client.
+
+    An autoscaler keeps the state of one batch, it should not be shared by several batches.
+
+    Examples
+    --------
+    >>> autoscaler = weaviate.WorkerAutoscaler(min_workers=1, max_workers=16)
+    >>> with client.batch(batch_size=100, worker_autoscaler=autoscaler) as batch:
+    ...     for obj in objects:
+    ...         batch.add_data_object(obj, "Article")
+    >>> autoscaler.num_workers
+    6
+    """
+
+    def __init__(
+        self,
+        min_workers: int = 1,
+        max_workers: int = 8,
+        interval: float = 5,
+        tolerance: float = 0.05,
+        max_latency: Optional[float] = None,
+    ):
+        """
+        Initialize a WorkerAutoscaler class instance.
+
+        Parameters
+        ----------
+        min_workers : int, optional
+            The lowest number of concurrent batch requests, by default 1.
+        max_workers : int, optional
+            The highest number of concurrent batch requests, by default 8.
+        interval : Real, optional
+            How long the throughput is measured before the number of workers is changed, in
+            seconds, by default 5.
+        tolerance : Real, optional
+            The relative change of the throughput that counts as neither better nor worse, by
+            default 0.05.
+        max_latency : Real, optional
+            The mean latency of the batch requests in seconds above which a worker is removed, by
+            default None.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If an argument has a wrong value.
+        """
+
+        _check_positive_num(min_workers, "min_workers", int)
+        _check_positive_num(max_workers, "max_workers", int)
+        if min_workers > max_workers:
+            raise ValueError("'min_workers' must not be greater than 'max_workers'.")
+        _check_positive_num(interval, "interval", Real)
+        _check_positive_num(tolerance, "tolerance", Real)
+        if max_latency is not None:
+            _check_positive_num(max_latency, "max_latency", Real)
+
+        self._min_workers = min_workers
+        self._max_workers = max_workers
+        self._interval = float(interval)
+        self._tolerance = float(tolerance)
+        self._max_latency = max_latency
+
+        self._condition = threading.Condition()
+        self._limit = max_workers
+        self._num_workers = min_workers
+        self._in_flight = 0
+        self._direction = 1
+        self._last_throughput: Optional[float] = None
+        self._reset_window()
+
+    @property
+    def min_workers(self) -> int:
+        """
+        The lowest number of concurrent batch requests.
+        """
+
+        return self._min_workers
+
+    @property
+    def max_workers(self) -> int:
+        """
+        The highest number of concurrent batch requests, capped by the connection pool size.
+        """
+
+        return min(self._max_workers, self._limit)
+
+    @property
+    def num_workers(self) -> int:
+        """
+        The current number of concurrent batch requests.
+        """
+
+        return self._num_workers
+
+    def _bind(self, limit: int) -> None:
+        """
+        Start autoscaling for a batch whose connection pool holds `limit` connections.
+        """
+
+        with self._condition:
+            self._limit = max(limit, 1)
+            self._num_workers = min(self._min_workers, self.max_workers)
+            self._direction = 1
+            self._last_throughput = None
+            self._reset_window()
+            self._condition.notify_all()
+
+    def _acquire(self) -> None:
+        """
+        Block until fewer than `num_workers` batch requests are in flight and take a slot.
+        """
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self._num_workers)
+            self._in_flight += 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _observe(self, num_items: int, latency: float, timed_out: bool) -> None:
+        """
+        Add the outcome of one attempt to send a batch request and adapt the number of workers
+        at the end of the interval.
+
+        Parameters
+        ----------
+        num_items : int
+            The number of objects or references that were created, 0 for a failed attempt.
+        latency : float
+            How long the attempt took in seconds.
+        timed_out : bool
+            Whether the attempt timed out.
+        """
+
+        with self._condition:
+            self._window_items += num_items
+            self._window_latency += latency
+            self._window_requests += 1
+            self._window_timeouts += int(timed_out)
+
+            now = time.monotonic()
+            if now - self._window_start < self._interval:
+                return
+            throughput = self._window_items / (now - self._window_start)
+            mean_latency = self._window_latency / self._window_requests
+            congested = self._window_timeouts > 0 or (
+                self._max_latency is not None and mean_latency > self._max_latency
+            )
+            if congested:
+                self._direction = -1
+            elif self._last_throughput is not None:
+                if throughput < self._last_throughput * (1 - self._tolerance):
+                    self._direction = -self._direction
+                elif throughput <= self._last_throughput * (1 + self._tolerance):
+                    self._direction = -1
+            self._last_throughput = throughput
+            if not congested and self._num_workers + self._direction < self._min_workers:
+                # probe one more worker at the lower bound, the throughput may have changed
+                self._direction = 1
+            self._num_workers = max(
+                min(self._num_workers + self._direction, self.max_workers), self._min_workers
+            )
+            self._reset_window()
+            self._condition.notify_all()
+
+    def _reset_window(self) -> None:
+        self._window_start = time.monotonic()
+        self._window_items = 0
+        self._window_latency = 0.0
+        self._window_requests = 0
+        self._window_timeouts = 0
@@ -0,0 +1,106 @@
+"""
+Delivery of the batch results to the user callback of a `weaviate.batch.Batch` in background
+threads.
+"""
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .requests import BatchResponse
+
+CALLBACK_DELIVERIES = ("ordered", "unordered")
+
+
+class _CallbackDispatcher:
+    """
+    Runs the user callback on dedicated consumer threads that drain a bounded queue, so a slow
+    callback does not block the threads sending the batch requests. The senders only block if the
+    queue is full.
+
+    With 'ordered' delivery one consumer thread calls the callback with the results in the order
+    they were received. With 'unordered' delivery `num_threads` consumers call it concurrently.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[BatchResponse], None],
+        delivery: str,
+        queue_size: int,
+        num_threads: int,
+        on_callback: Callable[[float], None],
+    ):
+        self._callback = callback
+        self._on_callback = on_callback
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._error: Optional[Exception] = None
+        self._threads: List[threading.Thread] = []
+        for _ in range(1 if delivery == "ordered" else num_threads):
+            demon = threading.Thread(target=self._consume, daemon=True, name="batchCallback")
+            demon.start()
+            self._threads.append(demon)
+
+    @property
+    def queue_length(self) -> int:
+        """
+        The number of results waiting for the callback.
+        """
+
+        return self._queue.qsize()
+
+    def submit(self, response: BatchResponse) -> float:
+        """
+        Queue a result for the callback, blocks while the queue is full.
+
+        Returns
+        -------
+        float
+            How long the call blocked in seconds.
+        """
+
+        start = time.perf_counter()
+        self._queue.put(response)
+        return time.perf_counter() - start
+
+    def join(self) -> None:
+        """
+        Block until the callback was called with every queued result and re-raise the first
+        exception of the callback, if any.
+        """
+
+        self._queue.join()
+        self.raise_error()
+
+    def raise_error(self) -> None:
+        """Re-raise an exception that occurred in the callback."""
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def shutdown(self) -> None:
+        """
+        Stop the consumer threads after the queued results were delivered.
+        """
+
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _consume(self) -> None:
+        while True:
+            response = self._queue.get()
+            if response is None:
+                self._queue.task_done()
+                return
+            start = time.perf_counter()
+            try:
+                self._callback(response)
+            except Exception as error:
+                if self._error is None:
+                    self._error = error
+            finally:
+                self._on_callback(time.perf_counter() - start)
+                self._queue.task_done()
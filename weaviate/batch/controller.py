@@ -0,0 +1,213 @@
+"""
+Batch size controllers used by the dynamic batching of `weaviate.batch.Batch`.
+"""
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from numbers import Real
+from typing import Deque, Dict, Optional
+
+from weaviate.util import _check_positive_num
+
+
+@dataclass(frozen=True)
+class BatchObservation:
+    """
+    The outcome of one batch request, given to a `BatchSizeController`.
+
+    Attributes
+    ----------
+    data_type : str
+        The type of the batch request, either 'objects' or 'references'.
+    num_items : int
+        The number of objects or references in the request.
+    latency : float
+        How long the request took in seconds. For a timed out request it is the read timeout.
+    num_bytes : int or None
+        The size of the request body in bytes, None if it is not known (e.g. gRPC requests).
+    timed_out : bool
+        Whether the request timed out.
+    queue_length : int or None
+        The last known length of the longest batch queue of the nodes of Weaviate, None if it
+        is not known.
+    """
+
+    data_type: str
+    num_items: int
+    latency: float
+    num_bytes: Optional[int]
+    timed_out: bool
+    queue_length: Optional[int]
+
+
+class BatchSizeController(ABC):
+    """
+    Interface of the controllers computing the number of objects and references per batch request
+    for dynamic batching, see `weaviate.batch.Batch.configure`. Subclass it and implement
+    `next_batch_size` to plug a custom strategy into the batch.
+
+    A controller is called from the threads sending the batches, implementations that keep state
+    must be thread-safe.
+    """
+
+    @abstractmethod
+    def next_batch_size(self, batch_size: int, observation: BatchObservation) -> int:
+        """
+        Compute the number of items for the next batch requests of `observation.data_type`.
+
+        Parameters
+        ----------
+        batch_size : int
+            The current number of items per batch request of that type.
+        observation : BatchObservation
+            The outcome of the last batch request.
+
+        Returns
+        -------
+        int
+            The new number of items per batch request, at least 1.
+        """
+
+
+class AIMDController(BatchSizeController):
+    """
+    Additive-increase/multiplicative-decrease controller. The batch size grows by `increase` items
+    after every successful request and shrinks by `decrease_factor` after a request that timed out,
+    took longer than `max_latency` or found more than `max_queue_length` items queued in Weaviate.
+    """
+
+    def __init__(
+        self,
+        increase: int = 25,
+        decrease_factor: float = 0.5,
+        max_latency: Optional[float] = None,
+        max_queue_length: Optional[int] = None,
+        max_batch_size: int = 10_000,
+    ):
+        """
+        Initialize an AIMDController class instance.
+
+        Parameters
+        ----------
+        increase : int, optional
+            The number of items added after a successful request, by default 25.
+        decrease_factor : float, optional
+            The factor applied to the batch size on congestion, in (0, 1), by default 0.5.
+        max_latency : float, optional
+            The latency in seconds above which a request counts as congested, by default None.
+        max_queue_length : int, optional
+            The batch queue length of Weaviate above which a request counts as congested, by
+            default None.
+        max_batch_size : int, optional
+            The upper bound of the batch size, by default 10000.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If an argument has a wrong value.
+        """
+
+        _check_positive_num(increase, "increase", int)
+        _check_positive_num(decrease_factor, "decrease_factor", Real)
+        if decrease_factor >= 1:
+            raise ValueError("'decrease_factor' must be smaller than 1.")
+        if max_latency is not None:
+            _check_positive_num(max_latency, "max_latency", Real)
+        if max_queue_length is not None:
+            _check_positive_num(max_queue_length, "max_queue_length", int)
+        _check_positive_num(max_batch_size, "max_batch_size", int)
+
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._max_latency = max_latency
+        self._max_queue_length = max_queue_length
+        self._max_batch_size = max_batch_size
+
+    def next_batch_size(self, batch_size: int, observation: BatchObservation) -> int:
+        congested = (
+            observation.timed_out
+            or (self._max_latency is not None and observation.latency > self._max_latency)
+            or (
+                self._max_queue_length is not None
+                and observation.queue_length is not None
+                and observation.queue_length > self._max_queue_length
+            )
+        )
+        if congested:
+            return max(math.floor(batch_size * self._decrease_factor), 1)
+        return min(batch_size + self._increase, self._max_batch_size)
+
+
+class LatencyTargetController(BatchSizeController):
+    """
+    Controller keeping the 95th percentile of the request latency at `target_latency`. It tracks
+    the time per item of the last `window` requests of each type and sizes the batches so that
+    the 95th percentile of that time multiplied by the batch size equals the target. The batch
+    size grows at most by `max_growth` per request, timeouts halve it.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 2,
+        window: int = 20,
+        max_growth: float = 1.5,
+        max_batch_size: int = 10_000,
+    ):
+        """
+        Initialize a LatencyTargetController class instance.
+
+        Parameters
+        ----------
+        target_latency : float, optional
+            The targeted 95th percentile of the request latency in seconds, by default 2.
+        window : int, optional
+            The number of requests per type the percentile is computed from, by default 20.
+        max_growth : float, optional
+            The maximal factor the batch size grows by per request, greater than 1, by default 1.5.
+        max_batch_size : int, optional
+            The upper bound of the batch size, by default 10000.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If an argument has a wrong value.
+        """
+
+        _check_positive_num(target_latency, "target_latency", Real)
+        _check_positive_num(window, "window", int)
+        _check_positive_num(max_growth, "max_growth", Real)
+        if max_growth <= 1:
+            raise ValueError("'max_growth' must be greater than 1.")
+        _check_positive_num(max_batch_size, "max_batch_size", int)
+
+        self._target_latency = float(target_latency)
+        self._window = window
+        self._max_growth = max_growth
+        self._max_batch_size = max_batch_size
+        self._seconds_per_item: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def next_batch_size(self, batch_size: int, observation: BatchObservation) -> int:
+        if observation.timed_out:
+            return max(batch_size // 2, 1)
+        if observation.num_items == 0:
+            return batch_size
+
+        with self._lock:
+            history = self._seconds_per_item.setdefault(
+                observation.data_type, deque(maxlen=self._window)
+            )
+            history.append(observation.latency / observation.num_items)
+            ordered = sorted(history)
+        p95 = ordered[min(math.ceil(len(ordered) * 0.95), len(ordered)) - 1]
+        if p95 <= 0:
+            target = self._max_batch_size
+        else:
+            target = math.floor(self._target_latency / p95)
+        return max(min(target, math.floor(batch_size * self._max_growth), self._max_batch_size), 1)
@@ -2,6 +2,8 @@
 Batch class definitions.
 """
 import datetime
+import json
+import queue
 import sys
 import threading
 import time
@@ -16,6 +18,7 @@ from typing import (
     Deque,
     Dict,
     List,
+    Mapping,
     Optional,
     Sequence,
     Set,
@@ -31,10 +34,26 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError as RequestsHTTPError
 
 from weaviate.connect import Connection
+from weaviate.connect.retry import _backoff_delay
 from weaviate.data.replication import ConsistencyLevel
 from weaviate.gql.filter import _find_value_type, VALUE_ARRAY_TYPES, WHERE_OPERATORS
 from weaviate.types import UUID
-from .requests import BatchRequest, ObjectsBatchRequest, ReferenceBatchRequest, BatchResponse
+from .requests import (
+    BatchRequest,
+    ObjectsBatchRequest,
+    ReferenceBatchRequest,
+    BatchResponse,
+    _get_property_schemas,
+)
+from .autoscaler import WorkerAutoscaler
+from .callbacks import CALLBACK_DELIVERIES, _CallbackDispatcher
+from .controller import BatchObservation, BatchSizeController
+from .dead_letters import DeadLetter, DeadLetterStore
+from .dependencies import _ReferenceDependencies
+from .rate_limiter import RateLimiter
+from .routing import NodeRouter
+from .spool import BatchSpool
+from .stats import BatchRequestEvent, BatchStats, _BatchMetrics, _RequestTimer
 from ..cluster import Cluster
 from ..error_msgs import (
     BATCH_REF_DEPRECATION_NEW_V14_CLS_NS_W,
@@ -48,11 +67,19 @@ from ..util import (
     _check_positive_num,
     _decode_json_response_dict,
     _decode_json_response_list,
+    get_valid_uuid,
 )
 from ..warnings import _Warnings
 
 BatchRequestType = Union[ObjectsBatchRequest, ReferenceBatchRequest]
 
+# retries wait between half and all of BASE * 2**retry seconds, at most MAX seconds
+_RETRY_BACKOFF_BASE = 2
+_RETRY_BACKOFF_MAX = 60
+
+# objects of a timed-out batch are fetched in chunks of this size
+_RECONCILIATION_CHUNK_SIZE = 500
+
 
 @dataclass
 class Shard:
@@ -129,6 +156,49 @@ class BatchExecutor(ThreadPoolExecutor):
         return self._shutdown
 
 
+class _BatchResponseList(Response):
+    """
+    Successful response of a batch request whose items are already a `BatchResponse`, e.g. the
+    converted reply of a gRPC call. `json()` returns the items without decoding them, the body is
+    only encoded if it is read.
+    """
+
+    def __init__(self, items: BatchResponse):
+        super().__init__()
+        self.status_code = 200
+        self._items = items
+
+    @property
+    def content(self) -> bytes:
+        if not isinstance(self._content, bytes):
+            self._content = json.dumps(self._items).encode()
+        return self._content
+
+    def json(self, **kwargs: Any) -> BatchResponse:
+        return self._items
+
+
+class _PartialBatchError(Exception):
+    """
+    Some nodes of a routed batch request failed with an exception, the others answered. `items`
+    are the merged responses of the nodes that answered, `batch_request` holds the items of the
+    nodes that failed.
+    """
+
+    def __init__(self, message: str, items: BatchResponse, batch_request: BatchRequest):
+        super().__init__(message)
+        self.items = items
+        self.batch_request = batch_request
+
+
+class _PartialReadTimeout(_PartialBatchError, ReadTimeout):
+    pass
+
+
+class _PartialConnectionError(_PartialBatchError, RequestsConnectionError):
+    pass
+
+
 class Batch:
     """
     Batch class used to add multiple objects or object references at once into weaviate.
@@ -283,11 +353,21 @@ class Batch:
         self._objects_throughput_frame: Deque[float] = deque(maxlen=5)
         self._references_throughput_frame: Deque[float] = deque(maxlen=5)
         self._future_pool: List[Future[Tuple[Union[Response, None], int]]] = []
-        self._reference_batch_queue: List[ReferenceBatchRequest] = []
+        # references are sent as soon as the objects they depend on were sent, also by the workers
+        self._reference_future_pool: List[Future[Tuple[Union[Response, None], int]]] = []
+        self._reference_future_pool_lock = threading.Lock()
+        self._dependencies = _ReferenceDependencies()
         self._callback_lock = threading.Lock()
+        # streaming mode, batch requests are sent by long-lived workers that drain this queue
+        self._send_queue: Optional[queue.Queue] = None
+        self._streaming_workers: List[threading.Thread] = []
+        self._streaming_error: Optional[Exception] = None
 
         # user configurable, need to be public should implement a setter/getter
         self._callback: Optional[Callable[[BatchResponse], None]] = check_batch_result
+        self._callback_delivery: Optional[str] = None
+        self._callback_queue_size = 100
+        self._callback_dispatcher: Optional[_CallbackDispatcher] = None
         self._weaviate_error_retry: Optional[WeaviateErrorRetryConf] = None
         self._batch_size: Optional[int] = 50
         self._creation_time = cast(Real, min(self._connection.timeout_config[1] / 10, 2))
@@ -301,6 +381,25 @@ class Batch:
 
         self._num_workers = 1
         self._consistency_level: Optional[ConsistencyLevel] = None
+        self._use_grpc = False
+        # class name -> property schemas, for the data types of the properties of gRPC batches
+        self._grpc_property_schemas: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._streaming = False
+        self._copy_objects = True
+        self._spool: Optional[BatchSpool] = None
+        self._dead_letters: Optional[DeadLetterStore] = None
+        self._batch_size_controller: Optional[BatchSizeController] = None
+        self._batch_size_controller_lock = threading.Lock()
+        self._server_queue_length: Optional[int] = None
+        # notified whenever the background thread updated the recommended number of objects
+        self._recommended_num_objects_changed = threading.Condition()
+        self._batch_size_thread: Optional[threading.Thread] = None
+        self._node_router: Optional[NodeRouter] = None
+        self._max_batch_bytes: Optional[int] = None
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._metrics = _BatchMetrics()
+        self._stats_listener: Optional[Callable[[BatchRequestEvent], None]] = None
+        self._worker_autoscaler: Optional[WorkerAutoscaler] = None
         # thread pool executor
         self._executor: Optional[BatchExecutor] = None
 
@@ -363,6 +462,19 @@ class Batch:
         dynamic: bool = True,
         num_workers: int = 1,
         consistency_level: Optional[ConsistencyLevel] = None,
+        use_grpc: bool = False,
+        streaming: bool = False,
+        copy_objects: bool = True,
+        spool: Optional[BatchSpool] = None,
+        dead_letters: Optional[DeadLetterStore] = None,
+        batch_size_controller: Optional[BatchSizeController] = None,
+        node_router: Optional[NodeRouter] = None,
+        max_batch_bytes: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        stats_listener: Optional[Callable[[BatchRequestEvent], None]] = None,
+        worker_autoscaler: Optional[WorkerAutoscaler] = None,
+        callback_delivery: Optional[str] = None,
+        callback_queue_size: int = 100,
     ) -> "Batch":
         """
         Warnings
@@ -400,6 +512,66 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        use_grpc : bool, optional
+            Whether to send objects through the gRPC `BatchObjects` call instead of the REST
+            endpoint. Only used if the client was created with a gRPC port
+            (`weaviate.Config(grpc_port_experimental=...)`), otherwise REST is used. References
+            are always sent through REST. By default False.
+        streaming : bool, optional
+            Whether to send batches with `num_workers` long-lived background workers. Full batches
+            are put into a queue that holds at most 2 * `num_workers` batches and the workers send
+            them continuously, so adding objects only blocks when this queue is full. References
+            are sent as soon as all objects that were added before them have been sent. `flush`
+            waits until the queue is drained. Only used for non-MANUAL batching. By default False.
+        copy_objects : bool, optional
+            Whether `add_data_object` stores a deep copy of each data object. If False the batch
+            takes ownership of the given dicts, which must not be changed after they were added.
+            This avoids the cost of copying objects with many or nested properties.
+            By default True.
+        spool : weaviate.BatchSpool, optional
+            A write-ahead spool that records every added object and reference until it was
+            created, so an import can be resumed with `resume_from_spool` after the process
+            died. By default None.
+        dead_letters : weaviate.DeadLetterStore, optional
+            A store for the objects and references that Weaviate returned an error for in the last
+            attempt (see `weaviate_error_retries`), they can be sent again with
+            `replay_dead_letters`. By default None.
+        batch_size_controller : weaviate.BatchSizeController, optional
+            The controller computing `recommended_num_objects` and `recommended_num_references`
+            from the outcome of every batch request, e.g. `weaviate.AIMDController` or
+            `weaviate.LatencyTargetController`. Only used for dynamic batching, `batch_size` is the
+            initial value. If None the batch size is derived from the batch queue of Weaviate or
+            the measured throughput. By default None.
+        node_router : weaviate.NodeRouter, optional
+            Sends the objects and references of each batch request directly to the nodes that
+            own their shards instead of the URL of the client. Not used for objects sent through
+            gRPC. By default None.
+        max_batch_bytes : int, optional
+            The maximal estimated size of the body of a batch request in bytes, in addition to
+            the number of items given by `batch_size` or dynamic batching. Batch requests are
+            created as soon as one of the limits is reached, an object or reference that is
+            larger on its own is sent alone. Only used for non-MANUAL batching. By default None.
+        rate_limiter : weaviate.RateLimiter, optional
+            Limits the objects and bytes sent per second, every batch request waits for it before
+            it is sent. Can be shared by several batches. By default None.
+        stats_listener : Optional[Callable[[weaviate.BatchRequestEvent], None]], optional
+            A function called with the metrics of every attempt to send a batch request, from the
+            thread that sent it. See `stats` for the aggregated metrics. By default None.
+        worker_autoscaler : weaviate.WorkerAutoscaler, optional
+            Adapts the number of concurrent batch requests to the measured throughput, between
+            its `min_workers` and `max_workers`, instead of using `num_workers`. Only used for
+            non-MANUAL batching. By default None.
+        callback_delivery : Optional[str], optional
+            How the `callback` is called. If None it is called by the thread that sent the batch
+            request, one call at a time. With 'ordered' it is called by a dedicated thread with
+            the results in the order they were received, with 'unordered' by as many threads as
+            there are workers at the same time, the callback must then be thread-safe. The
+            senders only wait for the callback if `callback_queue_size` results are pending, see
+            `stats`. `flush` waits for the pending results and re-raises an exception of the
+            callback. By default None.
+        callback_queue_size : int, optional
+            The maximal number of results waiting for the callback with `callback_delivery`,
+            by default 100.
 
         Returns
         -------
@@ -414,6 +586,41 @@ class Batch:
             If the value of one of the arguments is wrong.
         """
         self.consistency_level = consistency_level
+        self.use_grpc = use_grpc
+        self.copy_objects = copy_objects
+        if spool is not None and not isinstance(spool, BatchSpool):
+            raise TypeError(f"'spool' must be of type {BatchSpool}. Given type: {type(spool)}.")
+        self._spool = spool
+        if dead_letters is not None and not isinstance(dead_letters, DeadLetterStore):
+            raise TypeError(
+                f"'dead_letters' must be of type {DeadLetterStore}. Given type: {type(dead_letters)}."
+            )
+        self._dead_letters = dead_letters
+        if batch_size_controller is not None and not isinstance(
+            batch_size_controller, BatchSizeController
+        ):
+            raise TypeError(
+                f"'batch_size_controller' must be of type {BatchSizeController}. "
+                f"Given type: {type(batch_size_controller)}."
+            )
+        self._batch_size_controller = batch_size_controller
+        if node_router is not None and not isinstance(node_router, NodeRouter):
+            raise TypeError(
+                f"'node_router' must be of type {NodeRouter}. Given type: {type(node_router)}."
+            )
+        self._node_router = node_router
+        self.max_batch_bytes = max_batch_bytes
+        if rate_limiter is not None and not isinstance(rate_limiter, RateLimiter):
+            raise TypeError(
+                f"'rate_limiter' must be of type {RateLimiter}. Given type: {type(rate_limiter)}."
+            )
+        self._rate_limiter = rate_limiter
+        self._stats_listener = stats_listener
+        if worker_autoscaler is not None and not isinstance(worker_autoscaler, WorkerAutoscaler):
+            raise TypeError(
+                f"'worker_autoscaler' must be of type {WorkerAutoscaler}. "
+                f"Given type: {type(worker_autoscaler)}."
+            )
         if creation_time is not None:
             _check_positive_num(creation_time, "creation_time", Real)
             self._creation_time = creation_time
@@ -423,7 +630,22 @@ class Batch:
         _check_non_negative(timeout_retries, "timeout_retries", int)
         _check_non_negative(connection_error_retries, "connection_error_retries", int)
 
+        if callback_delivery is not None and callback_delivery not in CALLBACK_DELIVERIES:
+            raise ValueError(
+                f"'callback_delivery' must be one of {CALLBACK_DELIVERIES} or None. "
+                f"Given value: {callback_delivery}."
+            )
+        _check_positive_num(callback_queue_size, "callback_queue_size", int)
+        if (
+            self._callback is not callback
+            or self._callback_delivery != callback_delivery
+            or self._callback_queue_size != callback_queue_size
+        ):
+            self._stop_callback_dispatcher()
         self._callback = callback
+        self._callback_delivery = callback_delivery
+        self._callback_queue_size = callback_queue_size
+        self._start_callback_dispatcher()
 
         self._timeout_retries = timeout_retries
         self._connection_error_retries = connection_error_retries
@@ -437,11 +659,18 @@ class Batch:
         _check_positive_num(batch_size, "batch_size", int)
         _check_positive_num(num_workers, "num_workers", int)
         _check_bool(dynamic, "dynamic")
+        _check_bool(streaming, "streaming")
 
-        if self._num_workers != num_workers:
+        if (
+            self._num_workers != num_workers
+            or self._streaming != streaming
+            or self._worker_autoscaler is not worker_autoscaler
+        ):
             self.flush()
             self.shutdown()
             self._num_workers = num_workers
+            self._streaming = streaming
+            self._worker_autoscaler = worker_autoscaler
             self.start()
 
         self._batch_size = batch_size
@@ -450,7 +679,7 @@ class Batch:
             self._batching_type = "fixed"
         else:  # else set to 'dynamic'
             self._batching_type = "dynamic"
-            self._recommended_num_objects = 50 if batch_size is None else batch_size
+            self._set_recommended_num_objects(50 if batch_size is None else batch_size)
             self._recommended_num_references = 50 if batch_size is None else batch_size
             if self._shutdown_background_event is None:
                 self._update_recommended_batch_size()
@@ -462,46 +691,65 @@ class Batch:
         """Create a background thread that periodically checks how congested the batch queue is."""
         self._shutdown_background_event = threading.Event()
 
+        shutdown_event = self._shutdown_background_event
+
         def periodic_check() -> None:
+            try:
+                refresh_recommended_num_objects()
+            finally:
+                # wake up the producers waiting for sending to resume, also if the thread failed
+                if self._recommended_num_objects == 0:
+                    self._set_recommended_num_objects(10)
+
+        def refresh_recommended_num_objects() -> None:
             cluster = Cluster(self._connection)
-            while (
-                self._shutdown_background_event is not None
-                and not self._shutdown_background_event.is_set()
-            ):
+            while not shutdown_event.is_set():
                 try:
-                    status = cluster.get_nodes_status()
-                    if "stats" not in status[0] or "ratePerSecond" not in status[0]["stats"]:
+                    stats = _get_cluster_batch_stats(cluster.get_nodes_status())
+                    if stats is None:
                         self._new_dynamic_batching = False
+                        self._set_recommended_num_objects(self._recommended_num_objects)
                         return
-                    rate = status[0]["batchStats"]["ratePerSecond"]
-                    rate_per_worker = rate / self._num_workers
-                    batch_length = status[0]["batchStats"]["queueLength"]
-
-                    if batch_length == 0:  # scale up if queue is empty
-                        self._recommended_num_objects = self._recommended_num_objects + min(
-                            self._recommended_num_objects * 2, 25
-                        )
+                    rate_per_worker = stats.rate_per_second / self._get_num_workers()
+                    self._server_queue_length = stats.queue_length
+
+                    if self._batch_size_controller is not None:
+                        pass  # the controller sizes the batches, it only needs the queue length
+                    elif stats.queue_length == 0:  # scale up if all queues are empty
+                        # start from 1 again if sending was stopped because of a long queue
+                        recommended = max(self._recommended_num_objects, 1)
+                        self._set_recommended_num_objects(recommended + min(recommended * 2, 25))
                     else:
-                        ratio = batch_length / rate
+                        ratio = stats.ratio
                         if (
                             2.1 > ratio > 1.9
                         ):  # ideal, send exactly as many objects as weaviate can process
-                            self._recommended_num_objects = rate_per_worker
+                            self._set_recommended_num_objects(round(rate_per_worker))
                         elif ratio <= 1.9:  # we can send more
-                            self._recommended_num_objects = min(
-                                self._recommended_num_objects * 1.5, rate_per_worker * 2 / ratio
+                            self._set_recommended_num_objects(
+                                round(
+                                    min(
+                                        self._recommended_num_objects * 1.5,
+                                        rate_per_worker * 2 / ratio,
+                                    )
+                                )
                             )
                         elif ratio < 10:  # too high, scale down
-                            self._recommended_num_objects = rate_per_worker * 2 / ratio
+                            self._set_recommended_num_objects(round(rate_per_worker * 2 / ratio))
                         else:  # way too high, stop sending new batches
-                            self._recommended_num_objects = 0
+                            self._set_recommended_num_objects(0)
 
-                    refresh_time: float = 2
+                    # check more often while sending is stopped, to resume as soon as possible
+                    refresh_time: float = 2 if self._recommended_num_objects > 0 else 0.5
                 except (RequestsHTTPError, ReadTimeout):
                     refresh_time = 0.1
+                except RequestsConnectionError:
+                    refresh_time = 1
 
-                time.sleep(refresh_time)
-            self._recommended_num_objects = 10  # in case some batch needs to be send afterwards
+                # returns right away on shutdown
+                shutdown_event.wait(refresh_time)
+            # in case some batch needs to be send afterwards
+            self._set_recommended_num_objects(10)
             self._shutdown_background_event = None
 
         demon = threading.Thread(
@@ -510,6 +758,14 @@ class Batch:
             name="batchSizeRefresh",
         )
         demon.start()
+        self._batch_size_thread = demon
+
+    def _set_recommended_num_objects(self, value: int) -> None:
+        """Set the recommended number of objects and wake up producers waiting for it."""
+
+        with self._recommended_num_objects_changed:
+            self._recommended_num_objects = value
+            self._recommended_num_objects_changed.notify_all()
 
     def add_data_object(
         self,
@@ -561,7 +817,10 @@ class Batch:
             uuid=uuid,
             vector=vector,
             tenant=tenant,
+            copy_object=self._copy_objects,
         )
+        if self._spool is not None:
+            self._spool.append("objects", self._objects_batch._items[-1:])
 
         self.__imported_shards.add(Shard(class_name, tenant))
 
@@ -570,6 +829,107 @@ class Batch:
 
         return uuid
 
+    def add_data_objects_columnar(
+        self,
+        class_name: str,
+        columns: Mapping[str, Sequence],
+        vectors: Optional[Sequence] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenant: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Add many objects of the same class to this batch, given as one sequence of values per
+        property. The columns and vectors are sliced per batch request and each slice is converted
+        with a single `tolist` call, instead of converting every object on its own.
+        NOTE: If the UUID of one of the objects already exists then the existing object will be
+        replaced by the new object.
+
+        Parameters
+        ----------
+        class_name : str
+            The name of the class the objects belong to.
+        columns : Mapping[str, Sequence]
+            The property values, one sequence (e.g. `list`, `numpy.ndarray` or `pandas.Series`)
+            per property name. The n-th object gets the n-th value of every sequence.
+        vectors : Sequence or None, optional
+            The embeddings of the objects as a 2-D `numpy.ndarray`, `torch.Tensor` or a list of
+            vectors, one row per object, by default None.
+        uuids : Sequence or None, optional
+            The UUIDs of the objects. If None UUIDv4s will be generated, by default None.
+        tenant: str, optional
+            Tenant of the objects.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the added objects.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If the columns, vectors and uuids have different lengths or an 'uuid' is not of a
+            proper form.
+
+        Examples
+        --------
+        >>> client.batch.add_data_objects_columnar(
+        ...     "Article",
+        ...     columns={"title": titles, "wordCount": word_counts},
+        ...     vectors=embeddings,  # numpy.ndarray of shape (len(titles), dim)
+        ... )
+        """
+
+        lengths = {len(column) for column in columns.values()}
+        if vectors is not None:
+            lengths.add(len(vectors))
+        if uuids is not None:
+            lengths.add(len(uuids))
+        if len(lengths) > 1:
+            raise ValueError("All columns, vectors and uuids must have the same length.")
+        num_objects = lengths.pop() if len(lengths) > 0 else 0
+
+        added_uuids: List[str] = []
+        start = 0
+        while start < num_objects:
+            stop = num_objects
+            if self._batching_type:
+                stop = min(num_objects, start + self._num_objects_until_auto_create())
+            added_uuids.extend(
+                self._objects_batch.add_columns(
+                    class_name=_capitalize_first_letter(class_name),
+                    columns={name: column[start:stop] for name, column in columns.items()},
+                    vectors=vectors[start:stop] if vectors is not None else None,
+                    uuids=uuids[start:stop] if uuids is not None else None,
+                    tenant=tenant,
+                )
+            )
+            if self._spool is not None:
+                self._spool.append("objects", self._objects_batch._items[-(stop - start) :])
+            if self._batching_type:
+                self._auto_create()
+            start = stop
+
+        self.__imported_shards.add(Shard(class_name, tenant))
+        return added_uuids
+
+    def _num_objects_until_auto_create(self) -> int:
+        """
+        Get how many objects can be added before the batch is auto-created.
+
+        Returns
+        -------
+        int
+            The number of objects, at least 1.
+        """
+
+        if self._batching_type == "fixed":
+            assert self._batch_size is not None
+            return max(self._batch_size - sum(self.shape), 1)
+        assert self._recommended_num_objects is not None
+        return max(int(self._recommended_num_objects) - self.num_objects(), 1)
+
     def add_reference(
         self,
         from_object_uuid: UUID,
@@ -612,29 +972,9 @@ class Batch:
             If 'uuid' is not valid or cannot be extracted.
         """
 
-        is_server_version_14 = self._connection.server_version >= "1.14"
-
-        if to_object_class_name is None and is_server_version_14:
-            warnings.warn(
-                message=BATCH_REF_DEPRECATION_NEW_V14_CLS_NS_W,
-                category=DeprecationWarning,
-                stacklevel=1,
-            )
-        if to_object_class_name is not None:
-            if not is_server_version_14:
-                warnings.warn(
-                    message=BATCH_REF_DEPRECATION_OLD_V14_CLS_NS_W,
-                    category=DeprecationWarning,
-                    stacklevel=1,
-                )
-                to_object_class_name = None
-            if is_server_version_14:
-                if not isinstance(to_object_class_name, str):
-                    raise TypeError(
-                        "'to_object_class_name' must be of type str or None. "
-                        f"Given type: {type(to_object_class_name)}"
-                    )
-                to_object_class_name = _capitalize_first_letter(to_object_class_name)
+        to_object_class_name = _get_to_object_class_name(
+            self._connection.server_version, to_object_class_name
+        )
 
         self._reference_batch.add(
             from_object_class_name=_capitalize_first_letter(from_object_class_name),
@@ -644,6 +984,8 @@ class Batch:
             to_object_class_name=to_object_class_name,
             tenant=tenant,
         )
+        if self._spool is not None:
+            self._spool.append("references", self._reference_batch._items[-1:])
 
         if self._batching_type:
             self._auto_create()
@@ -685,58 +1027,145 @@ class Batch:
         params: Dict[str, str] = {}
         if self._consistency_level is not None:
             params["consistency_level"] = self._consistency_level.value
-
+        if self._spool is not None:
+            self._spool.sync()
+        # retries replace batch_request, the spool acknowledges the items that were added
+        spooled_items = batch_request._items
+
+        self._metrics.start_request()
+        # responses of the nodes that answered a routed request whose other nodes failed
+        completed: BatchResponse = []
         try:
-            timeout_count = connection_count = batch_error_count = 0
+            timeout_count = connection_count = batch_error_count = attempt = 0
             while True:
-                try:
-                    response = self._connection.post(
-                        path="/batch/" + data_type,
-                        weaviate_object=batch_request.get_request_body(),
-                        params=params,
+                attempt += 1
+                throttle_time = 0.0
+                if self._rate_limiter is not None:
+                    throttle_time = self._rate_limiter.acquire(
+                        len(batch_request),
+                        (
+                            0
+                            if self._rate_limiter.bytes_per_second is None
+                            else batch_request._get_num_bytes()
+                        ),
                     )
+                timer = _RequestTimer()
+                # only the attempts take a slot of the autoscaler, the backoff between them does not
+                if self._worker_autoscaler is not None:
+                    self._worker_autoscaler._acquire()
+                start = time.perf_counter()
+                try:
+                    try:
+                        response = self._send_batch_request(data_type, batch_request, params, timer)
+                    finally:
+                        if self._worker_autoscaler is not None:
+                            self._worker_autoscaler._release()
                 except ReadTimeout as error:
+                    self._record_batch_request(
+                        data_type,
+                        len(batch_request),
+                        timer,
+                        start,
+                        throttle_time,
+                        attempt,
+                        "timeout",
+                    )
+                    self._observe_batch_request(
+                        data_type,
+                        num_items=len(batch_request),
+                        latency=self._connection.timeout_config[1],
+                        num_bytes=None,
+                        timed_out=True,
+                    )
                     _batch_create_error_handler(
                         retry=timeout_count,
                         max_retries=self._timeout_retries,
                         error=error,
                     )
                     timeout_count += 1
+                    self._metrics.add_retry("timeout")
+                    if isinstance(error, _PartialBatchError):
+                        completed.extend(error.items)
+                        batch_request = error.batch_request
                     batch_request = self._batch_retry_after_timeout(data_type, batch_request)
                     # All elements have been added successfully. The timeout occurred while receiving the answer.
                     if len(batch_request) == 0:
-                        response = Response()
-                        response.status_code = 200
+                        if len(completed) == 0:
+                            response = Response()
+                            response.status_code = 200
+                            response.elapsed = datetime.timedelta(
+                                self._connection.timeout_config[1] + 5
+                            )
+                            break
+                        # the items of the nodes that answered are handled like a response
+                        response = _BatchResponseList(completed)
                         response.elapsed = datetime.timedelta(
                             self._connection.timeout_config[1] + 5
                         )
-                        break
+                        batch_to_retry = self._handle_batch_response(
+                            data_type, completed, batch_error_count
+                        )
+                        completed = []
+                        if batch_to_retry is None:
+                            break
+                        batch_error_count += 1
+                        self._metrics.add_retry("weaviate_error")
+                        batch_request = batch_to_retry
 
                 except RequestsConnectionError as error:
+                    self._record_batch_request(
+                        data_type,
+                        len(batch_request),
+                        timer,
+                        start,
+                        throttle_time,
+                        attempt,
+                        "connection_error",
+                    )
                     _batch_create_error_handler(
                         retry=connection_count,
                         max_retries=self._connection_error_retries,
                         error=error,
                     )
                     connection_count += 1
+                    self._metrics.add_retry("connection_error")
+                    if isinstance(error, _PartialBatchError):
+                        completed.extend(error.items)
+                        batch_request = error.batch_request
                 else:
+                    self._record_batch_request(
+                        data_type,
+                        len(batch_request),
+                        timer,
+                        start,
+                        throttle_time,
+                        attempt,
+                        "success" if response.status_code == 200 else "status_code",
+                        response.status_code,
+                    )
+                    self._observe_batch_request(
+                        data_type,
+                        num_items=len(batch_request),
+                        latency=response.elapsed.total_seconds(),
+                        num_bytes=_get_request_body_size(response),
+                        timed_out=False,
+                    )
                     response_json = _decode_json_response_list(response, "batch response")
                     assert response_json is not None
-                    if (
-                        self._weaviate_error_retry is not None
-                        and batch_error_count < self._weaviate_error_retry.number_retries
-                    ):
-                        batch_to_retry, response_json_successful = self._retry_on_error(
-                            response_json, data_type
-                        )
-                        if len(batch_to_retry) > 0:
-                            self._run_callback(response_json_successful)
-
-                            batch_error_count += 1
-                            batch_request = batch_to_retry
-                            continue  # run the request again, but only with objects that had errors
-
-                    self._run_callback(response_json)
+                    if len(completed) > 0:
+                        response_json = completed + response_json
+                        completed = []
+                        elapsed = response.elapsed
+                        response = _BatchResponseList(response_json)
+                        response.elapsed = elapsed
+                    batch_to_retry = self._handle_batch_response(
+                        data_type, response_json, batch_error_count
+                    )
+                    if batch_to_retry is not None:
+                        batch_error_count += 1
+                        self._metrics.add_retry("weaviate_error")
+                        batch_request = batch_to_retry
+                        continue  # run the request again, but only with objects that had errors
                     break
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Batch was not added to weaviate.") from conn_err
@@ -748,16 +1177,445 @@ class Batch:
                 "Aim to on average complete batch request within less than 10s"
             )
             raise ReadTimeout(message) from None
+        finally:
+            self._metrics.finish_request()
+            self._metrics.add_recommended_sizes(
+                self._recommended_num_objects, self._recommended_num_references
+            )
         if response.status_code == 200:
+            if self._spool is not None:
+                self._spool.ack(spooled_items)
             return response
         raise UnexpectedStatusCodeException(f"Create {data_type} in batch", response)
 
+    def _send_batch_request(
+        self,
+        data_type: str,
+        batch_request: BatchRequest,
+        params: Dict[str, str],
+        timer: _RequestTimer,
+    ) -> Response:
+        """Send one attempt of a batch request through gRPC or REST."""
+
+        if data_type == "objects" and self._use_grpc and self._connection.grpc_stub is not None:
+            assert isinstance(batch_request, ObjectsBatchRequest)
+            return self._create_objects_grpc(batch_request, params)
+        return self._post_batch_request(data_type, batch_request, params, timer)
+
+    def _handle_batch_response(
+        self, data_type: str, response_json: BatchResponse, batch_error_count: int
+    ) -> Optional[BatchRequestType]:
+        """
+        Pass the items of a batch response to the callback and the failed ones to the dead letters,
+        except the failed items that are retried with `weaviate_error_retries`.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of the batch request, either 'objects' or 'references'.
+        response_json : BatchResponse
+            The items of the response.
+        batch_error_count : int
+            How often the items with errors were retried so far.
+
+        Returns
+        -------
+        Optional[BatchRequestType]
+            The items to send again, None if no item is retried.
+        """
+
+        if (
+            self._weaviate_error_retry is not None
+            and batch_error_count < self._weaviate_error_retry.number_retries
+        ):
+            batch_to_retry, response_json_successful = self._retry_on_error(
+                response_json, data_type
+            )
+            if len(batch_to_retry) > 0:
+                self._run_callback(response_json_successful)
+                # items with errors that are not retried failed for good
+                if self._dead_letters is not None:
+                    self._dead_letters._add_from_response(
+                        data_type, response_json_successful, attempts=batch_error_count + 1
+                    )
+                return batch_to_retry
+
+        self._run_callback(response_json)
+        if self._dead_letters is not None:
+            self._dead_letters._add_from_response(
+                data_type, response_json, attempts=batch_error_count + 1
+            )
+        return None
+
+    def _create_objects_grpc(
+        self, batch_request: ObjectsBatchRequest, params: Dict[str, str]
+    ) -> Response:
+        """
+        Create objects through the gRPC `BatchObjects` call. The reply is converted into a
+        `requests.Response` that has the same shape as the one of the REST batch endpoint, so the
+        rest of the batch machinery (retries, callbacks, throughput) does not need to know which
+        protocol was used. Vectors are echoed back only for objects that failed.
+
+        Parameters
+        ----------
+        batch_request : ObjectsBatchRequest
+            Contains all the data objects that should be added in one batch.
+        params : Dict[str, str]
+            The REST request parameters, used if weaviate does not support gRPC batching.
+
+        Returns
+        -------
+        requests.Response
+            The converted response.
+
+        Raises
+        ------
+        requests.ReadTimeout
+            If the request time-outed.
+        requests.ConnectionError
+            If the gRPC server is not reachable.
+        """
+        import grpc  # type: ignore
+
+        metadata: Tuple[Tuple[str, str], ...] = ()
+        access_token = self._connection.get_current_bearer_token()
+        if len(access_token) > 0:
+            metadata = (("authorization", access_token),)
+
+        start = time.time()
+        response: Response
+        try:
+            reply, _ = self._connection.grpc_stub.BatchObjects.with_call(  # type: ignore
+                batch_request.get_grpc_request_body(
+                    self.consistency_level, self._get_grpc_property_schemas(batch_request)
+                ),
+                metadata=metadata,
+                timeout=self._connection.timeout_config[1],
+            )
+        except grpc.RpcError as error:
+            code = error.code()
+            if code == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise ReadTimeout(error.details()) from error
+            if code == grpc.StatusCode.UNAVAILABLE:
+                raise RequestsConnectionError(error.details()) from error
+            if code == grpc.StatusCode.UNIMPLEMENTED:
+                # weaviate does not support batching through gRPC, fall back to REST for good
+                self._use_grpc = False
+                return self._connection.post(
+                    path="/batch/objects",
+                    weaviate_object=batch_request.get_request_body(),
+                    params=params,
+                )
+            response = Response()
+            response.status_code = {
+                grpc.StatusCode.INVALID_ARGUMENT: 422,
+                grpc.StatusCode.UNAUTHENTICATED: 401,
+                grpc.StatusCode.PERMISSION_DENIED: 403,
+            }.get(code, 500)
+            response._content = json.dumps({"error": [{"message": error.details()}]}).encode()
+        else:
+            response = _BatchResponseList(batch_request.get_grpc_response(reply))
+        response.elapsed = datetime.timedelta(seconds=time.time() - start)
+        return response
+
+    def _get_grpc_property_schemas(
+        self, batch_request: ObjectsBatchRequest
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the property schemas of the classes of the batch, the schema of every class is read
+        once. Classes that do not exist yet (auto-schema) are read again with the next batch.
+
+        Parameters
+        ----------
+        batch_request : ObjectsBatchRequest
+            The batch to get the property schemas for.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Dict[str, Any]]]
+            The property schemas by class name, see `_get_property_schemas`.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        """
+
+        class_names = {obj["class"] for obj in batch_request.get_request_body()["objects"]}
+        for class_name in class_names - self._grpc_property_schemas.keys():
+            response = self._connection.get(path="/schema/" + class_name)
+            if response.status_code != 200:
+                continue
+            class_schema = _decode_json_response_dict(response, "Get class schema")
+            assert class_schema is not None
+            self._grpc_property_schemas[class_name] = _get_property_schemas(
+                class_schema.get("properties", None) or []
+            )
+        return self._grpc_property_schemas
+
+    def _post_batch_request(
+        self,
+        data_type: str,
+        batch_request: BatchRequest,
+        params: Dict[str, str],
+        timer: _RequestTimer,
+    ) -> Response:
+        """
+        Send a batch request through REST. With a node router the items are sent to the nodes
+        owning their shards, one request per node, and the responses are merged into one.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of the batch request, either 'objects' or 'references'.
+        batch_request : BatchRequest
+            Contains all the items that should be added in one batch.
+        params : Dict[str, str]
+            The request parameters.
+        timer : _RequestTimer
+            Records the time spent encoding the request bodies and their size.
+
+        Returns
+        -------
+        requests.Response
+            The response, or the merged response of all nodes.
+
+        Raises
+        ------
+        requests.ReadTimeout
+            If a request time-outed.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        """
+
+        path = "/batch/" + data_type
+        router = self._node_router
+        if router is None or len(batch_request) == 0:
+            return self._connection.post(
+                path=path,
+                weaviate_object=self._encode_batch_request(batch_request, timer),
+                params=params,
+            )
+        groups = router._split(data_type, batch_request, self._connection)
+        if len(groups) == 1:
+            url, node_request = groups[0]
+            return self._post_node_request(
+                path, url, self._encode_batch_request(node_request, timer), params
+            )
+
+        # the nodes are sent their items concurrently, so the latency is the one of the slowest
+        bodies = [self._encode_batch_request(node_request, timer) for _, node_request in groups]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=len(groups), thread_name_prefix="batchNodeRequest"
+        ) as executor:
+            futures = [
+                executor.submit(self._post_node_request, path, url, body, params)
+                for (url, _), body in zip(groups, bodies)
+            ]
+        outcomes: List[Union[Response, Exception]] = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except (ReadTimeout, RequestsConnectionError) as error:
+                outcomes.append(error)
+
+        responses = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, Response) and outcome.status_code == 200
+        ]
+        if len(responses) == 0:
+            # no node created any item, handled like the response of a single request
+            if isinstance(outcomes[0], Exception):
+                raise outcomes[0]
+            return outcomes[0]
+
+        items: BatchResponse = []
+        failed_request = type(batch_request)()
+        timed_out = False
+        for (_, node_request), outcome in zip(groups, outcomes):
+            if isinstance(outcome, Exception):
+                # sent again by the caller, like the items of a single request that failed
+                failed_request._items.extend(node_request._items)
+                timed_out = timed_out or isinstance(outcome, ReadTimeout)
+            elif outcome.status_code == 200:
+                items.extend(outcome.json())
+            else:
+                # the items of a node that answered with an error are returned as failed items, so
+                # they are retried, passed to the callback and to the dead letters like the items
+                # Weaviate rejected
+                message = f"Batch request to a node failed with status code {outcome.status_code}"
+                items.extend(
+                    {**item, "result": {"errors": {"error": [{"message": message}]}}}
+                    for item in node_request._items
+                )
+
+        if len(failed_request) > 0:
+            error_class = _PartialReadTimeout if timed_out else _PartialConnectionError
+            raise error_class(
+                f"{len(failed_request)} of {len(batch_request)} items could not be sent to their node.",
+                items,
+                failed_request,
+            )
+        merged = Response()
+        merged.status_code = 200
+        merged._content = self._connection.json_codec.encode(items)
+        merged.elapsed = datetime.timedelta(seconds=time.perf_counter() - start)
+        return merged
+
+    def _post_node_request(
+        self, path: str, url: Optional[str], body: bytes, params: Dict[str, str]
+    ) -> Response:
+        """Send the items of one node, falling back to the URL of the client if the node is gone."""
+
+        try:
+            return self._connection.post(
+                path=path, weaviate_object=body, params=params, base_url=url
+            )
+        except RequestsConnectionError:
+            if url is None:
+                raise
+            # the node is gone, the URL of the client forwards the items to the new owners
+            assert self._node_router is not None
+            self._node_router._invalidate()
+            return self._connection.post(path=path, weaviate_object=body, params=params)
+
+    def _encode_batch_request(self, batch_request: BatchRequest, timer: _RequestTimer) -> bytes:
+        """Encode the body of a batch request with the codec of the connection, timing it."""
+
+        start = time.perf_counter()
+        body = self._connection.json_codec.encode(batch_request.get_request_body())
+        timer.add_body(time.perf_counter() - start, len(body))
+        return body
+
+    def _record_batch_request(
+        self,
+        data_type: str,
+        num_items: int,
+        timer: _RequestTimer,
+        start: float,
+        throttle_time: float,
+        attempt: int,
+        outcome: str,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """
+        Add the metrics of one attempt to send a batch request and pass them to the stats listener.
+        """
+
+        event = BatchRequestEvent(
+            data_type=data_type,
+            num_items=num_items,
+            num_bytes=timer.num_bytes,
+            serialization_time=timer.serialization_time,
+            network_time=max(time.perf_counter() - start - timer.serialization_time, 0.0),
+            throttle_time=throttle_time,
+            outcome=outcome,
+            status_code=status_code,
+            attempt=attempt,
+            timestamp=time.time(),
+        )
+        self._metrics.add_event(event)
+        if self._worker_autoscaler is not None:
+            self._worker_autoscaler._observe(
+                num_items if outcome == "success" else 0,
+                event.network_time,
+                timed_out=outcome == "timeout",
+            )
+        if self._stats_listener is not None:
+            self._stats_listener(event)
+
+    def _observe_batch_request(
+        self,
+        data_type: str,
+        num_items: int,
+        latency: float,
+        num_bytes: Optional[int],
+        timed_out: bool,
+    ) -> None:
+        """
+        Update the recommended batch size of `data_type` with the batch size controller, if one is
+        configured and dynamic batching is used.
+        """
+
+        if self._batch_size_controller is None or self._batching_type != "dynamic":
+            return
+        observation = BatchObservation(
+            data_type=data_type,
+            num_items=num_items,
+            latency=latency,
+            num_bytes=num_bytes,
+            timed_out=timed_out,
+            queue_length=self._server_queue_length,
+        )
+        with self._batch_size_controller_lock:
+            if data_type == "objects":
+                self._set_recommended_num_objects(
+                    self._batch_size_controller.next_batch_size(
+                        int(self._recommended_num_objects), observation
+                    )
+                )
+            else:
+                self._recommended_num_references = self._batch_size_controller.next_batch_size(
+                    int(self._recommended_num_references), observation
+                )
+
+    def _get_num_workers(self) -> int:
+        """
+        The number of batch requests to send concurrently, set by the autoscaler if there is one.
+        """
+
+        if self._worker_autoscaler is not None:
+            return self._worker_autoscaler.num_workers
+        return self._num_workers
+
+    def _get_max_num_workers(self) -> int:
+        """
+        The highest number of batch requests sent concurrently, the size of the thread pool.
+        """
+
+        if self._worker_autoscaler is not None:
+            return self._worker_autoscaler.max_workers
+        return self._num_workers
+
     def _run_callback(self, response: BatchResponse) -> None:
         if self._callback is None:
             return
+        dispatcher = self._callback_dispatcher
+        if dispatcher is not None:
+            self._metrics.add_callback(0.0, wait_time=dispatcher.submit(response))
+            return
         # We don't know if user-supplied functions are threadsafe
         with self._callback_lock:
-            self._callback(response)
+            start = time.perf_counter()
+            try:
+                self._callback(response)
+            finally:
+                self._metrics.add_callback(time.perf_counter() - start)
+
+    def _start_callback_dispatcher(self) -> None:
+        """Start the threads calling the callback, if it is not called by the senders."""
+
+        if (
+            self._callback_dispatcher is None
+            and self._callback is not None
+            and self._callback_delivery is not None
+        ):
+            self._callback_dispatcher = _CallbackDispatcher(
+                self._callback,
+                self._callback_delivery,
+                self._callback_queue_size,
+                self._get_max_num_workers(),
+                on_callback=self._metrics.add_callback,
+            )
+
+    def _stop_callback_dispatcher(self) -> None:
+        """Stop the threads calling the callback after the pending results were delivered."""
+
+        if self._callback_dispatcher is not None:
+            dispatcher, self._callback_dispatcher = self._callback_dispatcher, None
+            dispatcher.shutdown()
 
     def _batch_retry_after_timeout(
         self, data_type: str, batch_request: BatchRequest
@@ -791,6 +1649,12 @@ class Batch:
         """
         Read all objects that were not created or updated because of a TimeOut error.
 
+        The objects are fetched in bulk, with one GraphQL query per class, tenant and chunk of UUIDs,
+        and compared in memory to the batch items. Missing objects and objects that differ from the
+        batch item are re-added. Objects are also re-added if they cannot be compared, e.g. because
+        of cross-references or nested properties, or if the query failed. Re-adding an object with
+        its UUID overwrites it, so this is always safe.
+
         Parameters
         ----------
         batch_request : ObjectsBatchRequest
@@ -802,40 +1666,90 @@ class Batch:
             New ObjectsBatchRequest with only the objects that were not created or updated.
         """
 
+        objects = batch_request.get_request_body()["objects"]
+        groups: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {}
+        for obj in objects:
+            if _get_property_fields(obj["properties"]) is not None:
+                groups.setdefault((obj["class"], obj.get("tenant", None)), []).append(obj)
+
+        up_to_date: Set[str] = set()
+        for (class_name, tenant), group in groups.items():
+            for i in range(0, len(group), _RECONCILIATION_CHUNK_SIZE):
+                chunk = group[i : i + _RECONCILIATION_CHUNK_SIZE]
+                existing = self._get_existing_objects(class_name, tenant, chunk)
+                if existing is None:
+                    continue
+                up_to_date.update(
+                    obj["id"]
+                    for obj in chunk
+                    if obj["id"] in existing and _is_object_up_to_date(obj, existing[obj["id"]])
+                )
+
         new_batch = ObjectsBatchRequest()
-        for obj in batch_request.get_request_body()["objects"]:
-            class_name = obj["class"]
-            uuid = obj["id"]
-            response_head = self._connection.head(
-                path="/objects/" + class_name + "/" + uuid,
+        for obj in objects:
+            if obj["id"] in up_to_date:
+                continue
+            # the timed-out batch is discarded, so the properties do not need to be copied
+            new_batch.add(
+                class_name=_capitalize_first_letter(obj["class"]),
+                data_object=obj["properties"],
+                uuid=obj["id"],
+                vector=obj.get("vector", None),
+                tenant=obj.get("tenant", None),
+                copy_object=False,
             )
+        return new_batch
 
-            if response_head.status_code == 404:
-                new_batch.add(
-                    class_name=_capitalize_first_letter(class_name),
-                    data_object=obj["properties"],
-                    uuid=uuid,
-                    vector=obj.get("vector", None),
-                )
-                continue
+    def _get_existing_objects(
+        self, class_name: str, tenant: Optional[str], objects: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get the objects in weaviate with the UUIDs of the given batch items, using one GraphQL
+        query that fetches the properties of the batch items and the vector.
 
-            # object might already exist and needs to be overwritten in case of an update
-            response = self._connection.get(
-                path="/objects/" + class_name + "/" + uuid,
-            )
+        Parameters
+        ----------
+        class_name : str
+            The class of the objects.
+        tenant : Optional[str]
+            The tenant of the objects.
+        objects : List[Dict[str, Any]]
+            The batch items, all their properties must be comparable (see `_get_property_fields`).
 
-            obj_weav = _decode_json_response_dict(response, "Re-add objects")
-            assert obj_weav is not None
-            if obj_weav["properties"] != obj["properties"] or obj.get(
-                "vector", None
-            ) != obj_weav.get("vector", None):
-                new_batch.add(
-                    class_name=_capitalize_first_letter(class_name),
-                    data_object=obj["properties"],
-                    uuid=uuid,
-                    vector=obj.get("vector", None),
-                )
-        return new_batch
+        Returns
+        -------
+        Optional[Dict[str, Dict[str, Any]]]
+            The objects that exist by UUID, or None if the query failed (e.g. the weaviate version
+            does not support the 'ContainsAny' operator).
+        """
+
+        fields: Dict[str, Set[str]] = {}
+        for obj in objects:
+            obj_fields = _get_property_fields(obj["properties"])
+            assert obj_fields is not None
+            for name, sub_fields in obj_fields.items():
+                fields.setdefault(name, set()).update(sub_fields)
+        selection = " ".join(
+            name if len(sub_fields) == 0 else f"{name}{{{' '.join(sorted(sub_fields))}}}"
+            for name, sub_fields in sorted(fields.items())
+        )
+        additional = "id vector" if any("vector" in obj for obj in objects) else "id"
+
+        uuids = [obj["id"] for obj in objects]
+        tenant_arg = f" tenant: {json.dumps(tenant)}" if tenant is not None else ""
+        query = (
+            f'{{Get{{{class_name}(where: {{path: ["id"], operator: ContainsAny, '
+            f"valueText: {json.dumps(uuids)}}} limit: {len(uuids)}{tenant_arg})"
+            f"{{{selection} _additional{{{additional}}}}}}}}}"
+        )
+        try:
+            response = self._connection.post(path="/graphql", weaviate_object={"query": query})
+            res = _decode_json_response_dict(response, "Query existing objects")
+        except (RequestsConnectionError, ReadTimeout, UnexpectedStatusCodeException):
+            return None
+        if res is None or "errors" in res:
+            return None
+        return {obj["_additional"]["id"]: obj for obj in res["data"]["Get"][class_name]}
 
     def _readd_references_after_timeout(
         self, batch_request: ReferenceBatchRequest
@@ -967,7 +1881,10 @@ class Batch:
                 self._objects_throughput_frame
             )
 
-            self._recommended_num_objects = max(round(obj_per_second * self._creation_time), 1)
+            if self._batch_size_controller is None:
+                self._set_recommended_num_objects(
+                    max(round(obj_per_second * self._creation_time), 1)
+                )
 
             res = _decode_json_response_list(response, "batch add objects")
             assert res is not None
@@ -1064,7 +1981,8 @@ class Batch:
                 self._references_throughput_frame
             )
 
-            self._recommended_num_references = round(ref_per_sec * self._creation_time)
+            if self._batch_size_controller is None:
+                self._recommended_num_references = round(ref_per_sec * self._creation_time)
 
             res = _decode_json_response_list(response, "Create references")
             assert res is not None
@@ -1105,21 +2023,25 @@ class Batch:
 
     def _send_batch_requests(self, force_wait: bool) -> None:
         """
-        Send BatchRequest in a separate thread/process. This methods submits a task to create only
-        the ObjectsBatchRequests to the BatchExecutor and adds the ReferencesBatchRequests to a
-        queue, then it carries on in the main thread until `num_workers` tasks have been submitted.
-        When we have reached number of tasks to be equal to `num_workers` it waits for all the
-        tasks to finish and handles the responses. After all ObjectsBatchRequests have been handled
-        it created separate tasks for each ReferencesBatchRequests, then it handles their responses
-        as well. This mechanism of creating References after Objects is constructed in this manner
-        to eliminate potential error when creating references from a object that does not yet
-        exists (object that is part of another task).
+        Send BatchRequest in a separate thread/process. This methods submits a task to create the
+        ObjectsBatchRequest to the BatchExecutor, then it carries on in the main thread until
+        `num_workers` tasks have been submitted. When we have reached number of tasks to be equal
+        to `num_workers` it waits for all the tasks to finish and handles the responses.
+        References are submitted as separate tasks as soon as none of the objects they refer to is
+        in flight anymore, either right away or by the task that finished the last of these
+        objects. This eliminates potential errors when creating references from an object that
+        does not yet exist (object that is part of another task), without waiting for the objects
+        the references do not depend on. See `declare_existing_objects`.
+        In streaming mode the BatchRequests are put into the queue of the streaming workers instead,
+        see `_enqueue_batch_requests`.
 
         Parameters
         ----------
         force_wait : bool
             Whether to wait on all created tasks even if we do not have `num_workers` tasks created
         """
+        if self._callback_dispatcher is not None:
+            self._callback_dispatcher.raise_error()
         if self._executor is None:
             self.start()
         elif self._executor.is_shutdown():
@@ -1130,21 +2052,27 @@ class Batch:
             )
             self.start()
 
-        assert self._executor is not None
-        future = self._executor.submit(
-            self._flush_in_thread,
-            data_type="objects",
-            batch_request=self._objects_batch,
-        )
-
-        self._future_pool.append(future)
-        if len(self._reference_batch) > 0:
-            self._reference_batch_queue.append(self._reference_batch)
+        if self._streaming:
+            self._enqueue_batch_requests(force_wait)
+            return
 
-        self._objects_batch = ObjectsBatchRequest()
-        self._reference_batch = ReferenceBatchRequest()
+        assert self._executor is not None
+        objects_batches, reference_batches = self._take_batch_requests(force_wait)
+        for objects_batch in objects_batches:
+            uuids = [item["id"] for item in objects_batch._items]
+            self._dependencies.start_objects(uuids)
+            future = self._executor.submit(
+                self._flush_objects_in_thread,
+                batch_request=objects_batch,
+                uuids=uuids,
+            )
+            self._future_pool.append(future)
+        for reference_batch in reference_batches:
+            if len(reference_batch) > 0:
+                self._submit_references(self._dependencies.add_references(reference_batch._items))
 
-        if not force_wait and self._num_workers > 1 and len(self._future_pool) < self._num_workers:
+        num_workers = self._get_num_workers()
+        if not force_wait and num_workers > 1 and len(self._future_pool) < num_workers:
             return
         timeout_occurred = False
         for done_future in as_completed(self._future_pool):
@@ -1159,8 +2087,137 @@ class Batch:
             else:
                 timeout_occurred = True
 
+        self._update_recommended_num_objects(timeout_occurred)
+
+        # all objects are finished, so every held back reference was submitted by now
+        with self._reference_future_pool_lock:
+            reference_future_pool = self._reference_future_pool
+            self._reference_future_pool = []
+
+        timeout_occurred = False
+        for done_future in as_completed(reference_future_pool):
+            response_references, nr_references = done_future.result()
+
+            # handle references response
+            if response_references is not None:
+                self._references_throughput_frame.append(
+                    nr_references / response_references.elapsed.total_seconds()
+                )
+            else:
+                timeout_occurred = True
+
+        self._update_recommended_num_references(timeout_occurred)
+
+        self._future_pool = []
+        return
+
+    def _take_batch_requests(
+        self, force_wait: bool
+    ) -> Tuple[List[ObjectsBatchRequest], List[ReferenceBatchRequest]]:
+        """
+        Take the current BatchRequests to send them, split so that none exceeds `max_batch_bytes`.
+        Unless all BatchRequests must be sent, the last part of each is kept in the batch to be
+        filled up, objects only if no references are sent, because those could refer to them.
+
+        Parameters
+        ----------
+        force_wait : bool
+            Whether all items must be sent, e.g. on flush.
+
+        Returns
+        -------
+        Tuple[List[ObjectsBatchRequest], List[ReferenceBatchRequest]]
+            The objects and references BatchRequests to send.
+        """
+
+        objects_batches: List[Any] = [self._objects_batch]
+        reference_batches: List[Any] = [self._reference_batch]
+        self._objects_batch = ObjectsBatchRequest()
+        self._reference_batch = ReferenceBatchRequest()
+        if self._max_batch_bytes is None:
+            return objects_batches, reference_batches
+
+        reference_batches = reference_batches[0]._split_by_num_bytes(self._max_batch_bytes)
+        if not force_wait and len(reference_batches) > 1:
+            self._reference_batch = reference_batches.pop()
+        objects_batches = objects_batches[0]._split_by_num_bytes(self._max_batch_bytes)
+        references_sent = any(len(reference_batch) > 0 for reference_batch in reference_batches)
+        if not force_wait and len(objects_batches) > 1 and not references_sent:
+            self._objects_batch = objects_batches.pop()
+        return objects_batches, reference_batches
+
+    def _flush_objects_in_thread(
+        self, batch_request: ObjectsBatchRequest, uuids: List[str]
+    ) -> Tuple[Optional[Response], int]:
+        """
+        Flush an ObjectsBatchRequest in the current thread and submit the references that only
+        waited for these objects, see `_send_batch_requests`.
+
+        Parameters
+        ----------
+        batch_request : ObjectsBatchRequest
+            Contains all the data objects that should be added in one batch.
+        uuids : List[str]
+            The UUIDs of the objects, as registered in the reference dependencies.
+
+        Returns
+        -------
+        Tuple[requests.Response, int]
+            The request response and number of items sent with the BatchRequest as tuple.
+        """
+
+        try:
+            return self._flush_in_thread(data_type="objects", batch_request=batch_request)
+        finally:
+            self._submit_references(self._dependencies.finish_objects(uuids))
+
+    def _submit_references(self, references: List[Dict[str, Any]]) -> None:
+        """
+        Submit references to the BatchExecutor, split into batch requests of at most
+        `recommended_num_references` references and `max_batch_bytes` bytes.
+
+        Parameters
+        ----------
+        references : List[dict]
+            The references that do not depend on objects in flight anymore.
+        """
+
+        if len(references) == 0:
+            return
+        assert self._executor is not None
+        size = max(int(self._recommended_num_references or len(references)), 1)
+        reference_batches: List[BatchRequest] = []
+        for start in range(0, len(references), size):
+            reference_batch = ReferenceBatchRequest()
+            reference_batch._items = references[start : start + size]
+            if self._max_batch_bytes is None:
+                reference_batches.append(reference_batch)
+            else:
+                reference_batches.extend(reference_batch._split_by_num_bytes(self._max_batch_bytes))
+        with self._reference_future_pool_lock:
+            for batch_request in reference_batches:
+                self._reference_future_pool.append(
+                    self._executor.submit(
+                        self._flush_in_thread,
+                        data_type="references",
+                        batch_request=batch_request,
+                    )
+                )
+
+    def _update_recommended_num_objects(self, timeout_occurred: bool) -> None:
+        """
+        Update the recommended number of objects after objects batch requests were sent.
+
+        Parameters
+        ----------
+        timeout_occurred : bool
+            Whether one of the sent batch requests did not return a response.
+        """
+
+        if self._batch_size_controller is not None:
+            return  # updated after every request, see `_observe_batch_request`
         if timeout_occurred and self._recommended_num_objects is not None:
-            self._recommended_num_objects = max(self._recommended_num_objects // 2, 1)
+            self._set_recommended_num_objects(max(self._recommended_num_objects // 2, 1))
         elif (
             len(self._objects_throughput_frame) != 0
             and self._recommended_num_objects is not None
@@ -1169,36 +2226,28 @@ class Batch:
             obj_per_second = (
                 sum(self._objects_throughput_frame) / len(self._objects_throughput_frame) * 0.75
             )
-            self._recommended_num_objects = max(
-                min(
-                    round(obj_per_second * self._creation_time),
-                    self._recommended_num_objects + 250,
-                ),
-                1,
-            )
-
-        # Create references after all the objects have been created
-        reference_future_pool = []
-        for reference_batch in self._reference_batch_queue:
-            future = self._executor.submit(
-                self._flush_in_thread,
-                data_type="references",
-                batch_request=reference_batch,
-            )
-            reference_future_pool.append(future)
+            self._set_recommended_num_objects(
+                max(
+                    min(
+                        round(obj_per_second * self._creation_time),
+                        self._recommended_num_objects + 250,
+                    ),
+                    1,
+                )
+            )
 
-        timeout_occurred = False
-        for done_future in as_completed(reference_future_pool):
-            response_references, nr_references = done_future.result()
+    def _update_recommended_num_references(self, timeout_occurred: bool) -> None:
+        """
+        Update the recommended number of references after references batch requests were sent.
 
-            # handle references response
-            if response_references is not None:
-                self._references_throughput_frame.append(
-                    nr_references / response_references.elapsed.total_seconds()
-                )
-            else:
-                timeout_occurred = True
+        Parameters
+        ----------
+        timeout_occurred : bool
+            Whether one of the sent batch requests did not return a response.
+        """
 
+        if self._batch_size_controller is not None:
+            return  # updated after every request, see `_observe_batch_request`
         if timeout_occurred and self._recommended_num_references is not None:
             self._recommended_num_references = max(self._recommended_num_references // 2, 1)
         elif (
@@ -1213,9 +2262,86 @@ class Batch:
                 self._recommended_num_references * 2,
             )
 
-        self._future_pool = []
-        self._reference_batch_queue = []
-        return
+    def _enqueue_batch_requests(self, force_wait: bool) -> None:
+        """
+        Put the current BatchRequests into the queue of the streaming workers. Blocks while the
+        queue is full. The objects are registered in the reference dependencies when they are
+        queued, so the workers create a ReferenceBatchRequest only after the objects it refers
+        to were sent.
+
+        Parameters
+        ----------
+        force_wait : bool
+            Whether to wait until all queued BatchRequests have been sent.
+        """
+
+        self._raise_streaming_error()
+        assert self._send_queue is not None
+
+        objects_batches, reference_batches = self._take_batch_requests(force_wait)
+        for objects_batch in objects_batches:
+            if len(objects_batch) > 0:
+                uuids = [item["id"] for item in objects_batch._items]
+                self._dependencies.start_objects(uuids)
+                self._send_queue.put(("objects", objects_batch, uuids))
+        for reference_batch in reference_batches:
+            if len(reference_batch) > 0:
+                self._send_queue.put(("references", reference_batch, None))
+
+        if force_wait:
+            self._send_queue.join()
+            self._raise_streaming_error()
+
+    def _raise_streaming_error(self) -> None:
+        """Re-raise an exception that occurred in one of the streaming workers."""
+
+        if self._streaming_error is not None:
+            error, self._streaming_error = self._streaming_error, None
+            raise error
+
+    def _streaming_worker(self, send_queue: queue.Queue) -> None:
+        """
+        Send BatchRequests from the queue until a `None` is received. Exceptions are saved and
+        re-raised in the main thread on the next flush or auto-creation.
+
+        Parameters
+        ----------
+        send_queue : queue.Queue
+            The queue to drain.
+        """
+
+        while True:
+            item = send_queue.get()
+            if item is None:
+                send_queue.task_done()
+                return
+            data_type, batch_request, uuids = item
+            try:
+                if data_type == "references":
+                    self._dependencies.wait_until_ready(batch_request._items)
+                response, nr_items = self._flush_in_thread(
+                    data_type=data_type,
+                    batch_request=batch_request,
+                )
+                if data_type == "objects":
+                    if response is not None:
+                        self._objects_throughput_frame.append(
+                            nr_items / response.elapsed.total_seconds()
+                        )
+                    self._update_recommended_num_objects(response is None)
+                else:
+                    if response is not None:
+                        self._references_throughput_frame.append(
+                            nr_items / response.elapsed.total_seconds()
+                        )
+                    self._update_recommended_num_references(response is None)
+            except Exception as error:
+                if self._streaming_error is None:
+                    self._streaming_error = error
+            finally:
+                if data_type == "objects":
+                    self._dependencies.finish_objects(uuids)
+                send_queue.task_done()
 
     def _auto_create(self) -> None:
         """
@@ -1228,28 +2354,214 @@ class Batch:
         # greater or equal in case the self._batch_size is changed manually
         if self._batching_type == "fixed":
             assert self._batch_size is not None
-            if sum(self.shape) >= self._batch_size:
+            if sum(self.shape) >= self._batch_size or self._exceeds_max_batch_bytes():
                 self._send_batch_requests(force_wait=False)
             return
         elif self._batching_type == "dynamic":
             if (
                 self.num_objects() >= self._recommended_num_objects
                 or self.num_references() >= self._recommended_num_references
+                or self._exceeds_max_batch_bytes()
             ):
-                while self._recommended_num_objects == 0:
-                    time.sleep(1)  # block if weaviate is overloaded
+                # block while weaviate is overloaded, until the background thread allows sending
+                with self._recommended_num_objects_changed:
+                    while self._recommended_num_objects == 0:
+                        thread = self._batch_size_thread
+                        if thread is None or not thread.is_alive():
+                            break
+                        self._recommended_num_objects_changed.wait(timeout=1)
 
                 self._send_batch_requests(force_wait=False)
             return
         # just in case
         raise ValueError(f'Unsupported batching type "{self._batching_type}"')
 
+    def _exceeds_max_batch_bytes(self) -> bool:
+        """Whether the objects or references of the batch are larger than `max_batch_bytes`."""
+
+        return self._max_batch_bytes is not None and (
+            self._objects_batch._get_num_bytes() > self._max_batch_bytes
+            or self._reference_batch._get_num_bytes() > self._max_batch_bytes
+        )
+
     def flush(self) -> None:
         """
         Flush both objects and references to the Weaviate server and call the callback function
         if one is provided. (See the docs for `configure` or `__call__` for how to set one.)
         """
         self._send_batch_requests(force_wait=True)
+        if self._callback_dispatcher is not None:
+            self._callback_dispatcher.join()
+
+    def declare_existing_objects(self, uuids: Sequence[UUID]) -> None:
+        """
+        Declare objects that already exist in Weaviate. With auto-creation a reference is sent as
+        soon as the objects with the UUIDs of its source and target are created, references to
+        declared objects are sent right away even if an object with the same UUID is being sent,
+        e.g. because it is updated.
+
+        Parameters
+        ----------
+        uuids : Sequence[str or uuid.UUID]
+            The UUIDs of the existing objects.
+
+        Raises
+        ------
+        TypeError
+            If one of the UUIDs is of a wrong type.
+        ValueError
+            If one of the UUIDs is not valid.
+        """
+
+        self._dependencies.declare_existing([get_valid_uuid(uuid) for uuid in uuids])
+
+    def resume_from_spool(self) -> int:
+        """
+        Re-add the objects and references that a previous run wrote to the spool but that were
+        not created in Weaviate, e.g. because the process died. Each item is re-added only once,
+        objects keep their UUID so objects that were created nevertheless are replaced. The items
+        are created like the ones added with `add_data_object` and `add_reference`.
+
+        Returns
+        -------
+        int
+            The number of re-added objects and references.
+
+        Raises
+        ------
+        ValueError
+            If the batch has no spool, see `configure`.
+        """
+
+        if self._spool is None:
+            raise ValueError("The batch has no spool, configure one with `spool=BatchSpool(...)`.")
+
+        recovered = self._spool._recover()
+        for data_type, item in recovered:
+            if data_type == "objects":
+                self._objects_batch._items.append(item)
+                self.__imported_shards.add(Shard(item["class"], item.get("tenant")))
+            else:
+                self._reference_batch._items.append(item)
+            if self._batching_type:
+                self._auto_create()
+        return len(recovered)
+
+    def replay_dead_letters(self, batch_size: int = 100, num_workers: int = 1) -> int:
+        """
+        Send the objects and references of the dead-letter store again, see `configure`. The
+        letters are removed from the store, items that fail again are added back with their
+        attempts counted up. Objects are created before references. The replay uses its own
+        batches and threads, independent of the ones used by `add_data_object` and
+        `add_reference`, the retries and the callback are the configured ones.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The number of items per batch request, by default 100
+        num_workers : int, optional
+            The maximal number of concurrent batch requests, by default 1
+
+        Returns
+        -------
+        int
+            The number of replayed items.
+
+        Raises
+        ------
+        ValueError
+            If the batch has no dead-letter store.
+        requests.ConnectionError
+            If the network connection to weaviate fails. The letters that were not sent are kept
+            in the store.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if self._dead_letters is None:
+            raise ValueError(
+                "The batch has no dead-letter store, configure one with "
+                "`dead_letters=DeadLetterStore(...)`."
+            )
+        _check_positive_num(batch_size, "batch_size", int)
+        _check_positive_num(num_workers, "num_workers", int)
+
+        letters = self._dead_letters._take()
+        unsent: List[DeadLetter] = []
+        first_error: Optional[Exception] = None
+        try:
+            for data_type in ("objects", "references"):
+                typed_letters = [letter for letter in letters if letter.data_type == data_type]
+                chunks = [
+                    typed_letters[start : start + batch_size]
+                    for start in range(0, len(typed_letters), batch_size)
+                ]
+                with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                    futures = {}
+                    for chunk in chunks:
+                        batch_request: BatchRequestType = (
+                            ObjectsBatchRequest()
+                            if data_type == "objects"
+                            else ReferenceBatchRequest()
+                        )
+                        batch_request._items = [letter.item for letter in chunk]
+                        futures[
+                            executor.submit(self._create_data, data_type, batch_request)
+                        ] = chunk
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as error:
+                            unsent.extend(futures[future])
+                            if first_error is None:
+                                first_error = error
+        finally:
+            self._dead_letters._finish_replay(unsent)
+
+        if first_error is not None:
+            raise first_error
+        return len(letters)
+
+    @property
+    def dead_letters(self) -> Optional[DeadLetterStore]:
+        """
+        The dead-letter store of the batch, see `configure`.
+        """
+
+        return self._dead_letters
+
+    def stats(self) -> BatchStats:
+        """
+        Get the metrics of the batch requests sent so far, e.g. to find out whether an import is
+        limited by the client (serialization), the network or the batch queue of Weaviate.
+
+        Returns
+        -------
+        weaviate.BatchStats
+            A snapshot of the metrics.
+
+        Examples
+        --------
+        >>> stats = client.batch.stats()
+        >>> stats.latency.mean, stats.serialization_time, stats.server_queue_length
+        (0.42, 1.3, 120)
+        """
+
+        if self._send_queue is not None:
+            queued_requests = self._send_queue.qsize() + self._metrics.active_workers
+        else:
+            with self._reference_future_pool_lock:
+                futures = self._future_pool + self._reference_future_pool
+            queued_requests = sum(not future.done() for future in futures)
+        self._metrics.add_recommended_sizes(
+            self._recommended_num_objects, self._recommended_num_references
+        )
+        dispatcher = self._callback_dispatcher
+        return self._metrics.snapshot(
+            self._server_queue_length,
+            queued_requests,
+            0 if dispatcher is None else dispatcher.queue_length,
+        )
 
     def delete_objects(
         self,
@@ -1413,7 +2725,10 @@ class Batch:
             If batch is empty or index is out of range.
         """
 
-        return self._objects_batch.pop(index)
+        obj = self._objects_batch.pop(index)
+        if self._spool is not None:
+            self._spool.ack([obj])
+        return obj
 
     def pop_reference(self, index: int = -1) -> dict:
         """
@@ -1435,13 +2750,18 @@ class Batch:
             If batch is empty or index is out of range.
         """
 
-        return self._reference_batch.pop(index)
+        reference = self._reference_batch.pop(index)
+        if self._spool is not None:
+            self._spool.ack([reference])
+        return reference
 
     def empty_objects(self) -> None:
         """
         Remove all the objects from the batch.
         """
 
+        if self._spool is not None:
+            self._spool.ack(self._objects_batch._items)
         self._objects_batch.empty()
 
     def empty_references(self) -> None:
@@ -1449,6 +2769,8 @@ class Batch:
         Remove all the references from the batch.
         """
 
+        if self._spool is not None:
+            self._spool.ack(self._reference_batch._items)
         self._reference_batch.empty()
 
     def is_empty_objects(self) -> bool:
@@ -1532,7 +2854,7 @@ class Batch:
         if self._batching_type is None:
             self._batching_type = "fixed"
         if self._recommended_num_objects is None:
-            self._recommended_num_objects = value
+            self._set_recommended_num_objects(value)
         if self._recommended_num_references is None:
             self._recommended_num_references = value
         self._auto_create()
@@ -1583,6 +2905,94 @@ class Batch:
     def consistency_level(self, x: Optional[Union[ConsistencyLevel, str]]) -> None:
         self._consistency_level = ConsistencyLevel(x) if x is not None else None
 
+    @property
+    def use_grpc(self) -> bool:
+        """
+        Setter and Getter for `use_grpc`.
+
+        Parameters
+        ----------
+        value : bool
+            Setter ONLY: Whether to send objects through gRPC if the client has a gRPC connection.
+
+        Returns
+        -------
+        bool
+            Getter ONLY: Whether objects are sent through gRPC if the client has a gRPC connection.
+
+        Raises
+        ------
+        TypeError
+            Setter ONLY: If the new value is not of type bool.
+        """
+
+        return self._use_grpc
+
+    @use_grpc.setter
+    def use_grpc(self, value: bool) -> None:
+        _check_bool(value, "use_grpc")
+        self._use_grpc = value
+
+    @property
+    def copy_objects(self) -> bool:
+        """
+        Setter and Getter for `copy_objects`.
+
+        Parameters
+        ----------
+        value : bool
+            Setter ONLY: Whether `add_data_object` stores a deep copy of each data object.
+
+        Returns
+        -------
+        bool
+            Getter ONLY: Whether `add_data_object` stores a deep copy of each data object.
+
+        Raises
+        ------
+        TypeError
+            Setter ONLY: If the new value is not of type bool.
+        """
+
+        return self._copy_objects
+
+    @copy_objects.setter
+    def copy_objects(self, value: bool) -> None:
+        _check_bool(value, "copy_objects")
+        self._copy_objects = value
+
+    @property
+    def max_batch_bytes(self) -> Optional[int]:
+        """
+        Setter and Getter for `max_batch_bytes`.
+
+        Parameters
+        ----------
+        value : Optional[int]
+            Setter ONLY: The maximal estimated size of the body of a batch request in bytes, None
+            to limit the batch requests only by the number of items.
+
+        Returns
+        -------
+        Optional[int]
+            Getter ONLY: The maximal estimated size of the body of a batch request in bytes.
+
+        Raises
+        ------
+        TypeError
+            Setter ONLY: If the new value is not of type int.
+        ValueError
+            Setter ONLY: If the new value is not positive.
+        """
+
+        return self._max_batch_bytes
+
+    @max_batch_bytes.setter
+    def max_batch_bytes(self, value: Optional[int]) -> None:
+        if value is not None:
+            _check_positive_num(value, "max_batch_bytes", int)
+        self._max_batch_bytes = value
+
     @property
     def recommended_num_objects(self) -> Optional[int]:
         """
@@ -1620,7 +3030,24 @@ class Batch:
         """
 
         if self._executor is None or self._executor.is_shutdown():
-            self._executor = BatchExecutor(max_workers=self._num_workers)
+            if self._worker_autoscaler is not None:
+                # idle threads of the pool wait for the autoscaler, see `_create_data`
+                self._worker_autoscaler._bind(self._connection.session_pool_maxsize)
+            pool_size = self._get_max_num_workers()
+            self._executor = BatchExecutor(max_workers=pool_size)
+            if self._streaming:
+                self._send_queue = queue.Queue(maxsize=2 * pool_size)
+                self._streaming_workers = []
+                for _ in range(pool_size):
+                    demon = threading.Thread(
+                        target=self._streaming_worker,
+                        args=(self._send_queue,),
+                        daemon=True,
+                        name="batchSender",
+                    )
+                    demon.start()
+                    self._streaming_workers.append(demon)
+        self._start_callback_dispatcher()
 
         if self._batching_type == "dynamic" and (
             self._shutdown_background_event is None or self._shutdown_background_event.is_set()
@@ -1634,7 +3061,16 @@ class Batch:
         Shutdown the BatchExecutor.
         """
         if not (self._executor is None or self._executor.is_shutdown()):
+            if self._send_queue is not None:
+                # the workers send everything that is still queued before they stop
+                for _ in self._streaming_workers:
+                    self._send_queue.put(None)
+                for worker in self._streaming_workers:
+                    worker.join()
+                self._send_queue = None
+                self._streaming_workers = []
             self._executor.shutdown()
+        self._stop_callback_dispatcher()
 
         if self._shutdown_background_event is not None:
             self._shutdown_background_event.set()
@@ -1744,8 +3180,8 @@ class Batch:
                 self._recommended_num_references * value / self._creation_time
             )
         if self._recommended_num_objects is not None:
-            self._recommended_num_objects = round(
-                self._recommended_num_objects * value / self._creation_time
+            self._set_recommended_num_objects(
+                round(self._recommended_num_objects * value / self._creation_time)
             )
         self._creation_time = value
         if self._batching_type:
@@ -1896,15 +3332,213 @@ def _batch_create_error_handler(retry: int, max_retries: int, error: Exception)
         The caught exception.
     """
 
+    time.sleep(_batch_retry_delay(retry, max_retries, error))
+
+
+def _batch_retry_delay(retry: int, max_retries: int, error: Exception) -> float:
+    """
+    Get how long to wait before retrying a failed Batch creation, shared by the threaded and the
+    asyncio batches. The delay grows exponentially with the retries and is jittered, so workers
+    that failed at the same time do not retry at the same time. This function is going to re-raise
+    the error if number of re-tries was reached.
+
+    Parameters
+    ----------
+    retry : int
+        Current number of attempted request calls.
+    max_retries : int
+        Maximum number of attempted request calls.
+    error : Exception
+        The exception that occurred (to be re-raised if needed).
+
+    Returns
+    -------
+    float
+        The number of seconds to wait before the next attempt.
+
+    Raises
+    ------
+    Exception
+        The caught exception.
+    """
+
     if retry >= max_retries:
         raise error
+    delay = _backoff_delay(retry, _RETRY_BACKOFF_BASE, _RETRY_BACKOFF_MAX)
     print(
         f"[ERROR] Batch {error.__class__.__name__} Exception occurred! Retrying in "
-        f"{(retry + 1) * 2}s. [{retry + 1}/{max_retries}]",
+        f"{delay:.1f}s. [{retry + 1}/{max_retries}]",
         file=sys.stderr,
         flush=True,
     )
-    time.sleep((retry + 1) * 2)
+    return delay
+
+
+def _get_to_object_class_name(
+    server_version: str, to_object_class_name: Optional[str]
+) -> Optional[str]:
+    """
+    Get the class name of the referenced object to send for a batch reference. Warns if it is
+    missing with Weaviate >= 1.14 or if it is given with an older Weaviate, which does not
+    support it.
+
+    Parameters
+    ----------
+    server_version : str
+        The version of the Weaviate server.
+    to_object_class_name : str or None
+        The class name given by the user.
+
+    Returns
+    -------
+    str or None
+        The capitalized class name, or None if it is not supported.
+
+    Raises
+    ------
+    TypeError
+        If 'to_object_class_name' is not of type str or None.
+    """
+
+    is_server_version_14 = server_version >= "1.14"
+
+    if to_object_class_name is None and is_server_version_14:
+        warnings.warn(
+            message=BATCH_REF_DEPRECATION_NEW_V14_CLS_NS_W,
+            category=DeprecationWarning,
+            stacklevel=1,
+        )
+    if to_object_class_name is not None:
+        if not is_server_version_14:
+            warnings.warn(
+                message=BATCH_REF_DEPRECATION_OLD_V14_CLS_NS_W,
+                category=DeprecationWarning,
+                stacklevel=1,
+            )
+            return None
+        if not isinstance(to_object_class_name, str):
+            raise TypeError(
+                "'to_object_class_name' must be of type str or None. "
+                f"Given type: {type(to_object_class_name)}"
+            )
+        return _capitalize_first_letter(to_object_class_name)
+    return to_object_class_name
+
+
+@dataclass(frozen=True)
+class _ClusterBatchStats:
+    """
+    The batch queues of all nodes of a Weaviate cluster.
+
+    Attributes
+    ----------
+    queue_length : int
+        The longest batch queue of a node.
+    rate_per_second : float
+        The number of objects the cluster processes per second, summed over all nodes.
+    ratio : float
+        The longest queue of a node relative to the rate of that node, i.e. how many seconds the
+        most congested node needs to process its queue.
+    """
+
+    queue_length: int
+    rate_per_second: float
+    ratio: float
+
+
+def _get_cluster_batch_stats(nodes: List[Dict[str, Any]]) -> Optional[_ClusterBatchStats]:
+    """
+    Aggregate the `batchStats` of all nodes. Every batch request is split across the shards of
+    all nodes, so the most congested node limits how fast the cluster imports.
+
+    Parameters
+    ----------
+    nodes : List[dict]
+        The nodes status, see `weaviate.cluster.Cluster.get_nodes_status`.
+
+    Returns
+    -------
+    _ClusterBatchStats or None
+        The aggregated stats, None if no node reports them (Weaviate < 1.20).
+    """
+
+    queue_length = 0
+    rate_per_second = 0.0
+    ratio = 0.0
+    reported = False
+    for node in nodes:
+        batch_stats = node.get("batchStats")
+        if batch_stats is None or "ratePerSecond" not in batch_stats:
+            continue
+        reported = True
+        node_queue_length = batch_stats.get("queueLength", 0)
+        node_rate = batch_stats["ratePerSecond"]
+        queue_length = max(queue_length, node_queue_length)
+        rate_per_second += node_rate
+        # a node that did not process anything yet counts as processing one object per second
+        ratio = max(ratio, node_queue_length / max(node_rate, 1))
+    if not reported:
+        return None
+    return _ClusterBatchStats(queue_length, rate_per_second, ratio)
+
+
+def _get_request_body_size(response: Response) -> Optional[int]:
+    """
+    Get the size of the body of the request that `response` answers, None if it is unknown.
+    """
+
+    request = getattr(response, "request", None)
+    if request is None or not isinstance(request.body, bytes):
+        return None
+    return len(request.body)
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float))
+
+
+def _get_property_fields(properties: Dict[str, Any]) -> Optional[Dict[str, Set[str]]]:
+    """
+    Get the GraphQL fields to fetch the properties of a batch item with, i.e. the names of the
+    properties and the sub fields of the object-like properties (e.g. geo coordinates). None if a
+    property cannot be fetched with a GraphQL query and compared to the batch item, e.g. a
+    cross-reference or a nested object with nested values.
+    """
+
+    fields: Dict[str, Set[str]] = {}
+    for name, value in properties.items():
+        if isinstance(value, dict) and all(_is_scalar(sub) for sub in value.values()):
+            fields[name] = set(value.keys())
+        elif _is_scalar(value) or (
+            isinstance(value, list) and all(_is_scalar(item) for item in value)
+        ):
+            fields[name] = set()
+        else:
+            return None
+    return fields
+
+
+def _is_object_up_to_date(obj: Dict[str, Any], obj_weav: Dict[str, Any]) -> bool:
+    """
+    Check if the object fetched from weaviate with a GraphQL query has the same properties and
+    vector as the batch item. Object-like properties only have to match on the keys of the batch
+    item, as weaviate can add keys (e.g. the parsed parts of a phone number).
+    """
+
+    for name, value in obj["properties"].items():
+        value_weav = obj_weav.get(name, None)
+        if isinstance(value, dict):
+            if not isinstance(value_weav, dict) or any(
+                value_weav.get(key, None) != sub for key, sub in value.items()
+            ):
+                return False
+        elif value != value_weav:
+            return False
+    # unset properties are returned as null
+    for name, value_weav in obj_weav.items():
+        if name != "_additional" and name not in obj["properties"] and value_weav is not None:
+            return False
+    return "vector" not in obj or obj["vector"] == obj_weav["_additional"].get("vector", None)
 
 
 def _clean_delete_objects_where(where: dict) -> dict:
@@ -0,0 +1,261 @@
+"""
+DeadLetter and DeadLetterStore class definitions.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from weaviate.codec import JsonCodec
+from weaviate.util import _check_positive_num
+from .requests import BatchResponse, ObjectsBatchRequest, ReferenceBatchRequest
+
+
+@dataclass
+class DeadLetter:
+    """
+    An object or reference that Weaviate did not create, even after all retries.
+
+    Attributes
+    ----------
+    data_type : str
+        The type of the item, either 'objects' or 'references'.
+    item : dict
+        The item as it is sent to Weaviate, i.e. an entry of the batch request.
+    errors : List[str]
+        The error messages of the last attempt.
+    attempts : int
+        How often the item was sent to Weaviate, including replays.
+    first_failed_at : float
+        When the item failed for the first time, as a UNIX timestamp.
+    last_failed_at : float
+        When the item failed for the last time, as a UNIX timestamp.
+    """
+
+    data_type: str
+    item: Dict[str, Any]
+    errors: List[str]
+    attempts: int
+    first_failed_at: float
+    last_failed_at: float
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        """
+        The identity of the item, used to count the attempts across replays.
+        """
+
+        if self.data_type == "objects":
+            return (self.data_type, self.item["id"])
+        return (self.data_type, self.item["from"], self.item["to"])
+
+
+class DeadLetterStore:
+    """
+    Store of the objects and references that failed permanently in a `weaviate.batch.Batch`, i.e.
+    Weaviate returned an error for them in the last attempt. The letters are kept in memory, at
+    most `max_size` of them, the oldest are dropped first. An item that fails again replaces its
+    previous letter. If a `path` is given the letters are also appended to a JSONL file and read
+    again when a store is created on the same file, so they survive a restart. The file is
+    compacted to the letters in memory once it holds more than twice `max_size` lines.
+
+    The failed items are still passed to the batch callback. Use `Batch.replay_dead_letters` to
+    send them again, e.g. after the cause of the errors was fixed.
+
+    Examples
+    --------
+    >>> dead_letters = weaviate.DeadLetterStore(path="dead_letters.jsonl")
+    >>> with client.batch(batch_size=100, dead_letters=dead_letters) as batch:
+    ...     for obj in objects:
+    ...         batch.add_data_object(obj, "Article")
+    >>> for letter in dead_letters.letters:
+    ...     print(letter.item["id"], letter.errors)
+    >>> client.batch.replay_dead_letters()
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        path: Optional[str] = None,
+        codec: Optional[JsonCodec] = None,
+    ):
+        """
+        Initialize a DeadLetterStore class instance, reading the letters of `path` if it exists.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The maximal number of letters kept in memory, by default 10000.
+        path : str, optional
+            The JSONL file the letters are written to, by default None.
+        codec : weaviate.JsonCodec, optional
+            The codec used to encode the letters, by default `weaviate.JsonCodec`.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If `max_size` is not positive.
+        """
+
+        _check_positive_num(max_size, "max_size", int)
+        if path is not None and not isinstance(path, str):
+            raise TypeError(f"'path' must be of type str. Given type: {type(path)}.")
+        if codec is not None and not isinstance(codec, JsonCodec):
+            raise TypeError(f"'codec' must be of type {JsonCodec}, given type: {type(codec)}.")
+
+        self._path = path
+        self._codec = JsonCodec() if codec is None else codec
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._letters: "OrderedDict[Tuple[str, ...], DeadLetter]" = OrderedDict()
+        # attempts and first failure of the letters that are being replayed
+        self._replayed: Dict[Tuple[str, ...], Tuple[int, float]] = {}
+        # lines in the file, including letters that were replaced or dropped since
+        self._num_lines = 0
+
+        if path is not None and os.path.exists(path):
+            with open(path, "rb") as file:
+                for line in file:
+                    self._num_lines += 1
+                    try:
+                        self._put(DeadLetter(**self._codec.decode(line)))
+                    except ValueError:
+                        # incomplete last line if the process died while writing it
+                        continue
+            if self._num_lines != len(self._letters):
+                self._write()
+
+    @property
+    def letters(self) -> List[DeadLetter]:
+        """
+        The letters in the store, the oldest first.
+        """
+
+        with self._lock:
+            return list(self._letters.values())
+
+    def __len__(self) -> int:
+        return len(self._letters)
+
+    def clear(self) -> None:
+        """
+        Remove all letters.
+        """
+
+        with self._lock:
+            self._letters.clear()
+            self._write()
+
+    def _add_from_response(
+        self, data_type: str, response: BatchResponse, attempts: int
+    ) -> List[DeadLetter]:
+        """
+        Add the items of a batch response that have errors.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of the batch request, either 'objects' or 'references'.
+        response : BatchResponse
+            The response of the last attempt.
+        attempts : int
+            How often the failed items were sent.
+
+        Returns
+        -------
+        List[DeadLetter]
+            The added letters.
+        """
+
+        # failed items are rebuilt the same way they are retried
+        batch_request = ObjectsBatchRequest() if data_type == "objects" else ReferenceBatchRequest()
+        batch_request.add_failed_objects_from_response(response, None, None)
+        if len(batch_request) == 0:
+            return []
+        failed = [
+            entry for entry in response if not batch_request._skip_objects_retry(entry, None, None)
+        ]
+
+        now = time.time()
+        letters = []
+        with self._lock:
+            for item, entry in zip(batch_request._items, failed):
+                letter = DeadLetter(
+                    data_type=data_type,
+                    item=item,
+                    errors=[error["message"] for error in entry["result"]["errors"]["error"]],
+                    attempts=attempts,
+                    first_failed_at=now,
+                    last_failed_at=now,
+                )
+                previous = self._replayed.pop(letter.key, None)
+                if previous is not None:
+                    letter.attempts += previous[0]
+                    letter.first_failed_at = previous[1]
+                letters.append(letter)
+                self._put(letter)
+            if self._path is not None:
+                # the file still holds the letters being replayed, it is compacted once the
+                # replay finished
+                if len(self._replayed) == 0 and self._num_lines + len(letters) > 2 * self._max_size:
+                    self._write()
+                else:
+                    with open(self._path, "ab") as file:
+                        for letter in letters:
+                            file.write(self._codec.encode(asdict(letter)) + b"\n")
+                    self._num_lines += len(letters)
+        return letters
+
+    def _take(self) -> List[DeadLetter]:
+        """
+        Remove all letters to replay them. Letters that fail again are added with the attempts of
+        the previous ones.
+        """
+
+        with self._lock:
+            letters = list(self._letters.values())
+            self._letters.clear()
+            self._replayed = {
+                letter.key: (letter.attempts, letter.first_failed_at) for letter in letters
+            }
+            # the file is rewritten once the replay finished, so no letter is lost if the process
+            # dies in between
+            return letters
+
+    def _finish_replay(self, unsent: List[DeadLetter]) -> None:
+        """
+        End a replay, adding back the letters that could not be sent.
+        """
+
+        with self._lock:
+            self._replayed = {}
+            for letter in unsent:
+                self._put(letter)
+            self._write()
+
+    def _put(self, letter: DeadLetter) -> None:
+        """
+        Add a letter, replacing the letter of the same item and dropping the oldest letter if the
+        store is full.
+        """
+
+        self._letters.pop(letter.key, None)
+        self._letters[letter.key] = letter
+        if len(self._letters) > self._max_size:
+            self._letters.popitem(last=False)
+
+    def _write(self) -> None:
+        """
+        Rewrite the file with the letters in memory.
+        """
+
+        if self._path is None:
+            return
+        with open(self._path, "wb") as file:
+            for letter in self._letters.values():
+                file.write(self._codec.encode(asdict(letter)) + b"\n")
+        self._num_lines = len(self._letters)
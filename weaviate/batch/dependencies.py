@@ -0,0 +1,108 @@
+"""
+Dependency tracking between the objects and references of a `weaviate.batch.Batch`.
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Set
+
+
+class _ReferenceDependencies:
+    """
+    Tracks the objects that were sent to Weaviate but whose batch request did not finish yet, so
+    a reference is created as soon as both of its endpoints exist instead of after all objects.
+
+    An endpoint is ready if no object with its UUID is in flight, i.e. it was created already, it
+    was declared as existing or it is not part of this import. References that are not ready are
+    held back until the objects they depend on are finished.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        # UUID -> number of batch requests in flight that contain an object with that UUID
+        self._in_flight: Dict[str, int] = {}
+        self._existing: Set[str] = set()
+        self._blocked: List[Dict[str, Any]] = []
+
+    @property
+    def num_blocked(self) -> int:
+        """
+        The number of references waiting for their objects.
+        """
+
+        return len(self._blocked)
+
+    def declare_existing(self, uuids: Iterable[str]) -> None:
+        """
+        Mark objects as existing in Weaviate, references to them are never held back.
+        """
+
+        with self._condition:
+            self._existing.update(str(uuid) for uuid in uuids)
+            self._condition.notify_all()
+
+    def start_objects(self, uuids: List[str]) -> None:
+        """
+        Register the UUIDs of an objects batch request that is about to be sent.
+        """
+
+        with self._condition:
+            for uuid in uuids:
+                self._in_flight[uuid] = self._in_flight.get(uuid, 0) + 1
+
+    def finish_objects(self, uuids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Register that an objects batch request finished, successfully or not.
+
+        Returns
+        -------
+        List[dict]
+            The held back references that are ready now.
+        """
+
+        with self._condition:
+            for uuid in uuids:
+                count = self._in_flight.pop(uuid, 0) - 1
+                if count > 0:
+                    self._in_flight[uuid] = count
+            self._condition.notify_all()
+            ready = [reference for reference in self._blocked if self._is_ready(reference)]
+            if len(ready) > 0:
+                self._blocked = [
+                    reference for reference in self._blocked if not self._is_ready(reference)
+                ]
+            return ready
+
+    def add_references(self, references: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Hold back the references whose objects are in flight.
+
+        Returns
+        -------
+        List[dict]
+            The references that are ready and can be sent right away.
+        """
+
+        with self._condition:
+            ready = []
+            for reference in references:
+                if self._is_ready(reference):
+                    ready.append(reference)
+                else:
+                    self._blocked.append(reference)
+            return ready
+
+    def wait_until_ready(self, references: List[Dict[str, Any]]) -> None:
+        """
+        Block until the objects of all `references` are finished.
+        """
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: all(self._is_ready(reference) for reference in references)
+            )
+
+    def _is_ready(self, reference: Dict[str, Any]) -> bool:
+        # weaviate://localhost/<class>/<uuid>/<property> and weaviate://localhost/[<class>/]<uuid>
+        for uuid in (reference["from"].split("/")[-2], reference["to"].split("/")[-1]):
+            if uuid in self._in_flight and uuid not in self._existing:
+                return False
+        return True
@@ -0,0 +1,184 @@
+"""
+RateLimiter class definition.
+"""
+import threading
+import time
+from numbers import Real
+from typing import Optional
+
+from weaviate.util import _check_positive_num
+
+
+class _TokenBucket:
+    """
+    Token bucket refilled with `rate` tokens per second, holding at most `rate * burst` tokens.
+    A rate of None never limits.
+    """
+
+    def __init__(self, rate: Optional[float], burst: float):
+        self._burst = burst
+        self._rate = rate
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: Optional[float]) -> None:
+        self._refill(time.monotonic())
+        self._rate = value
+        self._tokens = min(self._tokens, self._capacity)
+
+    @property
+    def _capacity(self) -> float:
+        return 0.0 if self._rate is None else self._rate * self._burst
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """
+        The seconds until `amount` tokens can be taken. Amounts larger than the capacity can be
+        taken once the bucket is full, the bucket then owes the difference.
+        """
+
+        if self._rate is None or amount <= 0:
+            return 0.0
+        self._refill(now)
+        missing = min(amount, self._capacity) - self._tokens
+        return max(missing / self._rate, 0.0)
+
+    def take(self, amount: float) -> None:
+        if self._rate is not None:
+            self._tokens -= amount
+
+    def _refill(self, now: float) -> None:
+        if self._rate is not None:
+            self._tokens = min(self._tokens + (now - self._updated_at) * self._rate, self._capacity)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """
+    Limits how fast a `weaviate.batch.Batch` sends objects and references to Weaviate, with one
+    token bucket for the number of items per second and one for the number of bytes per second.
+    Every batch request, including retries, takes its items and its estimated size from the
+    buckets before it is sent and blocks until enough tokens are available. Blocked senders
+    sleep until the tokens are refilled, they do not poll.
+
+    The limiter is thread-safe. The same instance can be given to several batches, which then
+    share the limits. The limits can be changed at any time, waiting senders pick up the new
+    limits immediately.
+
+    Examples
+    --------
+    >>> limiter = weaviate.RateLimiter(objects_per_second=500, bytes_per_second=2_000_000)
+    >>> with client.batch(batch_size=100, num_workers=4, rate_limiter=limiter) as batch:
+    ...     for obj in objects:
+    ...         batch.add_data_object(obj, "Article")
+    ...         if query_latency_too_high():
+    ...             limiter.objects_per_second = 100
+    """
+
+    def __init__(
+        self,
+        objects_per_second: Optional[float] = None,
+        bytes_per_second: Optional[float] = None,
+        burst: float = 1,
+    ):
+        """
+        Initialize a RateLimiter class instance.
+
+        Parameters
+        ----------
+        objects_per_second : Real, optional
+            The maximal number of objects and references sent per second, by default None
+            (not limited).
+        bytes_per_second : Real, optional
+            The maximal estimated size of the batch requests sent per second, by default None
+            (not limited).
+        burst : Real, optional
+            How many seconds worth of the rates can be sent at once after the limiter was idle,
+            by default 1.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If an argument is not positive.
+        """
+
+        _check_positive_num(burst, "burst", Real)
+        _check_rate(objects_per_second, "objects_per_second")
+        _check_rate(bytes_per_second, "bytes_per_second")
+
+        self._condition = threading.Condition()
+        self._objects = _TokenBucket(objects_per_second, float(burst))
+        self._bytes = _TokenBucket(bytes_per_second, float(burst))
+
+    @property
+    def objects_per_second(self) -> Optional[float]:
+        """
+        Setter and Getter for `objects_per_second`, None if the number of objects is not limited.
+        """
+
+        return self._objects.rate
+
+    @objects_per_second.setter
+    def objects_per_second(self, value: Optional[float]) -> None:
+        _check_rate(value, "objects_per_second")
+        with self._condition:
+            self._objects.rate = value
+            self._condition.notify_all()
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        """
+        Setter and Getter for `bytes_per_second`, None if the number of bytes is not limited.
+        """
+
+        return self._bytes.rate
+
+    @bytes_per_second.setter
+    def bytes_per_second(self, value: Optional[float]) -> None:
+        _check_rate(value, "bytes_per_second")
+        with self._condition:
+            self._bytes.rate = value
+            self._condition.notify_all()
+
+    def acquire(self, num_objects: int, num_bytes: int = 0) -> float:
+        """
+        Block until `num_objects` objects and `num_bytes` bytes may be sent.
+
+        Parameters
+        ----------
+        num_objects : int
+            The number of objects or references that are going to be sent.
+        num_bytes : int, optional
+            The size of the request that is going to be sent, by default 0.
+
+        Returns
+        -------
+        float
+            How long the call blocked in seconds.
+        """
+
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait_time = max(
+                    self._objects.wait_time(num_objects, now),
+                    self._bytes.wait_time(num_bytes, now),
+                )
+                if wait_time <= 0:
+                    self._objects.take(num_objects)
+                    self._bytes.take(num_bytes)
+                    return now - start
+                # woken up early if the limits change
+                self._condition.wait(wait_time)
+
+
+def _check_rate(value: Optional[float], arg_name: str) -> None:
+    if value is not None:
+        _check_positive_num(value, arg_name, Real)
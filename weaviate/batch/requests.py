@@ -2,13 +2,18 @@
 BatchRequest class definitions.
 """
 import copy
+import json
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Optional, Dict, Any, Union
+from typing import List, Mapping, Sequence, Optional, Dict, Any, Union, TYPE_CHECKING
 from uuid import uuid4
 
 from weaviate.util import get_valid_uuid, get_vector
 from weaviate.types import UUID
 
+# the generated gRPC modules are slow to import and only needed for gRPC batches
+if TYPE_CHECKING:
+    from weaviate.proto.v1 import base_pb2, batch_pb2
+
 BatchResponse = List[Dict[str, Any]]
 
 
@@ -19,6 +24,9 @@ class BatchRequest(ABC):
 
     def __init__(self) -> None:
         self._items: List[Dict[str, Any]] = []
+        # estimated JSON sizes of the first `len(_item_sizes)` items and their sum, updated on demand
+        self._item_sizes: List[int] = []
+        self._num_bytes = 0
 
     def __len__(self) -> int:
         return len(self._items)
@@ -41,6 +49,8 @@ class BatchRequest(ABC):
         """
 
         self._items = []
+        self._item_sizes = []
+        self._num_bytes = 0
 
     def pop(self, index: int = -1) -> dict:
         """
@@ -62,7 +72,60 @@ class BatchRequest(ABC):
             If batch is empty or index is out of range.
         """
 
-        return self._items.pop(index)
+        item = self._items.pop(index)
+        if index < 0:
+            index += len(self._items) + 1
+        if index < len(self._item_sizes):
+            self._num_bytes -= self._item_sizes.pop(index)
+        return item
+
+    def _get_num_bytes(self) -> int:
+        """
+        Get the estimated size of the request body in bytes. Only the items that were added since
+        the last call are encoded, so it can be called after every added item.
+
+        Returns
+        -------
+        int
+            The estimated size of the items encoded as JSON.
+        """
+
+        for item in self._items[len(self._item_sizes) :]:
+            num_bytes = _estimate_num_bytes(item)
+            self._item_sizes.append(num_bytes)
+            self._num_bytes += num_bytes
+        return self._num_bytes
+
+    def _split_by_num_bytes(self, max_num_bytes: int) -> List["BatchRequest"]:
+        """
+        Split the items into batch requests of the same type whose estimated size does not exceed
+        `max_num_bytes`, keeping their order. An item that is larger on its own gets a request of
+        its own.
+
+        Parameters
+        ----------
+        max_num_bytes : int
+            The maximal estimated size of a request.
+
+        Returns
+        -------
+        List[BatchRequest]
+            The batch requests, this one if it does not exceed `max_num_bytes`.
+        """
+
+        if self._get_num_bytes() <= max_num_bytes:
+            return [self]
+        requests: List[BatchRequest] = []
+        current = type(self)()
+        for item, num_bytes in zip(self._items, self._item_sizes):
+            if len(current) > 0 and current._num_bytes + num_bytes > max_num_bytes:
+                requests.append(current)
+                current = type(self)()
+            current._items.append(item)
+            current._item_sizes.append(num_bytes)
+            current._num_bytes += num_bytes
+        requests.append(current)
+        return requests
 
     @abstractmethod
     def add(self, *args, **kwargs):  # type: ignore
@@ -225,7 +288,10 @@ class ReferenceBatchRequest(BatchRequest):
             if self._skip_objects_retry(ref, errors_to_exclude, errors_to_include):
                 successful_responses.append(ref)
                 continue
-            self._items.append({"from": ref["from"], "to": ref["to"]})
+            item = {"from": ref["from"], "to": ref["to"]}
+            if ref.get("tenant", None) is not None:
+                item["tenant"] = ref["tenant"]
+            self._items.append(item)
         return successful_responses
 
 
@@ -242,6 +308,7 @@ class ObjectsBatchRequest(BatchRequest):
         uuid: Optional[UUID] = None,
         vector: Optional[Sequence] = None,
         tenant: Optional[str] = None,
+        copy_object: bool = True,
     ) -> str:
         """
         Add one object to this batch. Does NOT validate the consistency of the object against
@@ -266,6 +333,9 @@ class ObjectsBatchRequest(BatchRequest):
             by default None.
         tenant: str, optional
             Tenant of the object
+        copy_object: bool, optional
+            Whether to store a deep copy of `data_object`. If False the batch takes ownership of
+            the given dict, which must not be changed afterwards, by default True.
 
         Returns
         -------
@@ -285,7 +355,10 @@ class ObjectsBatchRequest(BatchRequest):
         if not isinstance(class_name, str):
             raise TypeError("Class name must be of type str")
 
-        batch_item = {"class": class_name, "properties": copy.deepcopy(data_object)}
+        batch_item = {
+            "class": class_name,
+            "properties": copy.deepcopy(data_object) if copy_object else data_object,
+        }
         if uuid is not None:
             valid_uuid = get_valid_uuid(uuid)
         else:
@@ -301,6 +374,86 @@ class ObjectsBatchRequest(BatchRequest):
 
         return valid_uuid
 
+    def add_columns(
+        self,
+        class_name: str,
+        columns: Mapping[str, Sequence],
+        vectors: Optional[Sequence] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenant: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Add several objects of the same class to this batch, given as one sequence of values per
+        property. Does NOT validate the consistency of the objects against the client's schema.
+        The property values are not copied.
+
+        Parameters
+        ----------
+        class_name : str
+            The name of the class the objects belong to.
+        columns : Mapping[str, Sequence]
+            The property values, one sequence per property name. The n-th object gets the n-th
+            value of every sequence. Objects with `numpy.ndarray`, `pandas.Series` or other
+            sequences that have a `tolist` method are converted in one call per sequence.
+        vectors : Sequence or None, optional
+            The embeddings of the objects, one row per object. A 2-D `numpy.ndarray`, `torch.Tensor`
+            or list of vectors, by default None.
+        uuids : Sequence or None, optional
+            The UUIDs of the objects. If None UUIDv4s will be generated, by default None.
+        tenant: str, optional
+            Tenant of the objects.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the added objects.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If the columns, vectors and uuids have different lengths or an 'uuid' is not of a
+            proper form.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError("Class name must be of type str")
+
+        names = list(columns)
+        values = [_to_list(columns[name]) for name in names]
+        lengths = {len(column) for column in values}
+        vector_rows = _to_list(vectors) if vectors is not None else None
+        if vector_rows is not None:
+            lengths.add(len(vector_rows))
+        if uuids is not None:
+            lengths.add(len(uuids))
+        if len(lengths) > 1:
+            raise ValueError("All columns, vectors and uuids must have the same length.")
+        num_objects = lengths.pop() if len(lengths) > 0 else 0
+
+        rows = zip(*values) if len(values) > 0 else ([] for _ in range(num_objects))
+        added_uuids = []
+        for i, row in enumerate(rows):
+            valid_uuid = get_valid_uuid(uuids[i] if uuids is not None else uuid4())
+            batch_item = {
+                "class": class_name,
+                "properties": dict(zip(names, row)),
+                "id": valid_uuid,
+            }
+            if vector_rows is not None:
+                batch_item["vector"] = (
+                    vector_rows[i]
+                    if isinstance(vector_rows[i], list)
+                    else get_vector(vector_rows[i])
+                )
+            if tenant is not None:
+                batch_item["tenant"] = tenant
+            self._items.append(batch_item)
+            added_uuids.append(valid_uuid)
+
+        return added_uuids
+
     def get_request_body(self) -> Dict[str, Any]:
         """
         Get the request body as it is needed for the Weaviate server.
@@ -313,6 +466,54 @@ class ObjectsBatchRequest(BatchRequest):
 
         return {"fields": ["ALL"], "objects": self._items}
 
+    def get_grpc_request_body(
+        self,
+        consistency_level: Optional[str] = None,
+        property_schemas: Optional[Mapping[str, Dict[str, Dict[str, Any]]]] = None,
+    ) -> "batch_pb2.BatchObjectsRequest":
+        """
+        Get the request body as it is needed for the `BatchObjects` gRPC call of the Weaviate server.
+
+        Parameters
+        ----------
+        consistency_level : Optional[str], optional
+            The consistency level of the request, e.g. 'ONE', 'QUORUM' or 'ALL', by default None.
+        property_schemas : Optional[Mapping[str, Dict[str, Dict[str, Any]]]], optional
+            The property schemas of the classes (see `_get_property_schemas`) by class name, used
+            to send the arrays and references with their data type, by default None. The types of
+            the properties of other classes are derived from their values.
+
+        Returns
+        -------
+        batch_pb2.BatchObjectsRequest
+            The request body as a protobuf message.
+        """
+
+        from weaviate.proto.v1 import base_pb2, batch_pb2
+
+        return batch_pb2.BatchObjectsRequest(
+            objects=[
+                batch_pb2.BatchObject(
+                    uuid=item["id"],
+                    vector=item.get("vector", None),
+                    properties=_properties_to_grpc(
+                        item["properties"],
+                        property_schemas.get(item["class"], None)
+                        if property_schemas is not None
+                        else None,
+                    ),
+                    collection=item["class"],
+                    tenant=item.get("tenant", None),
+                )
+                for item in self._items
+            ],
+            consistency_level=base_pb2.ConsistencyLevel.Value(
+                "CONSISTENCY_LEVEL_" + consistency_level
+            )
+            if consistency_level is not None
+            else None,
+        )
+
     def add_failed_objects_from_response(
         self,
         response: BatchResponse,
@@ -325,11 +526,291 @@ class ObjectsBatchRequest(BatchRequest):
             if self._skip_objects_retry(obj, errors_to_exclude, errors_to_include):
                 successful_responses.append(obj)
                 continue
+            # the response is not used afterwards, so its properties do not need to be copied
             self.add(
                 data_object=obj["properties"],
                 class_name=obj["class"],
                 uuid=obj["id"],
                 vector=obj.get("vector", None),
                 tenant=obj.get("tenant", None),
+                copy_object=False,
             )
         return successful_responses
+
+    def get_grpc_response(self, reply: "batch_pb2.BatchObjectsReply") -> BatchResponse:
+        """
+        Convert the reply of the `BatchObjects` gRPC call into the response format of the REST
+        batch endpoint. Vectors are only included for objects that failed, so they can be retried.
+
+        Parameters
+        ----------
+        reply : batch_pb2.BatchObjectsReply
+            The reply of the gRPC call for the objects of this batch.
+
+        Returns
+        -------
+        BatchResponse
+            The status of every object in the batch.
+        """
+
+        errors = {error.index: error.error for error in reply.errors}
+        response: BatchResponse = []
+        for index, item in enumerate(self._items):
+            entry = {key: value for key, value in item.items() if key != "vector"}
+            if index in errors:
+                if "vector" in item:
+                    entry["vector"] = item["vector"]
+                entry["result"] = {"errors": {"error": [{"message": errors[index]}]}}
+            else:
+                entry["result"] = {}
+            response.append(entry)
+        return response
+
+
+def _estimate_num_bytes(item: Dict[str, Any]) -> int:
+    """
+    Estimate the size of a batch item encoded as JSON, values that are not JSON serializable (e.g.
+    NumPy arrays for codecs that support them) are estimated from their list representation.
+    """
+
+    return len(json.dumps(item, default=_to_json_estimate)) + 1  # with the separator
+
+
+def _to_json_estimate(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _to_list(values: Sequence) -> list:
+    """
+    Convert a sequence to a list of python objects, using its `tolist` method if available (e.g.
+    `numpy.ndarray`, `pandas.Series` or `torch.Tensor`).
+
+    Parameters
+    ----------
+    values : Sequence
+        The sequence to convert.
+
+    Returns
+    -------
+    list
+        The values as a list.
+    """
+
+    if isinstance(values, list):
+        return values
+    if hasattr(values, "tolist"):
+        return values.tolist()  # type: ignore
+    return list(values)
+
+
+# array data types of the schema and the gRPC properties they are sent as
+_GRPC_ARRAY_PROPERTIES = {
+    "int[]": ("int_array_properties", "IntArrayProperties"),
+    "number[]": ("number_array_properties", "NumberArrayProperties"),
+    "boolean[]": ("boolean_array_properties", "BooleanArrayProperties"),
+    "text[]": ("text_array_properties", "TextArrayProperties"),
+    "string[]": ("text_array_properties", "TextArrayProperties"),
+    "date[]": ("text_array_properties", "TextArrayProperties"),
+    "uuid[]": ("text_array_properties", "TextArrayProperties"),
+}
+
+
+def _get_property_schemas(properties: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the properties of a class schema by name, the nested properties of object properties are
+    indexed the same way. The result is passed to `ObjectsBatchRequest.get_grpc_request_body`.
+
+    Parameters
+    ----------
+    properties : List[Dict[str, Any]]
+        The 'properties' of a class schema, see `client.schema.get(class_name)`.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        The 'dataType' and the indexed 'nestedProperties' of every property, by property name.
+    """
+
+    return {
+        prop["name"]: {
+            "dataType": prop["dataType"],
+            "nestedProperties": _get_property_schemas(prop.get("nestedProperties", None) or []),
+        }
+        for prop in properties
+    }
+
+
+def _split_grpc_properties(
+    properties: Dict[str, Any], schemas: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Sort the properties of a data object into the typed fields of the gRPC properties messages.
+    Arrays and references are sent with the data type of the schema. Properties that are not in the
+    schema (yet) get the type of their values. Everything that is not a reference, a nested object
+    or a homogeneous array of primitives is sent as a generic struct, as are the object-like values
+    of other data types (e.g. 'geoCoordinates').
+
+    Parameters
+    ----------
+    properties : Dict[str, Any]
+        The properties of a data object as they would be sent to the REST API.
+    schemas : Optional[Dict[str, Dict[str, Any]]], optional
+        The property schemas of the class of the object, see `_get_property_schemas`, by default
+        None.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The keyword arguments for `batch_pb2.BatchObject.Properties` or
+        `base_pb2.ObjectPropertiesValue`. The keys 'single_target_ref_props' and
+        'multi_target_ref_props' are only present if the properties contain references.
+
+    Raises
+    ------
+    ValueError
+        If a beacon of a multi-target reference property does not contain the class of the
+        referenced object.
+    """
+
+    from weaviate.proto.v1 import base_pb2, batch_pb2
+
+    fields: Dict[str, Any] = {
+        "non_ref_properties": {},
+        "number_array_properties": [],
+        "int_array_properties": [],
+        "text_array_properties": [],
+        "boolean_array_properties": [],
+        "object_properties": [],
+        "object_array_properties": [],
+    }
+    for name, value in properties.items():
+        schema = schemas.get(name, None) if schemas is not None else None
+        data_types: List[str] = schema["dataType"] if schema is not None else []
+        nested = schema["nestedProperties"] if schema is not None else None
+
+        if len(data_types) > 0 and isinstance(value, list):
+            data_type = data_types[0]
+            if data_type[0].isupper():  # the class of the referenced objects
+                if len(data_types) > 1:
+                    fields.setdefault("multi_target_ref_props", []).extend(
+                        _get_multi_target_refs(name, value)
+                    )
+                else:
+                    fields.setdefault("single_target_ref_props", []).append(
+                        batch_pb2.BatchObject.SingleTargetRefProps(
+                            prop_name=name, uuids=_get_beacon_uuids(value)
+                        )
+                    )
+                continue
+            if data_type in _GRPC_ARRAY_PROPERTIES:
+                key, message = _GRPC_ARRAY_PROPERTIES[data_type]
+                fields[key].append(getattr(base_pb2, message)(prop_name=name, values=value))
+                continue
+            if data_type == "object[]":
+                fields["object_array_properties"].append(
+                    base_pb2.ObjectArrayProperties(
+                        prop_name=name,
+                        values=[_object_properties_to_grpc(entry, nested) for entry in value],
+                    )
+                )
+                continue
+
+        if isinstance(value, dict) and len(data_types) > 0 and data_types[0] != "object":
+            # e.g. 'geoCoordinates' and 'phoneNumber', weaviate parses them from a generic struct
+            fields["non_ref_properties"][name] = value
+        elif isinstance(value, dict):
+            fields["object_properties"].append(
+                base_pb2.ObjectProperties(
+                    prop_name=name, value=_object_properties_to_grpc(value, nested)
+                )
+            )
+        elif not isinstance(value, list) or len(value) == 0:
+            fields["non_ref_properties"][name] = value
+        elif all(isinstance(entry, dict) for entry in value):
+            if all("beacon" in entry for entry in value):
+                fields.setdefault("single_target_ref_props", []).append(
+                    batch_pb2.BatchObject.SingleTargetRefProps(
+                        prop_name=name, uuids=_get_beacon_uuids(value)
+                    )
+                )
+            else:
+                fields["object_array_properties"].append(
+                    base_pb2.ObjectArrayProperties(
+                        prop_name=name,
+                        values=[_object_properties_to_grpc(entry) for entry in value],
+                    )
+                )
+        elif all(isinstance(entry, bool) for entry in value):
+            fields["boolean_array_properties"].append(
+                base_pb2.BooleanArrayProperties(prop_name=name, values=value)
+            )
+        elif all(isinstance(entry, int) and not isinstance(entry, bool) for entry in value):
+            fields["int_array_properties"].append(
+                base_pb2.IntArrayProperties(prop_name=name, values=value)
+            )
+        elif all(
+            isinstance(entry, (int, float)) and not isinstance(entry, bool) for entry in value
+        ):
+            fields["number_array_properties"].append(
+                base_pb2.NumberArrayProperties(prop_name=name, values=value)
+            )
+        elif all(isinstance(entry, str) for entry in value):
+            fields["text_array_properties"].append(
+                base_pb2.TextArrayProperties(prop_name=name, values=value)
+            )
+        else:
+            fields["non_ref_properties"][name] = value
+    return fields
+
+
+def _get_beacon_uuids(beacons: List[Dict[str, str]]) -> List[str]:
+    return [entry["beacon"].rsplit("/", 1)[-1] for entry in beacons]
+
+
+def _get_multi_target_refs(
+    name: str, beacons: List[Dict[str, str]]
+) -> List["batch_pb2.BatchObject.MultiTargetRefProps"]:
+    """
+    Group the beacons of a multi-target reference property by the class of the referenced objects,
+    e.g. 'weaviate://localhost/Person/<uuid>'.
+    """
+
+    from weaviate.proto.v1 import batch_pb2
+
+    targets: Dict[str, List[str]] = {}
+    for entry in beacons:
+        path = entry["beacon"].split("://", 1)[-1].split("/")
+        if len(path) != 3:
+            raise ValueError(
+                f"The beacons of the multi-target reference property '{name}' must contain the "
+                f"class of the referenced object, e.g. 'weaviate://localhost/<ClassName>/<uuid>'. "
+                f"Given beacon: {entry['beacon']}."
+            )
+        targets.setdefault(path[1], []).append(path[2])
+    return [
+        batch_pb2.BatchObject.MultiTargetRefProps(
+            prop_name=name, uuids=uuids, target_collection=target
+        )
+        for target, uuids in targets.items()
+    ]
+
+
+def _properties_to_grpc(
+    properties: Dict[str, Any], schemas: Optional[Dict[str, Dict[str, Any]]] = None
+) -> "batch_pb2.BatchObject.Properties":
+    from weaviate.proto.v1 import batch_pb2
+
+    return batch_pb2.BatchObject.Properties(**_split_grpc_properties(properties, schemas))
+
+
+def _object_properties_to_grpc(
+    properties: Dict[str, Any], schemas: Optional[Dict[str, Dict[str, Any]]] = None
+) -> "base_pb2.ObjectPropertiesValue":
+    from weaviate.proto.v1 import base_pb2
+
+    fields = _split_grpc_properties(properties, schemas)
+    if "single_target_ref_props" in fields or "multi_target_ref_props" in fields:
+        raise ValueError("Nested objects cannot contain references.")
+    return base_pb2.ObjectPropertiesValue(**fields)
@@ -0,0 +1,174 @@
+"""
+NodeRouter class definition.
+"""
+import threading
+import time
+from numbers import Real
+from typing import Dict, List, Optional, Tuple
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.connect import Connection
+from weaviate.exceptions import UnexpectedStatusCodeException, EmptyResponseException
+from weaviate.util import _check_positive_num
+from .requests import BatchRequest, ObjectsBatchRequest, ReferenceBatchRequest
+from ..cluster import Cluster
+
+
+class NodeRouter:
+    """
+    Routes the batch requests of a `weaviate.batch.Batch` to the nodes that own the shards of the
+    objects, instead of sending everything to the URL of the client and letting that node forward
+    the objects to the shard owners. This saves one hop inside the cluster for every object.
+
+    The shard layout is read from the verbose nodes status (`Cluster.get_nodes_status`) and
+    refreshed every `refresh_interval` seconds. Weaviate does not report the network address of
+    its nodes, so they have to be given as `node_urls`, a mapping from the node name (see
+    `client.cluster.get_nodes_status()`) to the URL of that node.
+
+    An object is routed if its shard is known on the client side, i.e. the class is multi-tenant
+    (the tenant is the shard) or has a single shard. Objects of classes with several shards are
+    sent to the URL of the client, because the hash ring that maps UUIDs to shards is not exposed
+    by Weaviate. References are routed by the class and tenant of their source object. If a node
+    cannot be reached its objects are sent to the URL of the client and the layout is refreshed.
+
+    Examples
+    --------
+    >>> router = weaviate.NodeRouter(
+    ...     {
+    ...         "weaviate-0": "http://weaviate-0.weaviate-headless:8080",
+    ...         "weaviate-1": "http://weaviate-1.weaviate-headless:8080",
+    ...     }
+    ... )
+    >>> with client.batch(batch_size=100, node_router=router) as batch:
+    ...     for obj in objects:
+    ...         batch.add_data_object(obj["properties"], "Article", tenant=obj["tenant"])
+    """
+
+    def __init__(self, node_urls: Dict[str, str], refresh_interval: float = 60):
+        """
+        Initialize a NodeRouter class instance.
+
+        Parameters
+        ----------
+        node_urls : Dict[str, str]
+            The URL of each node of the cluster, by node name, e.g.
+            {"weaviate-0": "http://weaviate-0.weaviate-headless:8080"}.
+        refresh_interval : Real, optional
+            How often the shard layout is read again, in seconds, by default 60.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If `refresh_interval` is not positive.
+        """
+
+        if not isinstance(node_urls, dict) or not all(
+            isinstance(name, str) and isinstance(url, str) for name, url in node_urls.items()
+        ):
+            raise TypeError(
+                f"'node_urls' must be of type Dict[str, str]. Given type: {type(node_urls)}."
+            )
+        _check_positive_num(refresh_interval, "refresh_interval", Real)
+
+        self._node_urls = {name: url.rstrip("/") for name, url in node_urls.items()}
+        self._refresh_interval = float(refresh_interval)
+        self._lock = threading.Lock()
+        # class name -> shard name -> names of the healthy nodes holding that shard
+        self._layout: Dict[str, Dict[str, List[str]]] = {}
+        self._refreshed_at: Optional[float] = None
+
+    @property
+    def node_urls(self) -> Dict[str, str]:
+        """
+        The URL of each node, by node name.
+        """
+
+        return dict(self._node_urls)
+
+    def _split(
+        self, data_type: str, batch_request: BatchRequest, connection: Connection
+    ) -> List[Tuple[Optional[str], BatchRequest]]:
+        """
+        Split a batch request into one request per node.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of the batch request, either 'objects' or 'references'.
+        batch_request : BatchRequest
+            The batch request to split.
+        connection : weaviate.connect.Connection
+            The connection used to read the shard layout.
+
+        Returns
+        -------
+        List[Tuple[Optional[str], BatchRequest]]
+            The URL of the node and the items to send to it. The URL is None for the items whose
+            node is not known, they are sent to the URL of the client.
+        """
+
+        layout = self._get_layout(connection)
+        groups: Dict[Optional[str], BatchRequest] = {}
+        for item in batch_request._items:
+            if data_type == "objects":
+                class_name = item["class"]
+            else:
+                # weaviate://localhost/<class>/<uuid>/<property>
+                class_name = item["from"].split("/")[3]
+            url = self._get_node_url(layout, class_name, item.get("tenant", None))
+            if url not in groups:
+                groups[url] = (
+                    ObjectsBatchRequest() if data_type == "objects" else ReferenceBatchRequest()
+                )
+            groups[url]._items.append(item)
+        return list(groups.items())
+
+    def _invalidate(self) -> None:
+        """
+        Read the shard layout again before the next batch request, e.g. after a node failed.
+        """
+
+        with self._lock:
+            self._refreshed_at = None
+
+    def _get_node_url(
+        self, layout: Dict[str, Dict[str, List[str]]], class_name: str, tenant: Optional[str]
+    ) -> Optional[str]:
+        shards = layout.get(class_name)
+        if shards is None:
+            return None
+        if tenant is not None:
+            nodes = shards.get(tenant)
+        elif len(shards) == 1:
+            nodes = next(iter(shards.values()))
+        else:
+            return None
+        if nodes is None or len(nodes) == 0:
+            return None
+        return self._node_urls[nodes[0]]
+
+    def _get_layout(self, connection: Connection) -> Dict[str, Dict[str, List[str]]]:
+        with self._lock:
+            now = time.time()
+            if self._refreshed_at is not None and now - self._refreshed_at < self._refresh_interval:
+                return self._layout
+            self._refreshed_at = now
+            try:
+                nodes = Cluster(connection).get_nodes_status(output="verbose")
+            except (RequestsConnectionError, UnexpectedStatusCodeException, EmptyResponseException):
+                # keep the last known layout, it is read again after `refresh_interval`
+                return self._layout
+
+            layout: Dict[str, Dict[str, List[str]]] = {}
+            for node in nodes:
+                routable = node.get("status") == "HEALTHY" and node.get("name") in self._node_urls
+                for shard in node.get("shards") or []:
+                    # shards of other nodes are kept, so the number of shards of a class is right
+                    owners = layout.setdefault(shard["class"], {}).setdefault(shard["name"], [])
+                    if routable:
+                        owners.append(node["name"])
+            self._layout = layout
+            return layout
@@ -0,0 +1,276 @@
+"""
+BatchSpool class definition.
+"""
+import os
+import threading
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+from weaviate.codec import JsonCodec
+from weaviate.util import _check_positive_num
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".jsonl"
+
+
+class BatchSpool:
+    """
+    Write-ahead spool of a `weaviate.batch.Batch`, used to resume an import after the importing
+    process died. Every object and reference is written to append-only segment files in
+    `directory` when it is added to the batch and acknowledged once the batch request that
+    contained it was answered successfully by Weaviate. Segments whose items are all acknowledged
+    are deleted.
+
+    When a spool is opened on a directory that still contains unacknowledged items, these are
+    re-added to the batch by `Batch.resume_from_spool`, everything else is skipped.
+
+    Items are written to the operating system as soon as they are added, so they survive a crash
+    of the process. They are synced to disk before each batch request is sent, so a crash of the
+    machine loses at most the items that were added since the last batch request.
+
+    Examples
+    --------
+    >>> spool = weaviate.BatchSpool("/var/lib/importer/spool")
+    >>> with client.batch(batch_size=100, spool=spool) as batch:
+    ...     batch.resume_from_spool()  # items of a previous, crashed run
+    ...     for obj in objects_not_imported_yet():
+    ...         batch.add_data_object(obj, "Article", uuid=obj["id"])
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 10_000,
+        codec: Optional[JsonCodec] = None,
+    ):
+        """
+        Initialize a BatchSpool class instance, creating `directory` if it does not exist and
+        reading the unacknowledged items of the segments in it.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the segment files. It must not be used by another spool at the
+            same time.
+        segment_size : int, optional
+            The number of items written to a segment file before a new one is started, by
+            default 10000.
+        codec : weaviate.JsonCodec, optional
+            The codec used to encode the items, by default `weaviate.JsonCodec`.
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If `segment_size` is not positive.
+        """
+
+        _check_positive_num(segment_size, "segment_size", int)
+        if codec is not None and not isinstance(codec, JsonCodec):
+            raise TypeError(f"'codec' must be of type {JsonCodec}, given type: {type(codec)}.")
+
+        self._directory = directory
+        self._segment_size = segment_size
+        self._codec = JsonCodec() if codec is None else codec
+        self._lock = threading.Lock()
+
+        # seq of every unacknowledged item -> its segment, and the number of such items per segment
+        self._pending_seqs: Dict[int, int] = {}
+        self._pending_per_segment: Dict[int, int] = {}
+        # id of the items added to the batch -> (item, seq), the items are kept alive so the ids
+        # are not reused before they are acknowledged
+        self._seqs_by_item: Dict[int, Tuple[Dict[str, Any], int]] = {}
+
+        os.makedirs(directory, exist_ok=True)
+        self._recovered = self._read_segments()
+        segments = self._segment_numbers()
+        self._next_seq = max(self._pending_seqs, default=-1) + 1
+        self._segment = segments[-1] + 1 if len(segments) > 0 else 0
+        self._items_in_segment = 0
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the segment files.
+        """
+
+        return self._directory
+
+    @property
+    def num_pending(self) -> int:
+        """
+        The number of items that were not acknowledged yet, including the ones of previous runs.
+        """
+
+        return len(self._pending_seqs)
+
+    def append(self, data_type: str, items: List[Dict[str, Any]]) -> None:
+        """
+        Write items that were added to the batch.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of the items, either 'objects' or 'references'.
+        items : List[dict]
+            The items as they are sent to Weaviate, i.e. the entries of the batch request.
+
+        Raises
+        ------
+        TypeError
+            If an item cannot be encoded by the codec.
+        """
+
+        if len(items) == 0:
+            return
+        with self._lock:
+            for item in items:
+                if self._file is None or self._items_in_segment >= self._segment_size:
+                    self._rotate()
+                assert self._file is not None
+                seq = self._next_seq
+                self._file.write(
+                    self._codec.encode({"seq": seq, "type": data_type, "item": item}) + b"\n"
+                )
+                self._next_seq += 1
+                self._items_in_segment += 1
+                self._pending_seqs[seq] = self._segment
+                self._pending_per_segment[self._segment] = (
+                    self._pending_per_segment.get(self._segment, 0) + 1
+                )
+                self._seqs_by_item[id(item)] = (item, seq)
+            assert self._file is not None
+            self._file.flush()
+
+    def ack(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Acknowledge items, they are not re-added on resume anymore. Items that were not written to
+        the spool are ignored.
+
+        Parameters
+        ----------
+        items : List[dict]
+            The acknowledged items, the same dicts that were given to `append`.
+        """
+
+        with self._lock:
+            seqs = []
+            for item in items:
+                entry = self._seqs_by_item.get(id(item))
+                if entry is None or entry[0] is not item:
+                    continue
+                del self._seqs_by_item[id(item)]
+                seqs.append(entry[1])
+            if len(seqs) == 0:
+                return
+
+            if self._file is None:
+                self._rotate()
+            assert self._file is not None
+            self._file.write(self._codec.encode({"ack": seqs}) + b"\n")
+            self._file.flush()
+            for seq in seqs:
+                segment = self._pending_seqs.pop(seq)
+                self._pending_per_segment[segment] -= 1
+            self._remove_acknowledged_segments()
+
+    def sync(self) -> None:
+        """
+        Sync the written items to disk.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """
+        Sync and close the current segment file. The spool can still be used afterwards, a new
+        segment file is started.
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+
+    def _recover(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the unacknowledged items of previous runs, only once. From now on they are tracked as
+        the items added to the batch, without writing them again.
+
+        Returns
+        -------
+        List[Tuple[str, dict]]
+            The data type and the item, in the order they were added.
+        """
+
+        with self._lock:
+            recovered, self._recovered = self._recovered, []
+            items = []
+            for seq, data_type, item in recovered:
+                self._seqs_by_item[id(item)] = (item, seq)
+                items.append((data_type, item))
+            return items
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._segment += 1
+        self._file = open(self._segment_path(self._segment), "ab")
+        self._items_in_segment = 0
+        self._remove_acknowledged_segments()
+
+    def _remove_acknowledged_segments(self) -> None:
+        """
+        Delete the oldest segments as long as all their items are acknowledged. Segments are
+        deleted in order, so the acknowledgements of the remaining items are never deleted.
+        """
+
+        for segment in self._segment_numbers():
+            if segment == self._segment or self._pending_per_segment.get(segment, 0) > 0:
+                return
+            os.remove(self._segment_path(segment))
+            self._pending_per_segment.pop(segment, None)
+
+    def _read_segments(self) -> List[Tuple[int, str, Dict[str, Any]]]:
+        added: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        for segment in self._segment_numbers():
+            with open(self._segment_path(segment), "rb") as file:
+                for line in file:
+                    try:
+                        record = self._codec.decode(line)
+                    except ValueError:
+                        # the last line of a segment is incomplete if the process died while
+                        # writing it
+                        continue
+                    if "ack" in record:
+                        for seq in record["ack"]:
+                            added.pop(seq, None)
+                    else:
+                        added[record["seq"]] = (record["type"], record["item"])
+                        self._pending_seqs[record["seq"]] = segment
+
+        for seq, segment in list(self._pending_seqs.items()):
+            if seq not in added:
+                del self._pending_seqs[seq]
+                continue
+            self._pending_per_segment[segment] = self._pending_per_segment.get(segment, 0) + 1
+        return [(seq, data_type, item) for seq, (data_type, item) in sorted(added.items())]
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self._directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                number = name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]
+                if number.isdigit():
+                    numbers.append(int(number))
+        return sorted(numbers)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._directory, f"{_SEGMENT_PREFIX}{segment:08d}{_SEGMENT_SUFFIX}")
@@ -0,0 +1,280 @@
+"""
+Metrics of the batch requests sent by a `weaviate.batch.Batch`.
+"""
+import bisect
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+# upper bounds of the histogram buckets, the last bucket holds everything above
+LATENCY_BOUNDS: Tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+PAYLOAD_SIZE_BOUNDS: Tuple[float, ...] = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+
+@dataclass(frozen=True)
+class BatchRequestEvent:
+    """
+    One attempt to send a batch request, given to the `stats_listener` of a batch.
+
+    Attributes
+    ----------
+    data_type : str
+        The type of the batch request, either 'objects' or 'references'.
+    num_items : int
+        The number of objects or references in the request.
+    num_bytes : int or None
+        The size of the encoded request body, None for gRPC requests.
+    serialization_time : float
+        How long encoding the request body took in seconds, 0 for gRPC requests (where it is
+        part of the network time).
+    network_time : float
+        How long sending the request and receiving the response took in seconds.
+    throttle_time : float
+        How long the request waited for the rate limiter in seconds.
+    outcome : str
+        'success', 'timeout', 'connection_error' or 'status_code' (Weaviate returned a non-OK
+        status).
+    status_code : int or None
+        The HTTP status code of the response, None if there was no response.
+    attempt : int
+        The number of the attempt, starting at 1 for the first one.
+    timestamp : float
+        When the attempt finished, as a UNIX timestamp.
+    """
+
+    data_type: str
+    num_items: int
+    num_bytes: Optional[int]
+    serialization_time: float
+    network_time: float
+    throttle_time: float
+    outcome: str
+    status_code: Optional[int]
+    attempt: int
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class Histogram:
+    """
+    Distribution of a measured value.
+
+    Attributes
+    ----------
+    bounds : Tuple[float, ...]
+        The upper bounds of the buckets, the last bucket has no upper bound.
+    counts : Tuple[int, ...]
+        The number of values per bucket, one more than there are bounds.
+    count : int
+        The number of values.
+    total : float
+        The sum of all values.
+    """
+
+    bounds: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    count: int
+    total: float
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        The mean of the values, None if there are none.
+        """
+
+        return None if self.count == 0 else self.total / self.count
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """
+    Snapshot of the metrics of a batch, see `weaviate.batch.Batch.stats`.
+
+    Attributes
+    ----------
+    requests : Dict[str, int]
+        The number of request attempts by data type ('objects' and 'references').
+    items : Dict[str, int]
+        The number of objects and references sent successfully.
+    bytes_sent : int
+        The size of all request bodies that were sent through REST.
+    latency : Histogram
+        The network time of the request attempts in seconds.
+    payload_size : Histogram
+        The size of the request bodies in bytes.
+    serialization_time : float
+        The time spent encoding request bodies in seconds.
+    network_time : float
+        The time spent waiting for Weaviate in seconds, across all workers.
+    throttle_time : float
+        The time spent waiting for the rate limiter in seconds, across all workers.
+    outcomes : Dict[str, int]
+        The number of request attempts by outcome, see `BatchRequestEvent.outcome`.
+    retries : Dict[str, int]
+        The number of retries by reason: 'timeout', 'connection_error' and 'weaviate_error'
+        (items that Weaviate returned an error for, see `weaviate.WeaviateErrorRetryConf`).
+    server_queue_length : int or None
+        The last known length of the longest batch queue of the nodes of Weaviate.
+    queued_requests : int
+        The number of batch requests waiting to be sent or being sent.
+    active_workers : int
+        The number of threads sending a batch request right now.
+    recommended_sizes : List[Tuple[float, Optional[int], Optional[int]]]
+        The timestamp, recommended number of objects and recommended number of references, for
+        the most recent changes of the recommended sizes.
+    callback_time : float
+        The time spent in the callback in seconds, across all threads.
+    callback_wait_time : float
+        The time the sending threads waited for space in the full callback queue in seconds, see
+        `callback_delivery` of `weaviate.batch.Batch.configure`.
+    callback_queue_length : int
+        The number of results waiting for the callback.
+    """
+
+    requests: Dict[str, int]
+    items: Dict[str, int]
+    bytes_sent: int
+    latency: Histogram
+    payload_size: Histogram
+    serialization_time: float
+    network_time: float
+    throttle_time: float
+    outcomes: Dict[str, int]
+    retries: Dict[str, int]
+    server_queue_length: Optional[int]
+    queued_requests: int
+    active_workers: int
+    recommended_sizes: List[Tuple[float, Optional[int], Optional[int]]]
+    callback_time: float
+    callback_wait_time: float
+    callback_queue_length: int
+
+
+@dataclass
+class _RequestTimer:
+    """
+    Serialization time and size of the bodies of one request attempt, filled while it is sent.
+    """
+
+    serialization_time: float = 0.0
+    num_bytes: Optional[int] = None
+
+    def add_body(self, serialization_time: float, num_bytes: int) -> None:
+        self.serialization_time += serialization_time
+        self.num_bytes = num_bytes + (0 if self.num_bytes is None else self.num_bytes)
+
+
+class _Histogram:
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+
+    def add(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._total += value
+
+    def snapshot(self) -> Histogram:
+        return Histogram(self._bounds, tuple(self._counts), self._count, self._total)
+
+
+class _BatchMetrics:
+    """
+    Thread-safe collector of the metrics of a batch.
+    """
+
+    def __init__(self, max_recommended_sizes: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._requests: Dict[str, int] = {}
+        self._items: Dict[str, int] = {}
+        self._bytes_sent = 0
+        self._latency = _Histogram(LATENCY_BOUNDS)
+        self._payload_size = _Histogram(PAYLOAD_SIZE_BOUNDS)
+        self._serialization_time = 0.0
+        self._network_time = 0.0
+        self._throttle_time = 0.0
+        self._outcomes: Dict[str, int] = {}
+        self._retries: Dict[str, int] = {}
+        self._active_workers = 0
+        self._callback_time = 0.0
+        self._callback_wait_time = 0.0
+        self._recommended_sizes: Deque[Tuple[float, Optional[int], Optional[int]]] = deque(
+            maxlen=max_recommended_sizes
+        )
+
+    @property
+    def active_workers(self) -> int:
+        return self._active_workers
+
+    def start_request(self) -> None:
+        with self._lock:
+            self._active_workers += 1
+
+    def finish_request(self) -> None:
+        with self._lock:
+            self._active_workers -= 1
+
+    def add_event(self, event: BatchRequestEvent) -> None:
+        with self._lock:
+            self._requests[event.data_type] = self._requests.get(event.data_type, 0) + 1
+            self._outcomes[event.outcome] = self._outcomes.get(event.outcome, 0) + 1
+            if event.outcome == "success":
+                self._items[event.data_type] = self._items.get(event.data_type, 0) + event.num_items
+            if event.num_bytes is not None:
+                self._bytes_sent += event.num_bytes
+                self._payload_size.add(event.num_bytes)
+            self._latency.add(event.network_time)
+            self._serialization_time += event.serialization_time
+            self._network_time += event.network_time
+            self._throttle_time += event.throttle_time
+
+    def add_retry(self, reason: str) -> None:
+        with self._lock:
+            self._retries[reason] = self._retries.get(reason, 0) + 1
+
+    def add_callback(self, callback_time: float, wait_time: float = 0.0) -> None:
+        with self._lock:
+            self._callback_time += callback_time
+            self._callback_wait_time += wait_time
+
+    def add_recommended_sizes(
+        self, num_objects: Optional[int], num_references: Optional[int]
+    ) -> None:
+        with self._lock:
+            if len(self._recommended_sizes) > 0 and self._recommended_sizes[-1][1:] == (
+                num_objects,
+                num_references,
+            ):
+                return
+            self._recommended_sizes.append((time.time(), num_objects, num_references))
+
+    def snapshot(
+        self,
+        server_queue_length: Optional[int],
+        queued_requests: int,
+        callback_queue_length: int = 0,
+    ) -> BatchStats:
+        with self._lock:
+            return BatchStats(
+                requests=dict(self._requests),
+                items=dict(self._items),
+                bytes_sent=self._bytes_sent,
+                latency=self._latency.snapshot(),
+                payload_size=self._payload_size.snapshot(),
+                serialization_time=self._serialization_time,
+                network_time=self._network_time,
+                throttle_time=self._throttle_time,
+                outcomes=dict(self._outcomes),
+                retries=dict(self._retries),
+                server_queue_length=server_queue_length,
+                queued_requests=queued_requests,
+                active_workers=self._active_workers,
+                recommended_sizes=list(self._recommended_sizes),
+                callback_time=self._callback_time,
+                callback_wait_time=self._callback_wait_time,
+                callback_queue_length=callback_queue_length,
+            )
@@ -1,7 +1,7 @@
 """
 Client class definition.
 """
-from typing import Optional, Tuple, Union, Dict, Any
+from typing import List, Optional, Tuple, Union, Dict, Any
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
@@ -53,7 +53,7 @@ class Client:
 
     def __init__(
         self,
-        url: Optional[str] = None,
+        url: Union[str, List[str], None] = None,
         auth_client_secret: Optional[AuthCredentials] = None,
         timeout_config: TIMEOUT_TYPE = (10, 60),
         proxies: Union[dict, str, None] = None,
@@ -68,8 +68,10 @@ class Client:
 
         Parameters
         ----------
-        url : str
-            The URL to the weaviate instance.
+        url : str or List[str]
+            The URL to the weaviate instance, or the URLs of several nodes of a weaviate cluster.
+            The requests are balanced over the nodes that are ready and a node is skipped while
+            it cannot be reached, see `ConnectionConfig.load_balancing`.
         auth_client_secret : weaviate.AuthCredentials or None, optional
         # fmt: off
             Authenticate to weaviate by using one of the given authentication modes:
@@ -138,6 +140,52 @@ class Client:
         >>> from weaviate import Config
         >>> client = Client(additional_config=Config())
 
+        Creating a client without any network request, e.g. in a serverless function. The HTTP
+        session is created on the first request, without waiting for the 'startup_period', and
+        the version of Weaviate is read when it is needed, the check for a newer client version is
+        skipped:
+
+        >>> from weaviate import Config, ConnectionConfig
+        >>> client = Client(
+        ...     url = 'http://localhost:8080',
+        ...     additional_config=Config(
+        ...         connection_config=ConnectionConfig(lazy=True, check_client_version=False)
+        ...     ),
+        ... )
+
+        Creating a client that multiplexes its requests over HTTP/2 connections, which requires
+        `pip install weaviate-client[HTTP2]`. HTTP/2 is negotiated over TLS, sessions that
+        authenticate with OIDC keep using `requests`:
+
+        >>> client = Client(
+        ...     url = 'https://my-instance.weaviate.network',
+        ...     additional_config=Config(connection_config=ConnectionConfig(transport='http2')),
+        ... )
+
+        Balancing the requests over the nodes of a cluster:
+
+        >>> client = Client(
+        ...     url = ['http://node-0:8080', 'http://node-1:8080', 'http://node-2:8080'],
+        ...     additional_config=Config(
+        ...         connection_config=ConnectionConfig(load_balancing='power_of_two')
+        ...     ),
+        ... )
+
+        Retrying idempotent requests and GraphQL queries with backoff within 10 seconds per call,
+        with a longer budget for the schema, and failing fast while Weaviate is down:
+
+        >>> from weaviate import CircuitBreakerConfig, RetryPolicy
+        >>> client = Client(
+        ...     url = 'http://localhost:8080',
+        ...     additional_config=Config(
+        ...         connection_config=ConnectionConfig(
+        ...             retry_policy=RetryPolicy(max_retries=3, deadline=10),
+        ...             retry_policies={'schema': RetryPolicy(max_retries=5, deadline=60)},
+        ...             circuit_breaker=CircuitBreakerConfig(failure_threshold=5, recovery_time=30),
+        ...         )
+        ...     ),
+        ... )
+
 
         Raises
         ------
@@ -198,10 +246,13 @@ class Client:
             False otherwise.
         """
 
-        response = self._connection.get(path="/.well-known/live")
-        if response.status_code == 200:
-            return True
-        return False
+        try:
+            response = self._connection.get(path="/.well-known/live")
+            if response.status_code == 200:
+                return True
+            return False
+        except RequestsConnectionError:
+            return False
 
     def get_meta(self) -> dict:
         """
@@ -274,8 +325,8 @@ class Client:
 
     @staticmethod
     def __parse_url_and_embedded_db(
-        url: Optional[str], embedded_options: Optional[EmbeddedOptions]
-    ) -> Tuple[str, Optional[EmbeddedDB]]:
+        url: Union[str, List[str], None], embedded_options: Optional[EmbeddedOptions]
+    ) -> Tuple[Union[str, List[str]], Optional[EmbeddedDB]]:
         if embedded_options is None and url is None:
             raise TypeError("Either url or embedded options must be present.")
         elif embedded_options is not None and url is not None:
@@ -288,6 +339,10 @@ class Client:
             embedded_db.start()
             return f"http://localhost:{embedded_db.options.port}", embedded_db
 
+        if isinstance(url, list):
+            if len(url) == 0 or not all(isinstance(node_url, str) for node_url in url):
+                raise TypeError("URL is expected to be a non-empty list of strings.")
+            return [node_url.strip("/") for node_url in url], None
         if not isinstance(url, str):
             raise TypeError(f"URL is expected to be string but is {type(url)}")
         return url.strip("/"), None
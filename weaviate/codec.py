@@ -0,0 +1,108 @@
+"""
+JSON codecs used by the connection to encode request bodies and decode response bodies.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    has_orjson = True
+except ImportError:
+    has_orjson = False
+
+
+class JsonCodec:
+    """
+    Default JSON codec, based on the `json` module of the standard library.
+
+    Subclass it and override `encode` and `decode` to plug a different JSON implementation into the
+    client, see `weaviate.ConnectionConfig`.
+    """
+
+    def encode(self, obj: Any) -> bytes:
+        """
+        Encode a request payload to UTF-8 encoded JSON.
+
+        Parameters
+        ----------
+        obj : Any
+            The payload to encode.
+
+        Returns
+        -------
+        bytes
+            The encoded payload.
+
+        Raises
+        ------
+        ValueError
+            If the payload cannot be encoded, e.g. it contains NaN or infinite floats.
+        TypeError
+            If the payload contains objects that are not JSON serializable.
+        """
+
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a JSON response body.
+
+        Parameters
+        ----------
+        data : bytes
+            The raw response body.
+
+        Returns
+        -------
+        Any
+            The decoded response body.
+
+        Raises
+        ------
+        ValueError
+            If `data` is not valid JSON.
+        """
+
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec based on `orjson`. It encodes NumPy arrays (e.g. vectors) natively and decodes the
+    response bodies directly from bytes. Requires the optional `orjson` dependency.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an OrjsonCodec class instance.
+
+        Raises
+        ------
+        ImportError
+            If `orjson` is not installed.
+        """
+
+        if not has_orjson:
+            raise ImportError(
+                "OrjsonCodec requires the 'orjson' package. Install it with: "
+                "pip install weaviate-client[ORJSON]"
+            )
+        self._options = orjson.OPT_SERIALIZE_NUMPY
+
+    def encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=self._options)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """
+    Fallback for objects orjson cannot serialize natively, e.g. torch or tensorflow tensors and
+    non-contiguous NumPy arrays.
+    """
+
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
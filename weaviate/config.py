@@ -1,11 +1,96 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from weaviate.codec import JsonCodec
+
+TRANSPORTS = ("requests", "http2")
+LOAD_BALANCING_STRATEGIES = ("least_outstanding", "power_of_two")
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How the requests of the client are retried after a connection error, a timeout or one of the
+    `retry_status_codes`. The n-th retry waits a random time between half of and the full
+    `backoff_base * 2**n` seconds, capped at `backoff_max`. If `deadline` is set, a call including
+    all its retries takes at most `deadline` seconds. Only idempotent requests are retried (GET,
+    HEAD, PUT, DELETE and GraphQL queries), unless `retry_non_idempotent` is True.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10
+    deadline: Optional[float] = None
+    retry_status_codes: Tuple[int, ...] = (429, 502, 503, 504)
+    retry_non_idempotent: bool = False
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.max_retries, int) or isinstance(self.max_retries, bool):
+            raise TypeError(f"max_retries must be {int}, received {type(self.max_retries)}")
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be non-negative, received {self.max_retries}")
+        for name in ("backoff_base", "backoff_max", "deadline"):
+            value = getattr(self, name)
+            if value is None and name == "deadline":
+                continue
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                raise TypeError(f"{name} must be {float}, received {type(value)}")
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, received {value}")
+        if not isinstance(self.retry_status_codes, tuple) or not all(
+            isinstance(code, int) for code in self.retry_status_codes
+        ):
+            raise TypeError(
+                f"retry_status_codes must be a tuple of {int}, received {self.retry_status_codes}"
+            )
+        if not isinstance(self.retry_non_idempotent, bool):
+            raise TypeError(
+                f"retry_non_idempotent must be {bool}, received {type(self.retry_non_idempotent)}"
+            )
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """
+    After `failure_threshold` consecutive failed requests to a weaviate node (connection errors,
+    timeouts and the status codes 502, 503 and 504) the circuit breaker of the node opens and
+    requests to it fail immediately with `weaviate.WeaviateCircuitOpenError`. After
+    `recovery_time` seconds one trial request is sent, if it succeeds the circuit closes again.
+    """
+
+    failure_threshold: int = 5
+    recovery_time: float = 30
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.failure_threshold, int) or isinstance(self.failure_threshold, bool):
+            raise TypeError(
+                f"failure_threshold must be {int}, received {type(self.failure_threshold)}"
+            )
+        if self.failure_threshold < 1:
+            raise ValueError(
+                f"failure_threshold must be positive, received {self.failure_threshold}"
+            )
+        if not isinstance(self.recovery_time, (int, float)) or isinstance(self.recovery_time, bool):
+            raise TypeError(f"recovery_time must be {float}, received {type(self.recovery_time)}")
+        if self.recovery_time <= 0:
+            raise ValueError(f"recovery_time must be positive, received {self.recovery_time}")
 
 
 @dataclass
 class ConnectionConfig:
     session_pool_connections: int = 20
     session_pool_maxsize: int = 20
+    json_codec: Optional[JsonCodec] = None
+    compression: Optional[str] = None
+    compression_threshold: int = 1024
+    lazy: bool = False
+    check_client_version: bool = True
+    transport: str = "requests"
+    load_balancing: str = "least_outstanding"
+    health_check_interval: float = 5
+    retry_policy: Optional[RetryPolicy] = None
+    retry_policies: Optional[Dict[str, RetryPolicy]] = None
+    circuit_breaker: Optional[CircuitBreakerConfig] = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int):
@@ -16,6 +101,61 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_maxsize must be {int}, received {type(self.session_pool_maxsize)}"
             )
+        if self.json_codec is not None and not isinstance(self.json_codec, JsonCodec):
+            raise TypeError(f"json_codec must be {JsonCodec}, received {type(self.json_codec)}")
+        if self.compression is not None and self.compression not in ("gzip", "zstd"):
+            raise ValueError(
+                f"compression must be one of 'gzip', 'zstd' or None, received {self.compression}"
+            )
+        if not isinstance(self.compression_threshold, int):
+            raise TypeError(
+                f"compression_threshold must be {int}, received {type(self.compression_threshold)}"
+            )
+        if self.compression_threshold < 0:
+            raise ValueError(
+                f"compression_threshold must be non-negative, received {self.compression_threshold}"
+            )
+        if not isinstance(self.lazy, bool):
+            raise TypeError(f"lazy must be {bool}, received {type(self.lazy)}")
+        if not isinstance(self.check_client_version, bool):
+            raise TypeError(
+                f"check_client_version must be {bool}, received {type(self.check_client_version)}"
+            )
+        if self.transport not in TRANSPORTS:
+            raise ValueError(f"transport must be one of {TRANSPORTS}, received {self.transport}")
+        if self.load_balancing not in LOAD_BALANCING_STRATEGIES:
+            raise ValueError(
+                f"load_balancing must be one of {LOAD_BALANCING_STRATEGIES}, received "
+                f"{self.load_balancing}"
+            )
+        if not isinstance(self.health_check_interval, (int, float)) or isinstance(
+            self.health_check_interval, bool
+        ):
+            raise TypeError(
+                f"health_check_interval must be {float}, received {type(self.health_check_interval)}"
+            )
+        if self.health_check_interval <= 0:
+            raise ValueError(
+                f"health_check_interval must be positive, received {self.health_check_interval}"
+            )
+        if self.retry_policy is not None and not isinstance(self.retry_policy, RetryPolicy):
+            raise TypeError(
+                f"retry_policy must be {RetryPolicy}, received {type(self.retry_policy)}"
+            )
+        if self.retry_policies is not None and (
+            not isinstance(self.retry_policies, dict)
+            or not all(isinstance(policy, RetryPolicy) for policy in self.retry_policies.values())
+        ):
+            raise TypeError(
+                f"retry_policies must be a dict of {RetryPolicy}, received {self.retry_policies}"
+            )
+        if self.circuit_breaker is not None and not isinstance(
+            self.circuit_breaker, CircuitBreakerConfig
+        ):
+            raise TypeError(
+                f"circuit_breaker must be {CircuitBreakerConfig}, received "
+                f"{type(self.circuit_breaker)}"
+            )
 
 
 @dataclass
@@ -0,0 +1,437 @@
+"""
+AsyncConnection class definition.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout, JSONDecodeError, ReadTimeout
+
+from weaviate.auth import AuthCredentials, AuthApiKey
+from weaviate.config import ConnectionConfig
+from weaviate.connect.authentication import _Auth
+from weaviate.connect.connection import _ConnectionBase, JSONPayload, TIMEOUT_TYPE_RETURN
+from weaviate.connect.transport import _to_requests_response
+from weaviate.exceptions import AuthenticationFailedException, WeaviateStartUpError
+from weaviate.util import (
+    _check_positive_num,
+    _decode_json_response_dict,
+    is_weaviate_domain,
+    is_weaviate_too_old,
+)
+from weaviate.warnings import _Warnings
+
+try:
+    import httpx
+
+    has_httpx = True
+except ImportError:
+    has_httpx = False
+
+try:
+    import grpc  # type: ignore
+    from weaviate.proto.v1 import weaviate_pb2_grpc
+
+    has_grpc = True
+
+except ImportError:
+    has_grpc = False
+
+
+class AsyncConnection(_ConnectionBase):
+    """
+    Connection class used to communicate asynchronously to a weaviate instance. The responses
+    are returned as `requests.Response` objects, so they can be handled like the ones of the
+    synchronous `Connection`.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth_client_secret: Optional[AuthCredentials],
+        timeout_config: TIMEOUT_TYPE_RETURN,
+        proxies: Union[dict, str, None],
+        trust_env: bool,
+        additional_headers: Optional[Dict[str, Any]],
+        startup_period: Optional[int],
+        connection_config: ConnectionConfig,
+        grpc_port: Optional[int] = None,
+    ):
+        """
+        Initialize an AsyncConnection class instance. No request is made before `connect` is
+        awaited.
+
+        Parameters
+        ----------
+        url : str
+            URL to a running weaviate instance.
+        auth_client_secret : weaviate.auth.AuthCredentials, optional
+            Credentials to authenticate with a weaviate instance.
+        timeout_config : tuple(float, float)
+            The (connect timeout, read timeout) for all requests to the Weaviate server.
+        proxies : dict, str or None
+            Proxies to be used for requests, see `weaviate.connect.Connection`.
+        trust_env : bool
+            Whether to read proxies from the ENV variables.
+        additional_headers : Dict[str, Any] or None
+            Additional headers to include in the requests.
+        startup_period : int or None
+            How long `connect` waits for weaviate to start before raising a WeaviateStartUpError.
+            If None it does not wait at all.
+        connection_config : weaviate.ConnectionConfig
+            The connection configuration. `session_pool_maxsize` caps the number of open connections,
+            requests above it wait for a free connection.
+        grpc_port : int, optional
+            The gRPC port of weaviate. If given, supported queries are sent through `grpc.aio`.
+
+        Raises
+        ------
+        ImportError
+            If `httpx` is not installed.
+        """
+
+        if not has_httpx:
+            raise ImportError(
+                "AsyncConnection requires the 'httpx' package. Install it with: "
+                "pip install weaviate-client[ASYNC]"
+            )
+        super().__init__(
+            url=url,
+            auth_client_secret=auth_client_secret,
+            timeout_config=timeout_config,
+            proxies=proxies,
+            trust_env=trust_env,
+            additional_headers=additional_headers,
+            connection_config=connection_config,
+        )
+        if startup_period is not None:
+            _check_positive_num(startup_period, "startup_period", int, include_zero=False)
+        self._auth_client_secret = auth_client_secret
+        self._startup_period = startup_period
+        self._connection_config = connection_config
+        self._grpc_port = grpc_port
+        self._client: Optional[httpx.AsyncClient] = None
+        self._grpc_channel: Optional[grpc.aio.Channel] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def connect(self) -> None:
+        """
+        Wait for weaviate to start, authenticate and check the version of weaviate. Does nothing if
+        the connection is already established.
+
+        Raises
+        ------
+        weaviate.WeaviateStartUpError
+            If weaviate does not start within `startup_period`.
+        weaviate.AuthenticationFailedException
+            If weaviate requires authentication and no credentials were provided.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        """
+
+        if self._client is not None:
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._client is not None:
+                return
+
+            if self._startup_period is not None:
+                await self.wait_for_weaviate(self._startup_period)
+
+            client = await self._create_client()
+            if has_grpc and self._grpc_port is not None:
+                await self._create_grpc_stub(self._grpc_port)
+
+            self._client = client
+            self._server_version = (await self.get_meta())["version"]
+            if self._server_version < "1.14":
+                _Warnings.weaviate_server_older_than_1_14(self._server_version)
+            if is_weaviate_too_old(self._server_version):
+                _Warnings.weaviate_too_old_vs_latest(self._server_version)
+
+    @property
+    def server_version(self) -> str:
+        """
+        Version of the weaviate instance, known once the connection is established.
+        """
+        if self._client is None:
+            raise RuntimeError(
+                "The version of weaviate is not known yet, await `connect` on the client first."
+            )
+        return self._server_version
+
+    def _get_client_args(self) -> Dict[str, Any]:
+        limits = httpx.Limits(
+            max_connections=self._connection_config.session_pool_maxsize,
+            max_keepalive_connections=self._connection_config.session_pool_maxsize,
+        )
+        mounts = {
+            f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxy, limits=limits)
+            for scheme, proxy in self._proxies.items()
+        }
+        return {
+            "limits": limits,
+            "mounts": mounts,
+            "timeout": self._get_timeout(),
+            # proxies from the ENV variables are already part of self._proxies
+            "trust_env": False,
+        }
+
+    def _get_timeout(self) -> httpx.Timeout:
+        connect, read = self._timeout_config
+        # requests waiting for a free connection of the pool are not timed out, the connect and
+        # read timeouts apply once they are sent
+        return httpx.Timeout(read, connect=connect, pool=None)
+
+    async def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create the httpx client, through authlib if authentication with OIDC is enabled.
+
+        Raises
+        ------
+        weaviate.AuthenticationFailedException
+            If weaviate requires authentication and no credentials were provided.
+        """
+
+        client_args = self._get_client_args()
+        # API keys are separate from OIDC and do not need any config from weaviate
+        if isinstance(self._auth_client_secret, AuthApiKey) or (
+            "authorization" in self._headers and self._auth_client_secret is None
+        ):
+            return httpx.AsyncClient(**client_args)
+
+        client = httpx.AsyncClient(**client_args)
+        oidc_url = self.url + self._api_version_path + "/.well-known/openid-configuration"
+        try:
+            response = self._to_requests_response(
+                await client.get(oidc_url, headers=self._get_request_header())
+            )
+        except httpx.TransportError as error:
+            await client.aclose()
+            raise RequestsConnectionError(str(error)) from error
+
+        if response.status_code == 200:
+            try:
+                resp = response.json()
+            except JSONDecodeError:
+                _Warnings.auth_cannot_parse_oidc_config(oidc_url)
+                return client
+
+            if self._auth_client_secret is not None:
+                await client.aclose()
+                # fetches the token endpoint from the OIDC provider once
+                loop = asyncio.get_running_loop()
+                _auth = await loop.run_in_executor(
+                    None, _Auth, resp, self._auth_client_secret, self
+                )
+                session: httpx.AsyncClient = await _auth.get_async_auth_session(**client_args)
+                return session
+
+            await client.aclose()
+            msg = f""""No login credentials provided. The weaviate instance at {self.url} requires login credentials.
+
+                Please check our documentation at https://weaviate.io/developers/weaviate/client-libraries/python#authentication
+                for more information about how to use authentication."""
+            if is_weaviate_domain(self.url):
+                msg += """
+
+                You can instantiate the client with login credentials for WCS using
+
+                client = weaviate.AsyncClient(
+                  url=YOUR_WEAVIATE_URL,
+                  auth_client_secret=weaviate.AuthClientPassword(
+                    username = YOUR_WCS_USER,
+                    password = YOUR_WCS_PW,
+                  ))
+                """
+            raise AuthenticationFailedException(msg)
+        if response.status_code == 404 and self._auth_client_secret is not None:
+            _Warnings.auth_with_anon_weaviate()
+        return client
+
+    async def _create_grpc_stub(self, grpc_port: int) -> None:
+        """
+        Create the grpc.aio channel if the gRPC port of weaviate is reachable. Otherwise, queries
+        fall back to GraphQL.
+        """
+
+        hostname = urlparse(self.url).hostname
+        try:
+            # we're only pinging the port, 1s is plenty
+            _, writer = await asyncio.wait_for(asyncio.open_connection(hostname, grpc_port), 1.0)
+        except (OSError, asyncio.TimeoutError):
+            return
+        writer.close()
+        self._grpc_channel = grpc.aio.insecure_channel(f"{hostname}:{grpc_port}")
+        self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel)
+
+    async def close(self) -> None:
+        """Close the connection and the gRPC channel gracefully."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._grpc_channel is not None:
+            await self._grpc_channel.close()
+            self._grpc_channel = None
+            self._grpc_stub = None
+
+    def get_current_bearer_token(self) -> str:
+        if "authorization" in self._headers:
+            return self._headers["authorization"]
+        if self._client is not None and hasattr(self._client, "token"):
+            return f"Bearer {self._client.token['access_token']}"
+        return ""
+
+    def _to_requests_response(self, response: httpx.Response) -> requests.Response:
+        """
+        Convert a httpx response to a requests response.
+        """
+
+        resp = _to_requests_response(response)
+        self._set_json_decoder(resp)
+        return resp
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Make a request to the Weaviate server instance. Connection errors are raised as the
+        exceptions of `requests`, just like the ones of the synchronous `Connection`.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the request could not be made.
+        requests.ReadTimeout
+            If weaviate did not answer in time.
+        """
+
+        await self.connect()
+        assert self._client is not None
+        body, headers = self._prepare_body(weaviate_object)
+        if params is not None:
+            # requests and httpx encode booleans differently, stick to the requests format
+            params = {
+                key: str(value) if isinstance(value, bool) else value
+                for key, value in params.items()
+            }
+        try:
+            response = await self._client.request(
+                method,
+                self.url + self._api_version_path + path,
+                content=body,
+                headers=headers,
+                params=params,
+                timeout=self._get_timeout(),
+            )
+        except httpx.ConnectTimeout as error:
+            raise ConnectTimeout(str(error)) from error
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise RequestsConnectionError(str(error)) from error
+        return self._to_requests_response(response)
+
+    async def delete(
+        self,
+        path: str,
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Make a DELETE request to the Weaviate server instance, see `Connection.delete`.
+        """
+        return await self._request("DELETE", path, weaviate_object, params)
+
+    async def patch(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Make a PATCH request to the Weaviate server instance, see `Connection.patch`.
+        """
+        return await self._request("PATCH", path, weaviate_object, params)
+
+    async def post(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Make a POST request to the Weaviate server instance, see `Connection.post`.
+        """
+        return await self._request("POST", path, weaviate_object, params)
+
+    async def put(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Make a PUT request to the Weaviate server instance, see `Connection.put`.
+        """
+        return await self._request("PUT", path, weaviate_object, params)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Make a GET request to the Weaviate server instance, see `Connection.get`.
+        """
+        return await self._request("GET", path, params=params)
+
+    async def head(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Make a HEAD request to the Weaviate server instance, see `Connection.head`.
+        """
+        return await self._request("HEAD", path, params=params)
+
+    async def wait_for_weaviate(self, startup_period: int) -> None:
+        """
+        Waits until weaviate is ready or the timelimit given in 'startup_period' has passed.
+
+        Parameters
+        ----------
+        startup_period : int
+            Describes how long the client will wait for weaviate to start in seconds.
+
+        Raises
+        ------
+        WeaviateStartUpError
+            If weaviate takes longer than the timelimit to respond.
+        """
+
+        ready_url = self.url + self._api_version_path + "/.well-known/ready"
+        async with httpx.AsyncClient(**self._get_client_args()) as client:
+            for _i in range(startup_period + 1):
+                try:
+                    response = await client.get(ready_url, headers=self._get_request_header())
+                    response.raise_for_status()
+                    return
+                except (httpx.HTTPStatusError, httpx.TransportError) as error:
+                    if _i == startup_period:
+                        raise WeaviateStartUpError(
+                            f"Weaviate did not start up in {startup_period} seconds. Either the Weaviate URL {self.url} is wrong or Weaviate did not start up in the interval given in 'startup_period'."
+                        ) from error
+                    await asyncio.sleep(1)
+
+    async def get_meta(self) -> Dict[str, str]:
+        """
+        Returns the meta endpoint.
+        """
+        response = await self.get(path="/meta")
+        res = _decode_json_response_dict(response, "Meta endpoint")
+        assert res is not None
+        return res
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 from typing import TYPE_CHECKING
 
 import requests
@@ -17,6 +17,8 @@ from ..util import _decode_json_response_dict
 from ..warnings import _Warnings
 
 if TYPE_CHECKING:
+    from authlib.integrations.httpx_client import AsyncOAuth2Client  # type: ignore
+    from .async_connection import AsyncConnection
     from .connection import Connection
 
 AUTH_DEFAULT_TIMEOUT = 5
@@ -28,10 +30,10 @@ class _Auth:
         self,
         oidc_config: OIDC_CONFIG,
         credentials: AuthCredentials,
-        connection: Connection,
+        connection: Union[Connection, AsyncConnection],
     ) -> None:
         self._credentials: AuthCredentials = credentials
-        self._connection: Connection = connection
+        self._connection: Union[Connection, AsyncConnection] = connection
         config_url = oidc_config["href"]
         client_id = oidc_config["clientId"]
         assert isinstance(config_url, str) and isinstance(client_id, str)
@@ -74,16 +76,64 @@ class _Auth:
 
     def get_auth_session(self) -> OAuth2Session:
         if isinstance(self._credentials, AuthBearerToken):
-            sessions = self._get_session_auth_bearer_token(self._credentials)
+            sessions = OAuth2Session(**self._get_session_args_bearer_token(self._credentials))
         elif isinstance(self._credentials, AuthClientCredentials):
-            sessions = self._get_session_client_credential(self._credentials)
+            sessions = OAuth2Session(**self._get_session_args_client_credential(self._credentials))
+            # explicitly fetch tokens. Otherwise, authlib will do it in the background and we might have
+            # race-conditions
+            sessions.fetch_token()
         else:
             assert isinstance(self._credentials, AuthClientPassword)
-            sessions = self._get_session_user_pw(self._credentials)
+            sessions = OAuth2Session(**self._get_session_args_user_pw(self._credentials))
+            token = sessions.fetch_token(
+                username=self._credentials.username, password=self._credentials.password
+            )
+            if "refresh_token" not in token:
+                _Warnings.auth_no_refresh_token(token["expires_in"])
 
         return sessions
 
-    def _get_session_auth_bearer_token(self, config: AuthBearerToken) -> OAuth2Session:
+    async def get_async_auth_session(self, **client_args: Any) -> AsyncOAuth2Client:
+        """
+        Create an authenticated asynchronous httpx client. It refreshes the tokens on its own when
+        they are about to expire.
+
+        Parameters
+        ----------
+        client_args : Any
+            Additional arguments for the httpx client, e.g. timeouts and limits.
+
+        Returns
+        -------
+        authlib.integrations.httpx_client.AsyncOAuth2Client
+            The authenticated client.
+        """
+        # only imported with the async client, it needs httpx
+        from authlib.integrations.httpx_client import AsyncOAuth2Client
+
+        if isinstance(self._credentials, AuthBearerToken):
+            session = AsyncOAuth2Client(
+                **self._get_session_args_bearer_token(self._credentials), **client_args
+            )
+        elif isinstance(self._credentials, AuthClientCredentials):
+            session = AsyncOAuth2Client(
+                **self._get_session_args_client_credential(self._credentials), **client_args
+            )
+            await session.fetch_token()
+        else:
+            assert isinstance(self._credentials, AuthClientPassword)
+            session = AsyncOAuth2Client(
+                **self._get_session_args_user_pw(self._credentials), **client_args
+            )
+            token = await session.fetch_token(
+                username=self._credentials.username, password=self._credentials.password
+            )
+            if "refresh_token" not in token:
+                _Warnings.auth_no_refresh_token(token["expires_in"])
+
+        return session
+
+    def _get_session_args_bearer_token(self, config: AuthBearerToken) -> Dict[str, Any]:
         token: Dict[str, Union[str, int]] = {"access_token": config.access_token}
         if config.expires_in is not None:
             token["expires_in"] = config.expires_in
@@ -94,30 +144,25 @@ class _Auth:
             _Warnings.auth_no_refresh_token(config.expires_in)
 
         # token endpoint and clientId are needed for token refresh
-        return OAuth2Session(
-            token=token,
-            token_endpoint=self._token_endpoint,
-            client_id=self._client_id,
-            default_timeout=AUTH_DEFAULT_TIMEOUT,
-        )
-
-    def _get_session_user_pw(self, config: AuthClientPassword) -> OAuth2Session:
+        return {
+            "token": token,
+            "token_endpoint": self._token_endpoint,
+            "client_id": self._client_id,
+            "default_timeout": AUTH_DEFAULT_TIMEOUT,
+        }
+
+    def _get_session_args_user_pw(self, config: AuthClientPassword) -> Dict[str, Any]:
         scope: List[str] = self._default_scopes.copy()
         scope.extend(config.scope_list)
-        session = OAuth2Session(
-            client_id=self._client_id,
-            token_endpoint=self._token_endpoint,
-            grant_type="password",
-            scope=scope,
-            default_timeout=AUTH_DEFAULT_TIMEOUT,
-        )
-        token = session.fetch_token(username=config.username, password=config.password)
-        if "refresh_token" not in token:
-            _Warnings.auth_no_refresh_token(token["expires_in"])
-
-        return session
-
-    def _get_session_client_credential(self, config: AuthClientCredentials) -> OAuth2Session:
+        return {
+            "client_id": self._client_id,
+            "token_endpoint": self._token_endpoint,
+            "grant_type": "password",
+            "scope": scope,
+            "default_timeout": AUTH_DEFAULT_TIMEOUT,
+        }
+
+    def _get_session_args_client_credential(self, config: AuthClientCredentials) -> Dict[str, Any]:
         scope: List[str] = self._default_scopes.copy()
 
         if config.scope_list is not None:
@@ -129,16 +174,13 @@ class _Auth:
             else:
                 raise MissingScopeException
 
-        session = OAuth2Session(
-            client_id=self._client_id,
-            client_secret=config.client_secret,
-            token_endpoint_auth_method="client_secret_post",
-            scope=scope,
-            token_endpoint=self._token_endpoint,
-            grant_type="client_credentials",
-            token={"access_token": None, "expires_in": -100},
-            default_timeout=AUTH_DEFAULT_TIMEOUT,
-        )
-        # explicitly fetch tokens. Otherwise, authlib will do it in the background and we might have race-conditions
-        session.fetch_token()
-        return session
+        return {
+            "client_id": self._client_id,
+            "client_secret": config.client_secret,
+            "token_endpoint_auth_method": "client_secret_post",
+            "scope": scope,
+            "token_endpoint": self._token_endpoint,
+            "grant_type": "client_credentials",
+            "token": {"access_token": None, "expires_in": -100},
+            "default_timeout": AUTH_DEFAULT_TIMEOUT,
+        }
@@ -4,24 +4,34 @@ Connection class definition.
 from __future__ import annotations
 
 import datetime
+import importlib.util
 import os
 import socket
+import sys
 import time
-from threading import Thread, Event
-from typing import Any, Dict, Optional, Tuple, Union, cast
+from threading import Thread, Event, Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast, TYPE_CHECKING
 from urllib.parse import urlparse
 
 import requests
-from authlib.integrations.requests_client import OAuth2Session  # type: ignore
 from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout
 from requests.exceptions import HTTPError as RequestsHTTPError
-from requests.exceptions import JSONDecodeError
+from requests.exceptions import JSONDecodeError, RequestException, Timeout
+from urllib3.util.request import ACCEPT_ENCODING
 
 from weaviate import __version__ as client_version
 from weaviate.auth import AuthCredentials, AuthClientCredentials, AuthApiKey
-from weaviate.config import ConnectionConfig
-from weaviate.connect.authentication import _Auth
+from weaviate.codec import JsonCodec
+from weaviate.config import ConnectionConfig, RetryPolicy
+from weaviate.connect.compression import Compressor, get_compressor
+from weaviate.connect.endpoints import _Endpoint, _EndpointPool, _is_connect_error
+from weaviate.connect.retry import (
+    UNAVAILABLE_STATUS_CODES,
+    _backoff_delay,
+    _CircuitBreaker,
+    _is_idempotent,
+)
 from weaviate.embedded import EmbeddedDB
 from weaviate.exceptions import (
     AuthenticationFailedException,
@@ -39,25 +49,27 @@ from weaviate.util import (
 from weaviate.warnings import _Warnings
 
 
-try:
-    import grpc  # type: ignore
-    from weaviate.proto.v1 import weaviate_pb2_grpc
-
-    has_grpc = True
+# grpc and the generated modules are slow to import, they are imported when the port is probed
+has_grpc = importlib.util.find_spec("grpc") is not None
 
-except ImportError:
-    has_grpc = False
+if TYPE_CHECKING:
+    from authlib.integrations.requests_client import OAuth2Session  # type: ignore
+    from weaviate.connect.authentication import _Auth
+    from weaviate.connect.transport import _HttpxSession
+    from weaviate.proto.v1 import weaviate_pb2_grpc
 
 
-JSONPayload = Union[dict, list]
-Session = Union[requests.sessions.Session, OAuth2Session]
+JSONPayload = Union[dict, list, bytes]
+Session = Union[requests.sessions.Session, "OAuth2Session", "_HttpxSession"]
 TIMEOUT_TYPE_RETURN = Tuple[NUMBERS, NUMBERS]
 PYPI_TIMEOUT = 0.1
+TOKEN_REFRESH_BACKOFF_BASE = 2
+TOKEN_REFRESH_BACKOFF_MAX = 30
 
 
-class Connection:
+class _ConnectionBase:
     """
-    Connection class used to communicate to a weaviate instance.
+    Configuration and request encoding shared by the synchronous and the asynchronous connection.
     """
 
     def __init__(
@@ -68,6 +80,167 @@ class Connection:
         proxies: Union[dict, str, None],
         trust_env: bool,
         additional_headers: Optional[Dict[str, Any]],
+        connection_config: ConnectionConfig,
+        embedded_db: Optional[EmbeddedDB] = None,
+    ):
+        self._api_version_path = "/v1"
+        self.url = url  # e.g. http://localhost:80
+        self.timeout_config: TIMEOUT_TYPE_RETURN = timeout_config
+        self.embedded_db = embedded_db
+        self._json_codec: JsonCodec = connection_config.json_codec or JsonCodec()
+        self._session_pool_maxsize = connection_config.session_pool_maxsize
+        self._grpc_stub: Optional["weaviate_pb2_grpc.WeaviateStub"] = None
+        self._server_version: str
+
+        self._headers = {"content-type": "application/json"}
+        if additional_headers is not None:
+            if not isinstance(additional_headers, dict):
+                raise TypeError(
+                    f"'additional_headers' must be of type dict or None. Given type: {type(additional_headers)}."
+                )
+            for key, value in additional_headers.items():
+                self._headers[key.lower()] = value
+
+        self._compressor: Optional[Compressor] = None
+        self._compression = connection_config.compression
+        self._compression_threshold = connection_config.compression_threshold
+        if self._compression is not None:
+            self._compressor = get_compressor(self._compression)
+            # advertise every response encoding urllib3 can decode, e.g. zstd if it is installed
+            self._headers.setdefault("accept-encoding", ACCEPT_ENCODING)
+
+        self._proxies = _get_proxies(proxies, trust_env)
+
+        # auth secrets can contain more information than a header (refresh tokens and lifetime) and therefore take
+        # precedent over headers
+        if "authorization" in self._headers and auth_client_secret is not None:
+            _Warnings.auth_header_and_auth_secret()
+            self._headers.pop("authorization")
+
+        # if there are API keys included add them right away to headers
+        if auth_client_secret is not None and isinstance(auth_client_secret, AuthApiKey):
+            self._headers["authorization"] = "Bearer " + auth_client_secret.api_key
+
+    def _set_json_decoder(self, response: requests.Response, *args: Any, **kwargs: Any) -> None:
+        """Response hook that decodes the JSON bodies of all responses with the configured codec."""
+        codec = self._json_codec
+
+        def decode(**_: Any) -> Any:
+            try:
+                return codec.decode(response.content)
+            except ValueError as error:
+                raise JSONDecodeError(str(error), response.text, 0) from error
+
+        response.json = decode  # type: ignore
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """
+        The JSON codec used to encode request bodies and decode response bodies.
+        """
+        return self._json_codec
+
+    @property
+    def session_pool_maxsize(self) -> int:
+        """
+        The maximal number of connections kept open per host.
+        """
+        return self._session_pool_maxsize
+
+    def _prepare_body(
+        self, weaviate_object: Optional[JSONPayload]
+    ) -> Tuple[Optional[bytes], Dict[str, Any]]:
+        """
+        Encode a request payload with the configured JSON codec and compress it if it is larger than
+        the compression threshold. Pre-encoded payloads are not encoded again.
+
+        Returns
+        -------
+        Tuple[Optional[bytes], Dict[str, Any]]
+            The request body and the headers to send it with.
+        """
+        headers = self._get_request_header()
+        if weaviate_object is None:
+            return None, headers
+        if isinstance(weaviate_object, bytes):
+            body = weaviate_object
+        else:
+            body = self._json_codec.encode(weaviate_object)
+        if self._compressor is not None and len(body) >= self._compression_threshold:
+            body = self._compressor(body)
+            headers = {**headers, "content-encoding": self._compression}
+        return body, headers
+
+    def _get_request_header(self) -> dict:
+        """
+        Returns the correct headers for a request.
+
+        Returns
+        -------
+        dict
+            Request header as a dict.
+        """
+        return self._headers
+
+    @property
+    def timeout_config(self) -> TIMEOUT_TYPE_RETURN:
+        """
+        Getter/setter for `timeout_config`.
+
+        Parameters
+        ----------
+        timeout_config : tuple(float, float), optional
+            For Setter only: Set the timeout configuration for all requests to the Weaviate server.
+            It can be a float or, a tuple of two floats:
+                    (connect timeout, read timeout).
+            If only one float is passed then both connect and read timeout will be set to
+            that value.
+
+        Returns
+        -------
+        Tuple[float, float]
+            For Getter only: Requests Timeout configuration.
+        """
+
+        return self._timeout_config
+
+    @timeout_config.setter
+    def timeout_config(self, timeout_config: TIMEOUT_TYPE_RETURN) -> None:
+        """
+        Setter for `timeout_config`. (docstring should be only in the Getter)
+        """
+
+        self._timeout_config = timeout_config
+
+    @property
+    def proxies(self) -> dict:
+        return self._proxies
+
+    @property
+    def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
+        return self._grpc_stub
+
+    @property
+    def server_version(self) -> str:
+        """
+        Version of the weaviate instance.
+        """
+        return self._server_version
+
+
+class Connection(_ConnectionBase):
+    """
+    Connection class used to communicate to a weaviate instance.
+    """
+
+    def __init__(
+        self,
+        url: Union[str, Sequence[str]],
+        auth_client_secret: Optional[AuthCredentials],
+        timeout_config: TIMEOUT_TYPE_RETURN,
+        proxies: Union[dict, str, None],
+        trust_env: bool,
+        additional_headers: Optional[Dict[str, Any]],
         startup_period: Optional[int],
         connection_config: ConnectionConfig,
         embedded_db: Optional[EmbeddedDB] = None,
@@ -78,8 +251,9 @@ class Connection:
 
         Parameters
         ----------
-        url : str
-            URL to a running weaviate instance.
+        url : str or Sequence[str]
+            URL to a running weaviate instance, or the URLs of several nodes of a weaviate cluster
+            to balance the requests over, see `ConnectionConfig.load_balancing`.
         auth_client_secret : weaviate.auth.AuthCredentials, optional
             Credentials to authenticate with a weaviate instance. The credentials are not saved within the client and
             authentication is done via authentication tokens.
@@ -112,68 +286,143 @@ class Connection:
             configured.
         """
 
-        self._api_version_path = "/v1"
-        self.url = url  # e.g. http://localhost:80
-        self.timeout_config: TIMEOUT_TYPE_RETURN = timeout_config
-        self.embedded_db = embedded_db
-
-        self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
-
-        # create GRPC channel. If weaviate does not support GRPC, fallback to GraphQL is used.
-        if has_grpc and grcp_port is not None:
-            parsed_url = urlparse(self.url)
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            try:
-                s.settimeout(1.0)  # we're only pinging the port, 1s is plenty
-                s.connect((parsed_url.hostname, grcp_port))
-                s.shutdown(2)
-                s.close()
-                channel = grpc.insecure_channel(f"{parsed_url.hostname}:{grcp_port}")
-                self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(channel)
-            except (
-                ConnectionRefusedError,
-                TimeoutError,
-                socket.timeout,
-            ):  # self._grpc_stub stays None
-                s.close()
-
-        self._headers = {"content-type": "application/json"}
-        if additional_headers is not None:
-            if not isinstance(additional_headers, dict):
-                raise TypeError(
-                    f"'additional_headers' must be of type dict or None. Given type: {type(additional_headers)}."
-                )
-            for key, value in additional_headers.items():
-                self._headers[key.lower()] = value
-
-        self._proxies = _get_proxies(proxies, trust_env)
-
-        # auth secrets can contain more information than a header (refresh tokens and lifetime) and therefore take
-        # precedent over headers
-        if "authorization" in self._headers and auth_client_secret is not None:
-            _Warnings.auth_header_and_auth_secret()
-            self._headers.pop("authorization")
+        urls = [url] if isinstance(url, str) else list(url)
+        super().__init__(
+            url=urls[0],
+            auth_client_secret=auth_client_secret,
+            timeout_config=timeout_config,
+            proxies=proxies,
+            trust_env=trust_env,
+            additional_headers=additional_headers,
+            connection_config=connection_config,
+            embedded_db=embedded_db,
+        )
 
-        # if there are API keys included add them right away to headers
-        if auth_client_secret is not None and isinstance(auth_client_secret, AuthApiKey):
-            self._headers["authorization"] = "Bearer " + auth_client_secret.api_key
+        if startup_period is not None:
+            _check_positive_num(startup_period, "startup_period", int, include_zero=False)
 
         self._session: Session
         self._shutdown_background_event: Optional[Event] = None
+        # with a lazy connection these steps run on first use, see `ConnectionConfig.lazy`
+        self._connect_lock = Lock()
+        self._connected = False
+        self._auth_client_secret = auth_client_secret
+        self._startup_period = startup_period
+        self._connection_config = connection_config
+        self._grpc_port = grcp_port if has_grpc else None
+        self._grpc_probed = False
+        self._server_version_known = False
+        self._circuit_breakers: Dict[str, _CircuitBreaker] = {}
+        self._endpoints: Optional[_EndpointPool] = None
+        if len(urls) > 1:
+            self._endpoints = _EndpointPool(
+                urls,
+                strategy=connection_config.load_balancing,
+                health_check_interval=connection_config.health_check_interval,
+                is_ready=self._is_node_ready,
+            )
+
+        if connection_config.lazy:
+            if connection_config.check_client_version:
+                Thread(
+                    target=self._check_client_version, daemon=True, name="ClientVersionCheck"
+                ).start()
+            return
 
-        if startup_period is not None:
-            _check_positive_num(startup_period, "startup_period", int, include_zero=False)
-            self.wait_for_weaviate(startup_period)
+        self._probe_grpc()
+        self._connect()
+        self._get_server_version()
+        if connection_config.check_client_version:
+            self._check_client_version()
 
-        self._create_sessions(auth_client_secret)
-        self._add_adapter_to_session(connection_config)
+    @property
+    def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
+        self._probe_grpc()
+        return self._grpc_stub
 
-        self._server_version = self.get_meta()["version"]
-        if self._server_version < "1.14":
-            _Warnings.weaviate_server_older_than_1_14(self._server_version)
-        if is_weaviate_too_old(self._server_version):
-            _Warnings.weaviate_too_old_vs_latest(self._server_version)
+    @property
+    def server_version(self) -> str:
+        """
+        Version of the weaviate instance.
+        """
+        return self._get_server_version()
 
+    def _probe_grpc(self) -> None:
+        """Create the gRPC channel if the gRPC port of weaviate is open, only once."""
+        if self._grpc_probed:
+            return
+        with self._connect_lock:
+            if self._grpc_probed:
+                return
+            # create GRPC channel. If weaviate does not support GRPC, fallback to GraphQL is used.
+            if self._grpc_port is not None:
+                parsed_url = urlparse(self.url)
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    import grpc  # type: ignore
+                    from weaviate.proto.v1 import weaviate_pb2_grpc
+
+                    s.settimeout(1.0)  # we're only pinging the port, 1s is plenty
+                    s.connect((parsed_url.hostname, self._grpc_port))
+                    s.shutdown(2)
+                    s.close()
+                    channel = grpc.insecure_channel(f"{parsed_url.hostname}:{self._grpc_port}")
+                    self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(channel)
+                except (
+                    ImportError,
+                    ConnectionRefusedError,
+                    TimeoutError,
+                    socket.timeout,
+                ):  # self._grpc_stub stays None
+                    s.close()
+            self._grpc_probed = True
+
+    def _connect(self) -> None:
+        """
+        Wait for weaviate to start and create the HTTP session, only once.
+
+        Raises
+        ------
+        weaviate.WeaviateStartUpError
+            If weaviate does not start up within the startup period.
+        weaviate.AuthenticationFailedException
+            If weaviate requires authentication and no credentials were provided.
+        """
+        if self._connected:
+            return
+        with self._connect_lock:
+            if self._connected:
+                return
+            # a lazy connection does not wait, the first request fails if weaviate is not ready
+            if self._startup_period is not None and not self._connection_config.lazy:
+                self.wait_for_weaviate(self._startup_period)
+
+            self._create_sessions(self._auth_client_secret)
+            self._add_adapter_to_session(self._connection_config)
+            self._session.hooks["response"].append(self._set_json_decoder)
+            if self._endpoints is not None:
+                self._endpoints.start_health_checks()
+            # the credentials are only needed to create the session
+            self._auth_client_secret = None
+            self._connected = True
+
+    def _get_server_version(self) -> str:
+        """Read the version of weaviate on first use and warn if it is too old."""
+        if self._server_version_known:
+            return self._server_version
+        server_version = self.get_meta()["version"]
+        with self._connect_lock:
+            if not self._server_version_known:
+                self._server_version = server_version
+                self._server_version_known = True
+                if server_version < "1.14":
+                    _Warnings.weaviate_server_older_than_1_14(server_version)
+                if is_weaviate_too_old(server_version):
+                    _Warnings.weaviate_too_old_vs_latest(server_version)
+        return self._server_version
+
+    def _check_client_version(self) -> None:
+        """Warn if a newer version of the client was released."""
         try:
             pkg_info = requests.get(PYPI_PACKAGE_URL, timeout=PYPI_TIMEOUT).json()
             pkg_info = pkg_info.get("info", {})
@@ -195,16 +444,17 @@ class Connection:
         """
         # API keys are separate from OIDC and do not need any config from weaviate
         if auth_client_secret is not None and isinstance(auth_client_secret, AuthApiKey):
-            self._session = requests.Session()
+            self._session = self._new_session()
             return
 
         if "authorization" in self._headers and auth_client_secret is None:
-            self._session = requests.Session()
+            self._session = self._new_session()
             return
 
-        oidc_url = self.url + self._api_version_path + "/.well-known/openid-configuration"
-        response = requests.get(
-            oidc_url,
+        response = self._send(
+            "get",
+            "/.well-known/openid-configuration",
+            send=requests.get,
             headers=self._get_request_header(),
             timeout=self._timeout_config,
             proxies=self._proxies,
@@ -216,11 +466,14 @@ class Connection:
             try:
                 resp = response.json()
             except JSONDecodeError:
-                _Warnings.auth_cannot_parse_oidc_config(oidc_url)
-                self._session = requests.Session()
+                _Warnings.auth_cannot_parse_oidc_config(response.url)
+                self._session = self._new_session()
                 return
 
             if auth_client_secret is not None and not isinstance(auth_client_secret, AuthApiKey):
+                # authlib is slow to import, it is only needed for OIDC
+                from weaviate.connect.authentication import _Auth
+
                 _auth = _Auth(resp, auth_client_secret, self)
                 self._session = _auth.get_auth_session()
 
@@ -250,15 +503,26 @@ class Connection:
                 raise AuthenticationFailedException(msg)
         elif response.status_code == 404 and auth_client_secret is not None:
             _Warnings.auth_with_anon_weaviate()
-            self._session = requests.Session()
+            self._session = self._new_session()
         else:
-            self._session = requests.Session()
+            self._session = self._new_session()
+
+    def _new_session(self) -> Session:
+        """Create a session without OIDC authentication for the configured transport."""
+        if self._connection_config.transport == "http2":
+            # httpx is only imported if the HTTP/2 transport is used
+            from weaviate.connect.transport import _HttpxSession
+
+            return _HttpxSession(self._connection_config.session_pool_maxsize, self._proxies)
+        return requests.Session()
 
     def get_current_bearer_token(self) -> str:
+        self._connect()
         if "authorization" in self._headers:
             return self._headers["authorization"]
-        elif isinstance(self._session, OAuth2Session):
-            return f"Bearer {self._session.token['access_token']}"
+        elif _is_oauth2_session(self._session):
+            token = cast("OAuth2Session", self._session).token
+            return f"Bearer {token['access_token']}"
 
         return ""
 
@@ -276,6 +540,8 @@ class Connection:
         While the underlying library refreshes tokens, it does not have an internal cronjob that checks every
         X-seconds if a token has expired. If there is no activity for longer than the refresh tokens lifetime, it will
         expire. Therefore, refresh manually shortly before expiration time is up."""
+        from authlib.integrations.requests_client import OAuth2Session
+
         assert isinstance(self._session, OAuth2Session)
         if "refresh_token" not in self._session.token and _auth is None:
             return
@@ -285,8 +551,9 @@ class Connection:
         )  # use 1minute as token lifetime if not supplied
         self._shutdown_background_event = Event()
 
-        def periodic_refresh_token(refresh_time: int, _auth: Optional[_Auth]) -> None:
+        def periodic_refresh_token(refresh_time: float, _auth: Optional[_Auth]) -> None:
             time.sleep(max(refresh_time - 30, 1))
+            failures = 0
             while (
                 self._shutdown_background_event is not None
                 and not self._shutdown_background_event.is_set()
@@ -305,9 +572,16 @@ class Connection:
                         assert _auth is not None
                         new_session = _auth.get_auth_session()
                         self._session.token = new_session.fetch_token()  # type: ignore
+                        refresh_time = (
+                            cast(OAuth2Session, self._session).token.get("expires_in", 60) - 30
+                        )
+                    failures = 0
                 except (RequestsHTTPError, ReadTimeout) as exc:
-                    # retry again after one second, might be an unstable connection
-                    refresh_time = 1
+                    # retry with backoff, might be an unstable connection
+                    refresh_time = _backoff_delay(
+                        failures, TOKEN_REFRESH_BACKOFF_BASE, TOKEN_REFRESH_BACKOFF_MAX
+                    )
+                    failures += 1
                     _Warnings.token_refresh_failed(exc)
 
                 time.sleep(max(refresh_time, 1))
@@ -328,20 +602,11 @@ class Connection:
             and self._shutdown_background_event is not None
         ):
             self._shutdown_background_event.set()
+        if hasattr(self, "_endpoints") and self._endpoints is not None:
+            self._endpoints.shutdown()
         if hasattr(self, "_session"):
             self._session.close()
 
-    def _get_request_header(self) -> dict:
-        """
-        Returns the correct headers for a request.
-
-        Returns
-        -------
-        dict
-            Request header as a dict.
-        """
-        return self._headers
-
     def delete(
         self,
         path: str,
@@ -356,8 +621,9 @@ class Connection:
         path : str
             Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
             e.g. '/meta' or '/objects', without version.
-        weaviate_object : dict, optional
-            Object is used as payload for DELETE request. By default None.
+        weaviate_object : dict, list or bytes, optional
+            Object is used as payload for DELETE request. By default None. Bytes are sent as
+            already encoded JSON.
         params : dict, optional
             Additional request parameters, by default None
 
@@ -373,12 +639,13 @@ class Connection:
         """
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.delete(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
+        self._connect()
+        body, headers = self._prepare_body(weaviate_object)
+        return self._send(
+            "delete",
+            path,
+            data=body,
+            headers=headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
             params=params,
@@ -398,8 +665,8 @@ class Connection:
         path : str
             Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
             e.g. '/meta' or '/objects', without version.
-        weaviate_object : dict
-            Object is used as payload for PATCH request.
+        weaviate_object : dict, list or bytes
+            Object is used as payload for PATCH request. Bytes are sent as already encoded JSON.
         params : dict, optional
             Additional request parameters, by default None
         Returns
@@ -414,12 +681,13 @@ class Connection:
         """
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.patch(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
+        self._connect()
+        body, headers = self._prepare_body(weaviate_object)
+        return self._send(
+            "patch",
+            path,
+            data=body,
+            headers=headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
             params=params,
@@ -430,6 +698,7 @@ class Connection:
         path: str,
         weaviate_object: JSONPayload,
         params: Optional[Dict[str, Any]] = None,
+        base_url: Optional[str] = None,
     ) -> requests.Response:
         """
         Make a POST request to the Weaviate server instance.
@@ -439,10 +708,13 @@ class Connection:
         path : str
             Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
             e.g. '/meta' or '/objects', without version.
-        weaviate_object : dict
-            Object is used as payload for POST request.
+        weaviate_object : dict, list or bytes
+            Object is used as payload for POST request. Bytes are sent as already encoded JSON.
         params : dict, optional
             Additional request parameters, by default None
+        base_url : str, optional
+            The URL of the Weaviate node to send the request to, e.g. another node of the same
+            cluster, by default the URL of the connection.
         external_url: Is an external (non-weaviate) url called
 
         Returns
@@ -457,12 +729,14 @@ class Connection:
         """
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.post(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
+        self._connect()
+        body, headers = self._prepare_body(weaviate_object)
+        return self._send(
+            "post",
+            path,
+            base_url=base_url,
+            data=body,
+            headers=headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
             params=params,
@@ -482,8 +756,8 @@ class Connection:
         path : str
             Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
             e.g. '/meta' or '/objects', without version.
-        weaviate_object : dict
-            Object is used as payload for PUT request.
+        weaviate_object : dict, list or bytes
+            Object is used as payload for PUT request. Bytes are sent as already encoded JSON.
         params : dict, optional
             Additional request parameters, by default None
         Returns
@@ -498,12 +772,13 @@ class Connection:
         """
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.put(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
+        self._connect()
+        body, headers = self._prepare_body(weaviate_object)
+        return self._send(
+            "put",
+            path,
+            data=body,
+            headers=headers,
             timeout=self._timeout_config,
             proxies=self._proxies,
             params=params,
@@ -535,16 +810,22 @@ class Connection:
         """
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
+        self._connect()
         if params is None:
             params = {}
 
         if external_url:
-            request_url = path
-        else:
-            request_url = self.url + self._api_version_path + path
-
-        return self._session.get(
-            url=request_url,
+            return self._session.get(
+                url=path,
+                headers=self._get_request_header(),
+                timeout=self._timeout_config,
+                params=params,
+                proxies=self._proxies,
+            )
+
+        return self._send(
+            "get",
+            path,
             headers=self._get_request_header(),
             timeout=self._timeout_config,
             params=params,
@@ -579,50 +860,16 @@ class Connection:
         """
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.head(
-            url=request_url,
+        self._connect()
+        return self._send(
+            "head",
+            path,
             headers=self._get_request_header(),
             timeout=self._timeout_config,
             proxies=self._proxies,
             params=params,
         )
 
-    @property
-    def timeout_config(self) -> TIMEOUT_TYPE_RETURN:
-        """
-        Getter/setter for `timeout_config`.
-
-        Parameters
-        ----------
-        timeout_config : tuple(float, float), optional
-            For Setter only: Set the timeout configuration for all requests to the Weaviate server.
-            It can be a float or, a tuple of two floats:
-                    (connect timeout, read timeout).
-            If only one float is passed then both connect and read timeout will be set to
-            that value.
-
-        Returns
-        -------
-        Tuple[float, float]
-            For Getter only: Requests Timeout configuration.
-        """
-
-        return self._timeout_config
-
-    @timeout_config.setter
-    def timeout_config(self, timeout_config: TIMEOUT_TYPE_RETURN) -> None:
-        """
-        Setter for `timeout_config`. (docstring should be only in the Getter)
-        """
-
-        self._timeout_config = timeout_config
-
-    @property
-    def proxies(self) -> dict:
-        return self._proxies
-
     def wait_for_weaviate(self, startup_period: int) -> None:
         """
         Waits until weaviate is ready or the timelimit given in 'startup_period' has passed.
@@ -638,32 +885,177 @@ class Connection:
             If weaviate takes longer than the timelimit to respond.
         """
 
-        ready_url = self.url + self._api_version_path + "/.well-known/ready"
         for _i in range(startup_period):
-            try:
-                requests.get(ready_url, headers=self._get_request_header()).raise_for_status()
+            if self._get_startup_error() is None:
                 return
-            except (RequestsHTTPError, RequestsConnectionError):
-                time.sleep(1)
+            time.sleep(1)
 
-        try:
-            requests.get(ready_url, headers=self._get_request_header()).raise_for_status()
-            return
-        except (RequestsHTTPError, RequestsConnectionError) as error:
+        error = self._get_startup_error()
+        if error is not None:
+            urls = self.url if self._endpoints is None else ", ".join(self._endpoints.urls)
             raise WeaviateStartUpError(
-                f"Weaviate did not start up in {startup_period} seconds. Either the Weaviate URL {self.url} is wrong or Weaviate did not start up in the interval given in 'startup_period'."
+                f"Weaviate did not start up in {startup_period} seconds. Either the Weaviate URL {urls} is wrong or Weaviate did not start up in the interval given in 'startup_period'."
             ) from error
 
-    @property
-    def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
-        return self._grpc_stub
+    def _get_startup_error(self) -> Optional[Exception]:
+        """Return None if weaviate is ready, with several nodes if any node is ready, or the error."""
+        urls = [self.url] if self._endpoints is None else self._endpoints.urls
+        startup_error: Optional[Exception] = None
+        for url in urls:
+            ready_url = url + self._api_version_path + "/.well-known/ready"
+            try:
+                requests.get(ready_url, headers=self._get_request_header()).raise_for_status()
+                return None
+            except (RequestsHTTPError, RequestsConnectionError) as error:
+                startup_error = error
+        return startup_error
 
-    @property
-    def server_version(self) -> str:
+    def _is_node_ready(self, url: str) -> bool:
+        """Probe the ready endpoint of one node of the cluster."""
+        try:
+            response = requests.get(
+                url + self._api_version_path + "/.well-known/ready",
+                headers=self._get_request_header(),
+                timeout=self._timeout_config,
+                proxies=self._proxies,
+            )
+        except RequestException:
+            return False
+        return response.status_code == 200
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        base_url: Optional[str] = None,
+        send: Optional[Callable[..., requests.Response]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
         """
-        Version of the weaviate instance.
+        Send a request and retry it according to the `RetryPolicy` of its endpoint, within the
+        deadline of the policy.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method in lower case, e.g. 'get'.
+        path : str
+            Sub-path to the Weaviate resources, without version.
+        base_url : str, optional
+            The URL of the node to send the request to, by default the node picked by the load
+            balancer or the URL of the connection.
+        send : Callable, optional
+            The function sending the request, by default the method of the session.
+        **kwargs
+            The arguments of `send`, besides the URL.
         """
-        return self._server_version
+        if send is None:
+            send = getattr(self._session, method)
+        policy = self._get_retry_policy(method, path)
+        if policy is None:
+            return self._send_to_node(send, method, path, base_url, None, **kwargs)
+
+        deadline = None if policy.deadline is None else time.monotonic() + policy.deadline
+        retry = 0
+        while True:
+            error: Optional[Exception] = None
+            try:
+                response = self._send_to_node(send, method, path, base_url, deadline, **kwargs)
+            except (RequestsConnectionError, Timeout) as exc:
+                error = exc
+            else:
+                if response.status_code not in policy.retry_status_codes:
+                    return response
+
+            delay = _backoff_delay(retry, policy.backoff_base, policy.backoff_max)
+            if retry >= policy.max_retries or (
+                deadline is not None and time.monotonic() + delay >= deadline
+            ):
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(delay)
+            retry += 1
+
+    def _get_retry_policy(self, method: str, path: str) -> Optional[RetryPolicy]:
+        """Get the policy of the endpoint class, i.e. the first segment of the path."""
+        endpoint_class = path.strip("/").split("/")[0]
+        policies = self._connection_config.retry_policies or {}
+        policy = policies.get(endpoint_class, self._connection_config.retry_policy)
+        if policy is None or (not policy.retry_non_idempotent and not _is_idempotent(method, path)):
+            return None
+        return policy
+
+    def _send_to_node(
+        self,
+        send: Callable[..., requests.Response],
+        method: str,
+        path: str,
+        base_url: Optional[str],
+        deadline: Optional[float],
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request once to `base_url`, or to the node picked by the load balancer if the
+        connection was created with several URLs. If the connection to a node fails the node is
+        ejected. The request is sent to the next node, until every node failed once or the
+        `deadline` (a `time.monotonic()` value) passed, if it was not sent yet or if it is
+        idempotent.
+        """
+        if self._endpoints is None or base_url is not None:
+            url = self.url if base_url is None else base_url
+            return self._send_through_breaker(send, url, path, **_limit_timeout(kwargs, deadline))
+
+        tried: List[_Endpoint] = []
+        while True:
+            endpoint = self._endpoints.acquire(exclude=tried)
+            failed = False
+            try:
+                return self._send_through_breaker(
+                    send, endpoint.url, path, **_limit_timeout(kwargs, deadline)
+                )
+            except RequestsConnectionError as error:
+                failed = True
+                tried.append(endpoint)
+                if (
+                    len(tried) >= len(self._endpoints)
+                    or not (_is_connect_error(error) or _is_idempotent(method, path))
+                    or (deadline is not None and time.monotonic() >= deadline)
+                ):
+                    raise
+            finally:
+                self._endpoints.release(endpoint, failed=failed)
+
+    def _send_through_breaker(
+        self, send: Callable[..., requests.Response], url: str, path: str, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request to a node unless the circuit breaker of the node is open."""
+        breaker = self._get_circuit_breaker(url)
+        if breaker is None:
+            return send(url=url + self._api_version_path + path, **kwargs)
+
+        breaker.before_request()
+        try:
+            response = send(url=url + self._api_version_path + path, **kwargs)
+        except RequestException:
+            breaker.record(failed=True)
+            raise
+        except BaseException:
+            # e.g. KeyboardInterrupt, the node did not fail
+            breaker.cancel()
+            raise
+        breaker.record(failed=response.status_code in UNAVAILABLE_STATUS_CODES)
+        return response
+
+    def _get_circuit_breaker(self, url: str) -> Optional[_CircuitBreaker]:
+        config = self._connection_config.circuit_breaker
+        if config is None:
+            return None
+        breaker = self._circuit_breakers.get(url)
+        if breaker is None:
+            # setdefault is atomic, requests of several threads share the breaker of the node
+            breaker = self._circuit_breakers.setdefault(url, _CircuitBreaker(url, config))
+        return breaker
 
     def get_meta(self) -> Dict[str, str]:
         """
@@ -675,6 +1067,21 @@ class Connection:
         return res
 
 
+def _limit_timeout(kwargs: Dict[str, Any], deadline: Optional[float]) -> Dict[str, Any]:
+    """Shorten the timeouts of a request so it does not outlast the deadline of the call."""
+    timeout = kwargs.get("timeout")
+    if deadline is None or timeout is None:
+        return kwargs
+    remaining = max(deadline - time.monotonic(), 0.001)
+    return {**kwargs, "timeout": tuple(min(value, remaining) for value in timeout)}
+
+
+def _is_oauth2_session(session: Session) -> bool:
+    """Whether the session authenticates with OIDC, without importing authlib if it is not used."""
+    requests_client = sys.modules.get("authlib.integrations.requests_client")
+    return requests_client is not None and isinstance(session, requests_client.OAuth2Session)
+
+
 def _get_epoch_time() -> int:
     """
     Get the current epoch time as an integer.
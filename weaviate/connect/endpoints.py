@@ -0,0 +1,167 @@
+"""
+Load balancing of the requests of a `Connection` over several Weaviate nodes.
+"""
+import random
+import sys
+import threading
+from typing import Callable, Collection, List, Optional
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from weaviate.exceptions import WeaviateCircuitOpenError
+
+
+class _Endpoint:
+    """
+    A Weaviate node and the state the load balancer keeps for it.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.healthy = True
+
+
+class _EndpointPool:
+    """
+    Picks the node for every request of a `Connection` that was created with several URLs.
+
+    With the 'least_outstanding' strategy the healthy node with the fewest requests in flight is
+    picked, ties are broken randomly. With 'power_of_two' the less busy of two random healthy nodes
+    is picked, which spreads the load just as well without looking at every node.
+
+    A node is ejected when a request to it fails with a connection error, and added back once its
+    ready endpoint answers again. The ready endpoints of all nodes are probed every
+    `health_check_interval` seconds in a background thread. If no node is healthy the requests are
+    sent to the ejected nodes, so they fail with the error of the node instead of an error of the
+    client.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        strategy: str,
+        health_check_interval: float,
+        is_ready: Callable[[str], bool],
+    ):
+        self._endpoints = [_Endpoint(url) for url in urls]
+        self._strategy = strategy
+        self._health_check_interval = health_check_interval
+        self._is_ready = is_ready
+        self._lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+        self._health_check: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    @property
+    def urls(self) -> List[str]:
+        """
+        The URLs of all nodes.
+        """
+
+        return [endpoint.url for endpoint in self._endpoints]
+
+    @property
+    def healthy_urls(self) -> List[str]:
+        """
+        The URLs of the nodes that are not ejected.
+        """
+
+        with self._lock:
+            return [endpoint.url for endpoint in self._endpoints if endpoint.healthy]
+
+    def acquire(self, exclude: Collection[_Endpoint] = ()) -> _Endpoint:
+        """
+        Pick the node for a request and count the request as outstanding until `release`.
+
+        Parameters
+        ----------
+        exclude : Collection[_Endpoint], optional
+            Nodes that already failed for this request, they are only picked if no other node is
+            left.
+
+        Returns
+        -------
+        _Endpoint
+            The node to send the request to.
+        """
+
+        with self._lock:
+            candidates = [endpoint for endpoint in self._endpoints if endpoint not in exclude]
+            if len(candidates) == 0:
+                candidates = self._endpoints
+            healthy = [endpoint for endpoint in candidates if endpoint.healthy]
+            if len(healthy) > 0:
+                candidates = healthy
+
+            if self._strategy == "power_of_two" and len(candidates) > 2:
+                candidates = random.sample(candidates, 2)
+            fewest = min(endpoint.outstanding for endpoint in candidates)
+            endpoint = random.choice(
+                [endpoint for endpoint in candidates if endpoint.outstanding == fewest]
+            )
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint: _Endpoint, failed: bool = False) -> None:
+        """
+        Count a request as done and eject its node if the connection to the node failed.
+        """
+
+        with self._lock:
+            endpoint.outstanding -= 1
+            if failed:
+                endpoint.healthy = False
+
+    def start_health_checks(self) -> None:
+        """
+        Start probing the ready endpoint of every node in a background thread, only once.
+        """
+
+        with self._lock:
+            if self._health_check is not None:
+                return
+            self._health_check = threading.Thread(
+                target=self._run_health_checks, daemon=True, name="EndpointHealthCheck"
+            )
+            self._health_check.start()
+
+    def shutdown(self) -> None:
+        self._shutdown_event.set()
+
+    def check_health(self) -> None:
+        """
+        Probe the ready endpoint of every node once and eject or add back the nodes.
+        """
+
+        for endpoint in self._endpoints:
+            healthy = self._is_ready(endpoint.url)
+            with self._lock:
+                endpoint.healthy = healthy
+
+    def _run_health_checks(self) -> None:
+        while not self._shutdown_event.wait(self._health_check_interval):
+            self.check_health()
+
+
+def _is_connect_error(error: RequestsConnectionError) -> bool:
+    """
+    Whether the connection to the node could not be established, i.e. the request was not sent and
+    can be sent to another node. Other connection errors, e.g. 'Connection aborted', can happen
+    after the request was sent.
+    """
+
+    if isinstance(error, (ConnectTimeout, WeaviateCircuitOpenError)):
+        return True
+    reason = error.args[0] if len(error.args) > 0 else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    if isinstance(reason, NewConnectionError):
+        return True
+    # the HTTP/2 transport raises the error of httpx as cause
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(error.__cause__, httpx.ConnectError)
@@ -0,0 +1,117 @@
+"""
+Retries with backoff and circuit breakers for the requests of a `Connection`.
+"""
+import random
+import threading
+import time
+from typing import Optional
+
+from weaviate.config import CircuitBreakerConfig
+from weaviate.exceptions import WeaviateCircuitOpenError
+
+# the server is down or overloaded
+UNAVAILABLE_STATUS_CODES = (502, 503, 504)
+
+_IDEMPOTENT_METHODS = ("get", "head", "put", "delete")
+# POST requests that only read
+_READ_ONLY_POST_PATHS = ("/graphql",)
+
+
+def _backoff_delay(retry: int, base: float, maximum: float) -> float:
+    """
+    Get how long to wait before the retry number `retry` (starting at 0). The delay grows
+    exponentially with the retries and is jittered, so clients that failed at the same time do not
+    retry at the same time.
+
+    Parameters
+    ----------
+    retry : int
+        The number of retries done so far.
+    base : float
+        The delay of the first retry in seconds, before the jitter.
+    maximum : float
+        The highest delay in seconds, before the jitter.
+
+    Returns
+    -------
+    float
+        The number of seconds to wait, between half of and the full backoff.
+    """
+
+    backoff = min(base * 2**retry, maximum)
+    return random.uniform(backoff / 2, backoff)
+
+
+def _is_idempotent(method: str, path: str) -> bool:
+    """
+    Whether sending the request twice has the same effect as sending it once.
+    """
+
+    if method in _IDEMPOTENT_METHODS:
+        return True
+    return method == "post" and path.startswith(_READ_ONLY_POST_PATHS)
+
+
+class _CircuitBreaker:
+    """
+    Circuit breaker of one weaviate node. It is closed while the requests succeed, opens after
+    `failure_threshold` consecutive failures and lets one trial request through after
+    `recovery_time` seconds (half-open). The trial closes the circuit if it succeeds and opens it
+    again if it fails.
+    """
+
+    def __init__(self, url: str, config: CircuitBreakerConfig):
+        self._url = url
+        self._failure_threshold = config.failure_threshold
+        self._recovery_time = config.recovery_time
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """
+        Raise `WeaviateCircuitOpenError` if the request must not be sent.
+        """
+
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self._recovery_time - time.monotonic()
+            if remaining <= 0 and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        raise WeaviateCircuitOpenError(
+            f"The circuit breaker of the weaviate node {self._url} is open after "
+            f"{self._failure_threshold} consecutive failed requests, the next request is sent in "
+            f"{max(remaining, 0):.1f}s."
+        )
+
+    def cancel(self) -> None:
+        """
+        Let the next trial request through if a request was interrupted, without recording an
+        outcome.
+        """
+
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record(self, failed: bool) -> None:
+        """
+        Record the outcome of a request that was sent.
+        """
+
+        with self._lock:
+            self._trial_in_flight = False
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
@@ -0,0 +1,138 @@
+"""
+HTTP transports of the `Connection`, which sends its requests through `requests` by default.
+"""
+import importlib.util
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout, ReadTimeout
+from requests.structures import CaseInsensitiveDict
+
+from weaviate.types import NUMBERS
+
+try:
+    import httpx
+
+    has_httpx = True
+except ImportError:
+    has_httpx = False
+
+
+class _HttpxSession:
+    """
+    Session sending the requests of a `Connection` through an `httpx.Client` with HTTP/2 enabled,
+    so concurrent requests are multiplexed over a few connections instead of one connection per
+    request. It implements the part of `requests.Session` that the `Connection` uses and returns
+    `requests.Response` objects, so the rest of the client does not depend on the transport.
+
+    HTTP/2 is negotiated through TLS (ALPN), requests to `http://` URLs use HTTP/1.1.
+    """
+
+    def __init__(self, pool_maxsize: int, proxies: Dict[str, str]):
+        if not has_httpx or importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "The 'http2' transport requires the 'httpx' package with HTTP/2 support. "
+                "Install it with: pip install weaviate-client[HTTP2]"
+            )
+        limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+        mounts = {
+            f"{scheme}://": httpx.HTTPTransport(proxy=proxy, limits=limits, http2=True)
+            for scheme, proxy in proxies.items()
+        }
+        # the proxies read from the ENV variables are already part of 'proxies'
+        self._client = httpx.Client(http2=True, limits=limits, mounts=mounts, trust_env=False)
+        self.hooks: Dict[str, List[Callable[..., Any]]] = {"response": []}
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        """The connection pool is configured when the session is created."""
+
+    def close(self) -> None:
+        self._client.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Tuple[NUMBERS, NUMBERS]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        if params is not None:
+            # requests and httpx encode booleans differently, stick to the requests format
+            params = {
+                key: str(value) if isinstance(value, bool) else value
+                for key, value in params.items()
+            }
+        try:
+            response = self._client.request(
+                method,
+                url,
+                content=data,
+                headers=headers,
+                params=params,
+                timeout=_get_timeout(timeout),
+            )
+        except httpx.ConnectTimeout as error:
+            raise ConnectTimeout(str(error)) from error
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise RequestsConnectionError(str(error)) from error
+
+        resp = _to_requests_response(response)
+        for hook in self.hooks["response"]:
+            hook(resp)
+        return resp
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+def _get_timeout(timeout: Optional[Tuple[NUMBERS, NUMBERS]]) -> "httpx.Timeout":
+    if timeout is None:
+        return httpx.Timeout(None)
+    connect, read = timeout
+    # requests waiting for a free connection of the pool are not timed out, the connect and read
+    # timeouts apply once they are sent
+    return httpx.Timeout(read, connect=connect, pool=None)
+
+
+def _to_requests_response(response: "httpx.Response") -> requests.Response:
+    """
+    Convert a httpx response to a requests response.
+    """
+
+    request = requests.PreparedRequest()
+    request.method = response.request.method
+    request.url = str(response.request.url)
+    request.headers = CaseInsensitiveDict(response.request.headers)
+    request.body = response.request.content
+
+    resp = requests.Response()
+    resp.status_code = response.status_code
+    resp._content = response.content
+    resp.headers = CaseInsensitiveDict(response.headers)
+    resp.url = str(response.url)
+    resp.encoding = response.encoding
+    resp.reason = response.reason_phrase
+    resp.elapsed = response.elapsed
+    resp.request = request
+    return resp
@@ -0,0 +1,289 @@
+"""
+AsyncDataObject class definition.
+"""
+import uuid as uuid_lib
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.connect.async_connection import AsyncConnection
+from weaviate.data.crud_data import (
+    _get_create_request,
+    _get_create_response,
+    _get_object_for_update,
+    _get_object_params,
+    _get_object_path,
+    _get_objects_request,
+    _get_validate_request,
+    _get_validate_response,
+)
+from weaviate.data.replication import ConsistencyLevel
+from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.types import UUID
+from weaviate.util import get_valid_uuid
+
+
+class AsyncDataObject:
+    """
+    AsyncDataObject class used to manipulate objects to/from Weaviate asynchronously. The methods
+    take the same arguments and raise the same exceptions as the ones of
+    `weaviate.data.DataObject`.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncDataObject class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.connect.async_connection.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+
+    async def create(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID, None] = None,
+        vector: Optional[Sequence] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> str:
+        """
+        Takes a dict describing the object and adds it to Weaviate, see `DataObject.create`.
+
+        Returns
+        -------
+        str
+            Returns the UUID of the created object if successful.
+        """
+
+        weaviate_obj, params = _get_create_request(
+            data_object, class_name, uuid, vector, consistency_level, tenant
+        )
+        try:
+            response = await self._connection.post(
+                path="/objects", weaviate_object=weaviate_obj, params=params
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not added to Weaviate.") from conn_err
+        return _get_create_response(response, uuid)
+
+    async def update(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID],
+        vector: Optional[Sequence] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Update the given object with the already existing object in Weaviate, see
+        `DataObject.update`.
+        """
+
+        params = _get_object_params(consistency_level, None)
+        weaviate_obj, path = _get_object_for_update(
+            self._connection.server_version, data_object, class_name, uuid, vector
+        )
+        if tenant is not None:
+            weaviate_obj["tenant"] = tenant
+
+        try:
+            response = await self._connection.patch(
+                path=path, weaviate_object=weaviate_obj, params=params
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not updated.") from conn_err
+        if response.status_code == 204:
+            # Successful merge
+            return
+        raise UnexpectedStatusCodeException("Update of the object not successful", response)
+
+    async def replace(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID],
+        vector: Optional[Sequence] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Replace an already existing object with the given data object, see `DataObject.replace`.
+        """
+
+        params = _get_object_params(consistency_level, None)
+        weaviate_obj, path = _get_object_for_update(
+            self._connection.server_version, data_object, class_name, uuid, vector
+        )
+        if tenant is not None:
+            weaviate_obj["tenant"] = tenant
+        try:
+            response = await self._connection.put(
+                path=path, weaviate_object=weaviate_obj, params=params
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not replaced.") from conn_err
+        if response.status_code == 200:
+            # Successful update
+            return
+        raise UnexpectedStatusCodeException("Replace object", response)
+
+    async def get_by_id(
+        self,
+        uuid: Union[str, uuid_lib.UUID],
+        additional_properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+        class_name: Optional[str] = None,
+        node_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        Get an object as dict, see `DataObject.get_by_id`.
+
+        Returns
+        -------
+        dict or None
+            dict: The object if it exists.
+            None: If the object does not exist.
+        """
+
+        return await self.get(
+            uuid=uuid,
+            additional_properties=additional_properties,
+            with_vector=with_vector,
+            class_name=class_name,
+            node_name=node_name,
+            consistency_level=consistency_level,
+            tenant=tenant,
+        )
+
+    async def get(
+        self,
+        uuid: Union[str, uuid_lib.UUID, None] = None,
+        additional_properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+        class_name: Optional[str] = None,
+        node_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        limit: Optional[int] = None,
+        after: Optional[UUID] = None,
+        offset: Optional[int] = None,
+        sort: Optional[Dict[str, Union[str, bool, List[bool], List[str]]]] = None,
+        tenant: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Gets objects from Weaviate, see `DataObject.get`.
+
+        Returns
+        -------
+        dict or None
+            A list of all objects. If no objects where found the list is empty.
+        """
+
+        path, params = _get_objects_request(
+            self._connection.server_version,
+            uuid,
+            additional_properties,
+            with_vector,
+            class_name,
+            node_name,
+            consistency_level,
+            limit,
+            after,
+            offset,
+            sort,
+            tenant,
+        )
+        try:
+            response = await self._connection.get(path=path, params=params)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Could not get object/s.") from conn_err
+        if response.status_code == 200:
+            return cast(Dict[str, Any], response.json())
+        if response.status_code == 404:
+            return None
+        raise UnexpectedStatusCodeException("Get object/s", response)
+
+    async def delete(
+        self,
+        uuid: Union[str, uuid_lib.UUID],
+        class_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Delete an existing object from Weaviate, see `DataObject.delete`.
+        """
+
+        path = _get_object_path(self._connection.server_version, get_valid_uuid(uuid), class_name)
+        params = _get_object_params(consistency_level, tenant)
+        try:
+            response = await self._connection.delete(path=path, params=params)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object could not be deleted.") from conn_err
+        if response.status_code == 204:
+            # Successfully deleted
+            return
+        raise UnexpectedStatusCodeException("Delete object", response)
+
+    async def exists(
+        self,
+        uuid: Union[str, uuid_lib.UUID],
+        class_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> bool:
+        """
+        Check if the object exist in Weaviate, see `DataObject.exists`.
+
+        Returns
+        -------
+        bool
+            True if object exists, False otherwise.
+        """
+
+        path = _get_object_path(self._connection.server_version, uuid, class_name)
+        params = _get_object_params(consistency_level, tenant)
+        try:
+            response = await self._connection.head(path=path, params=params)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Could not check if object exist.") from conn_err
+
+        if response.status_code == 204:
+            return True
+        if response.status_code == 404:
+            return False
+        raise UnexpectedStatusCodeException("Object exists", response)
+
+    async def validate(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID, None] = None,
+        vector: Optional[Sequence] = None,
+    ) -> dict:
+        """
+        Validate an object against Weaviate, see `DataObject.validate`.
+
+        Returns
+        -------
+        dict
+            Validation result. E.g. {"valid": bool, "error": None or list}
+        """
+
+        weaviate_obj = _get_validate_request(data_object, class_name, uuid, vector)
+        try:
+            response = await self._connection.post(
+                path="/objects/validate", weaviate_object=weaviate_obj
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Object was not validated against Weaviate."
+            ) from conn_err
+        return _get_validate_response(response)
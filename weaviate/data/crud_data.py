@@ -5,6 +5,7 @@ import uuid as uuid_lib
 import warnings
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
+from requests import Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
@@ -121,42 +122,16 @@ class DataObject:
             If the network connection to Weaviate fails.
         """
 
-        if not isinstance(class_name, str):
-            raise TypeError(f"Expected class_name of type str but was: {type(class_name)}")
-        loaded_data_object = _get_dict_from_object(data_object)
-
-        weaviate_obj = {
-            "class": _capitalize_first_letter(class_name),
-            "properties": loaded_data_object,
-        }
-        if uuid is not None:
-            weaviate_obj["id"] = get_valid_uuid(uuid)
-
-        if vector is not None:
-            weaviate_obj["vector"] = get_vector(vector)
-
-        path = "/objects"
-        params = {}
-        if consistency_level is not None:
-            params["consistency_level"] = ConsistencyLevel(consistency_level).value
-        if tenant is not None:
-            weaviate_obj["tenant"] = tenant
+        weaviate_obj, params = _get_create_request(
+            data_object, class_name, uuid, vector, consistency_level, tenant
+        )
         try:
-            response = self._connection.post(path=path, weaviate_object=weaviate_obj, params=params)
+            response = self._connection.post(
+                path="/objects", weaviate_object=weaviate_obj, params=params
+            )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Object was not added to Weaviate.") from conn_err
-        if response.status_code == 200:
-            return str(response.json()["id"])
-
-        object_does_already_exist = False
-        try:
-            if "already exists" in response.json()["error"][0]["message"]:
-                object_does_already_exist = True
-        except KeyError:
-            pass
-        if object_does_already_exist:
-            raise ObjectAlreadyExistsException(str(uuid))
-        raise UnexpectedStatusCodeException("Creating object", response)
+        return _get_create_response(response, uuid)
 
     def update(
         self,
@@ -248,7 +223,9 @@ class DataObject:
         params = {}
         if consistency_level is not None:
             params["consistency_level"] = ConsistencyLevel(consistency_level).value
-        weaviate_obj, path = self._create_object_for_update(data_object, class_name, uuid, vector)
+        weaviate_obj, path = _get_object_for_update(
+            self._connection.server_version, data_object, class_name, uuid, vector
+        )
         if tenant is not None:
             weaviate_obj["tenant"] = tenant
 
@@ -351,7 +328,9 @@ class DataObject:
         params = {}
         if consistency_level is not None:
             params["consistency_level"] = ConsistencyLevel(consistency_level).value
-        weaviate_obj, path = self._create_object_for_update(data_object, class_name, uuid, vector)
+        weaviate_obj, path = _get_object_for_update(
+            self._connection.server_version, data_object, class_name, uuid, vector
+        )
         if tenant is not None:
             weaviate_obj["tenant"] = tenant
         try:
@@ -363,37 +342,6 @@ class DataObject:
             return
         raise UnexpectedStatusCodeException("Replace object", response)
 
-    def _create_object_for_update(
-        self,
-        data_object: Union[dict, str],
-        class_name: str,
-        uuid: Union[str, uuid_lib.UUID],
-        vector: Optional[Sequence] = None,
-    ) -> Tuple[Dict[str, Any], str]:
-        if not isinstance(class_name, str):
-            raise TypeError("Class must be type str")
-
-        uuid = get_valid_uuid(uuid)
-
-        object_dict = _get_dict_from_object(data_object)
-
-        weaviate_obj = {
-            "id": uuid,
-            "properties": object_dict,
-            "class": _capitalize_first_letter(class_name),
-        }
-
-        if vector is not None:
-            weaviate_obj["vector"] = get_vector(vector)
-
-        is_server_version_14 = self._connection.server_version >= "1.14"
-
-        if is_server_version_14:
-            path = f"/objects/{_capitalize_first_letter(class_name)}/{uuid}"
-        else:
-            path = f"/objects/{uuid}"
-        return weaviate_obj, path
-
     def get_by_id(
         self,
         uuid: Union[str, uuid_lib.UUID],
@@ -550,94 +498,20 @@ class DataObject:
         weaviate.UnexpectedStatusCodeException
             If Weaviate reports a none OK status.
         """
-        is_server_version_14 = self._connection.server_version >= "1.14"
-
-        if class_name is None and is_server_version_14 and uuid is not None:
-            warnings.warn(
-                message=DATA_DEPRECATION_NEW_V14_CLS_NS_W,
-                category=DeprecationWarning,
-                stacklevel=1,
-            )
-        if class_name is not None and uuid is not None:
-            if not is_server_version_14:
-                warnings.warn(
-                    message=DATA_DEPRECATION_OLD_V14_CLS_NS_W,
-                    category=DeprecationWarning,
-                    stacklevel=1,
-                )
-            if not isinstance(class_name, str):
-                raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
-
-        params = _get_params(additional_properties, with_vector)
-
-        if class_name and is_server_version_14:
-            if uuid is not None:
-                path = f"/objects/{_capitalize_first_letter(class_name)}"
-            else:
-                path = "/objects"
-                params["class"] = _capitalize_first_letter(class_name)
-        else:
-            path = "/objects"
-
-        if uuid is not None:
-            path += "/" + get_valid_uuid(uuid)
-
-        if consistency_level is not None:
-            params["consistency_level"] = ConsistencyLevel(consistency_level).value
-
-        if tenant is not None:
-            params["tenant"] = tenant
-
-        if node_name is not None:
-            params["node_name"] = node_name
-
-        if limit is not None:
-            _check_positive_num(limit, "limit", int, include_zero=False)
-            params["limit"] = limit
-
-        if after is not None:
-            params["after"] = get_valid_uuid(after)
-
-        if offset is not None:
-            _check_positive_num(offset, "offset", int, include_zero=True)
-            params["offset"] = offset
-
-        if sort is not None:
-            if "properties" not in sort:
-                raise ValueError("The sort clause is missing the required field: 'properties'.")
-            if "order_asc" not in sort:
-                sort["order_asc"] = True
-            if not isinstance(sort, Dict):
-                raise TypeError(f"'sort' must be of type dict. Given type: {type(sort)}.")
-            if isinstance(sort["properties"], str):
-                sort["properties"] = [sort["properties"]]
-            elif not isinstance(sort["properties"], list) or not all(
-                isinstance(x, str) for x in sort["properties"]
-            ):
-                raise TypeError(
-                    f"'sort['properties']' must be of type str or list[str]. Given type: {type(sort['properties'])}."
-                )
-            if len(sort["properties"]) == 0:
-                raise ValueError("'sort['properties']' cannot be an empty list.")
-
-            if isinstance(sort["order_asc"], bool):
-                sort["order_asc"] = [sort["order_asc"]] * len(sort["properties"])
-            elif not isinstance(sort["order_asc"], list) or not all(
-                isinstance(x, bool) for x in sort["order_asc"]
-            ):
-                raise TypeError(
-                    f"'sort['order_asc']' must be of type boolean or list[bool]. Given type: {type(sort['order_asc'])}."
-                )
-            if len(sort["properties"]) != len(sort["order_asc"]):  # type: ignore
-                raise ValueError(
-                    f"'sort['order_asc']' must be the same length as 'sort['properties']' or a boolean (not in a list). Current length is sort['properties']:{len(sort['properties'])} and sort['order_asc']:{len(sort['order_asc'])}."  # type: ignore
-                )
-            if len(sort["order_asc"]) == 0:  # type: ignore
-                raise ValueError("'sort['order_asc']' cannot be an empty list.")
-
-            params["sort"] = ",".join(sort["properties"])  # type: ignore
-            order = ["asc" if x else "desc" for x in sort["order_asc"]]  # type: ignore
-            params["order"] = ",".join(order)
+        path, params = _get_objects_request(
+            self._connection.server_version,
+            uuid,
+            additional_properties,
+            with_vector,
+            class_name,
+            node_name,
+            consistency_level,
+            limit,
+            after,
+            offset,
+            sort,
+            tenant,
+        )
 
         try:
             response = self._connection.get(
@@ -716,36 +590,8 @@ class DataObject:
             If uuid is not properly formed.
         """
 
-        uuid = get_valid_uuid(uuid)
-
-        is_server_version_14 = self._connection.server_version >= "1.14"
-
-        if class_name is None and is_server_version_14:
-            warnings.warn(
-                message=DATA_DEPRECATION_NEW_V14_CLS_NS_W,
-                category=DeprecationWarning,
-                stacklevel=1,
-            )
-        if class_name is not None:
-            if not is_server_version_14:
-                warnings.warn(
-                    message=DATA_DEPRECATION_OLD_V14_CLS_NS_W,
-                    category=DeprecationWarning,
-                    stacklevel=1,
-                )
-            if not isinstance(class_name, str):
-                raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
-
-        if class_name and is_server_version_14:
-            path = f"/objects/{_capitalize_first_letter(class_name)}/{uuid}"
-        else:
-            path = f"/objects/{uuid}"
-
-        params = {}
-        if consistency_level is not None:
-            params = {"consistency_level": ConsistencyLevel(consistency_level).value}
-        if tenant is not None:
-            params["tenant"] = tenant
+        path = _get_object_path(self._connection.server_version, get_valid_uuid(uuid), class_name)
+        params = _get_object_params(consistency_level, tenant)
         try:
             response = self._connection.delete(
                 path=path,
@@ -817,33 +663,8 @@ class DataObject:
             If uuid is not properly formed.
         """
 
-        is_server_version_14 = self._connection.server_version >= "1.14"
-
-        if class_name is None and is_server_version_14:
-            warnings.warn(
-                message=DATA_DEPRECATION_NEW_V14_CLS_NS_W,
-                category=DeprecationWarning,
-                stacklevel=1,
-            )
-        if class_name is not None:
-            if not is_server_version_14:
-                warnings.warn(
-                    message=DATA_DEPRECATION_OLD_V14_CLS_NS_W,
-                    category=DeprecationWarning,
-                    stacklevel=1,
-                )
-            if not isinstance(class_name, str):
-                raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
-
-        if class_name and is_server_version_14:
-            path = f"/objects/{_capitalize_first_letter(class_name)}/{get_valid_uuid(uuid)}"
-        else:
-            path = f"/objects/{get_valid_uuid(uuid)}"
-        params = {}
-        if consistency_level is not None:
-            params = {"consistency_level": ConsistencyLevel(consistency_level).value}
-        if tenant is not None:
-            params["tenant"] = tenant
+        path = _get_object_path(self._connection.server_version, uuid, class_name)
+        params = _get_object_params(consistency_level, tenant)
 
         try:
             response = self._connection.head(
@@ -930,39 +751,14 @@ class DataObject:
             If the network connection to Weaviate fails.
         """
 
-        loaded_data_object = _get_dict_from_object(data_object)
-        if not isinstance(class_name, str):
-            raise TypeError(f"Expected class_name of type `str` but was: {type(class_name)}")
-
-        weaviate_obj = {
-            "class": _capitalize_first_letter(class_name),
-            "properties": loaded_data_object,
-        }
-
-        if uuid is not None:
-            weaviate_obj["id"] = get_valid_uuid(uuid)
-
-        if vector is not None:
-            weaviate_obj["vector"] = get_vector(vector)
-
-        path = "/objects/validate"
+        weaviate_obj = _get_validate_request(data_object, class_name, uuid, vector)
         try:
-            response = self._connection.post(path=path, weaviate_object=weaviate_obj)
+            response = self._connection.post(path="/objects/validate", weaviate_object=weaviate_obj)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError(
                 "Object was not validated against Weaviate."
             ) from conn_err
-
-        result: dict = {"error": None}
-
-        if response.status_code == 200:
-            result["valid"] = True
-            return result
-        if response.status_code == 422:
-            result["valid"] = False
-            result["error"] = response.json()["error"]
-            return result
-        raise UnexpectedStatusCodeException("Validate object", response)
+        return _get_validate_response(response)
 
 
 def _get_params(additional_properties: Optional[List[str]], with_vector: bool) -> dict:
@@ -1003,3 +799,280 @@ def _get_params(additional_properties: Optional[List[str]], with_vector: bool) -
         else:
             params["include"] = "vector"
     return params
+
+
+def _get_object_for_update(
+    server_version: str,
+    data_object: Union[dict, str],
+    class_name: str,
+    uuid: Union[str, uuid_lib.UUID],
+    vector: Optional[Sequence] = None,
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Get the payload and the path of a request updating or replacing an object.
+    """
+    if not isinstance(class_name, str):
+        raise TypeError("Class must be type str")
+
+    uuid = get_valid_uuid(uuid)
+
+    object_dict = _get_dict_from_object(data_object)
+
+    weaviate_obj = {
+        "id": uuid,
+        "properties": object_dict,
+        "class": _capitalize_first_letter(class_name),
+    }
+
+    if vector is not None:
+        weaviate_obj["vector"] = get_vector(vector)
+
+    is_server_version_14 = server_version >= "1.14"
+
+    if is_server_version_14:
+        path = f"/objects/{_capitalize_first_letter(class_name)}/{uuid}"
+    else:
+        path = f"/objects/{uuid}"
+    return weaviate_obj, path
+
+
+def _get_objects_request(
+    server_version: str,
+    uuid: Union[str, uuid_lib.UUID, None],
+    additional_properties: Optional[List[str]],
+    with_vector: bool,
+    class_name: Optional[str],
+    node_name: Optional[str],
+    consistency_level: Optional[ConsistencyLevel],
+    limit: Optional[int],
+    after: Optional[UUID],
+    offset: Optional[int],
+    sort: Optional[Dict[str, Union[str, bool, List[bool], List[str]]]],
+    tenant: Optional[str],
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Get the path and the parameters of a request getting objects, see `DataObject.get`.
+    """
+
+    is_server_version_14 = server_version >= "1.14"
+
+    if class_name is None and is_server_version_14 and uuid is not None:
+        warnings.warn(
+            message=DATA_DEPRECATION_NEW_V14_CLS_NS_W,
+            category=DeprecationWarning,
+            stacklevel=1,
+        )
+    if class_name is not None and uuid is not None:
+        if not is_server_version_14:
+            warnings.warn(
+                message=DATA_DEPRECATION_OLD_V14_CLS_NS_W,
+                category=DeprecationWarning,
+                stacklevel=1,
+            )
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+
+    params = _get_params(additional_properties, with_vector)
+
+    if class_name and is_server_version_14:
+        if uuid is not None:
+            path = f"/objects/{_capitalize_first_letter(class_name)}"
+        else:
+            path = "/objects"
+            params["class"] = _capitalize_first_letter(class_name)
+    else:
+        path = "/objects"
+
+    if uuid is not None:
+        path += "/" + get_valid_uuid(uuid)
+
+    if consistency_level is not None:
+        params["consistency_level"] = ConsistencyLevel(consistency_level).value
+
+    if tenant is not None:
+        params["tenant"] = tenant
+
+    if node_name is not None:
+        params["node_name"] = node_name
+
+    if limit is not None:
+        _check_positive_num(limit, "limit", int, include_zero=False)
+        params["limit"] = limit
+
+    if after is not None:
+        params["after"] = get_valid_uuid(after)
+
+    if offset is not None:
+        _check_positive_num(offset, "offset", int, include_zero=True)
+        params["offset"] = offset
+
+    if sort is not None:
+        if "properties" not in sort:
+            raise ValueError("The sort clause is missing the required field: 'properties'.")
+        if "order_asc" not in sort:
+            sort["order_asc"] = True
+        if not isinstance(sort, Dict):
+            raise TypeError(f"'sort' must be of type dict. Given type: {type(sort)}.")
+        if isinstance(sort["properties"], str):
+            sort["properties"] = [sort["properties"]]
+        elif not isinstance(sort["properties"], list) or not all(
+            isinstance(x, str) for x in sort["properties"]
+        ):
+            raise TypeError(
+                f"'sort['properties']' must be of type str or list[str]. Given type: {type(sort['properties'])}."
+            )
+        if len(sort["properties"]) == 0:
+            raise ValueError("'sort['properties']' cannot be an empty list.")
+
+        if isinstance(sort["order_asc"], bool):
+            sort["order_asc"] = [sort["order_asc"]] * len(sort["properties"])
+        elif not isinstance(sort["order_asc"], list) or not all(
+            isinstance(x, bool) for x in sort["order_asc"]
+        ):
+            raise TypeError(
+                f"'sort['order_asc']' must be of type boolean or list[bool]. Given type: {type(sort['order_asc'])}."
+            )
+        if len(sort["properties"]) != len(sort["order_asc"]):  # type: ignore
+            raise ValueError(
+                f"'sort['order_asc']' must be the same length as 'sort['properties']' or a boolean (not in a list). Current length is sort['properties']:{len(sort['properties'])} and sort['order_asc']:{len(sort['order_asc'])}."  # type: ignore
+            )
+        if len(sort["order_asc"]) == 0:  # type: ignore
+            raise ValueError("'sort['order_asc']' cannot be an empty list.")
+
+        params["sort"] = ",".join(sort["properties"])  # type: ignore
+        order = ["asc" if x else "desc" for x in sort["order_asc"]]  # type: ignore
+        params["order"] = ",".join(order)
+
+    return path, params
+
+
+def _get_object_path(
+    server_version: str, uuid: Union[str, uuid_lib.UUID], class_name: Optional[str]
+) -> str:
+    """
+    Get the path of a single object, warning if the class name is missing or not supported by the
+    version of weaviate.
+    """
+
+    is_server_version_14 = server_version >= "1.14"
+
+    if class_name is None and is_server_version_14:
+        warnings.warn(
+            message=DATA_DEPRECATION_NEW_V14_CLS_NS_W,
+            category=DeprecationWarning,
+            stacklevel=1,
+        )
+    if class_name is not None:
+        if not is_server_version_14:
+            warnings.warn(
+                message=DATA_DEPRECATION_OLD_V14_CLS_NS_W,
+                category=DeprecationWarning,
+                stacklevel=1,
+            )
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+
+    if class_name and is_server_version_14:
+        return f"/objects/{_capitalize_first_letter(class_name)}/{get_valid_uuid(uuid)}"
+    else:
+        return f"/objects/{get_valid_uuid(uuid)}"
+
+
+def _get_object_params(
+    consistency_level: Optional[ConsistencyLevel], tenant: Optional[str]
+) -> Dict[str, Any]:
+    params = {}
+    if consistency_level is not None:
+        params = {"consistency_level": ConsistencyLevel(consistency_level).value}
+    if tenant is not None:
+        params["tenant"] = tenant
+    return params
+
+
+def _get_create_request(
+    data_object: Union[dict, str],
+    class_name: str,
+    uuid: Union[str, uuid_lib.UUID, None],
+    vector: Optional[Sequence],
+    consistency_level: Optional[ConsistencyLevel],
+    tenant: Optional[str],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Get the payload and the parameters of a request creating an object, see `DataObject.create`.
+    """
+
+    if not isinstance(class_name, str):
+        raise TypeError(f"Expected class_name of type str but was: {type(class_name)}")
+    loaded_data_object = _get_dict_from_object(data_object)
+
+    weaviate_obj = {
+        "class": _capitalize_first_letter(class_name),
+        "properties": loaded_data_object,
+    }
+    if uuid is not None:
+        weaviate_obj["id"] = get_valid_uuid(uuid)
+
+    if vector is not None:
+        weaviate_obj["vector"] = get_vector(vector)
+
+    params = {}
+    if consistency_level is not None:
+        params["consistency_level"] = ConsistencyLevel(consistency_level).value
+    if tenant is not None:
+        weaviate_obj["tenant"] = tenant
+    return weaviate_obj, params
+
+
+def _get_create_response(response: Response, uuid: Union[str, uuid_lib.UUID, None]) -> str:
+    if response.status_code == 200:
+        return str(response.json()["id"])
+
+    object_does_already_exist = False
+    try:
+        if "already exists" in response.json()["error"][0]["message"]:
+            object_does_already_exist = True
+    except KeyError:
+        pass
+    if object_does_already_exist:
+        raise ObjectAlreadyExistsException(str(uuid))
+    raise UnexpectedStatusCodeException("Creating object", response)
+
+
+def _get_validate_request(
+    data_object: Union[dict, str],
+    class_name: str,
+    uuid: Union[str, uuid_lib.UUID, None],
+    vector: Optional[Sequence],
+) -> Dict[str, Any]:
+    """
+    Get the payload of a request validating an object, see `DataObject.validate`.
+    """
+
+    loaded_data_object = _get_dict_from_object(data_object)
+    if not isinstance(class_name, str):
+        raise TypeError(f"Expected class_name of type `str` but was: {type(class_name)}")
+
+    weaviate_obj = {
+        "class": _capitalize_first_letter(class_name),
+        "properties": loaded_data_object,
+    }
+
+    if uuid is not None:
+        weaviate_obj["id"] = get_valid_uuid(uuid)
+
+    if vector is not None:
+        weaviate_obj["vector"] = get_vector(vector)
+    return weaviate_obj
+
+
+def _get_validate_response(response: Response) -> dict:
+    result: dict = {"error": None}
+
+    if response.status_code == 200:
+        result["valid"] = True
+        return result
+    if response.status_code == 422:
+        result["valid"] = False
+        result["error"] = response.json()["error"]
+        return result
+    raise UnexpectedStatusCodeException("Validate object", response)
@@ -15,7 +15,6 @@ from pathlib import Path
 from typing import Dict, Optional
 
 import requests
-import validators  # type: ignore
 
 from weaviate import exceptions
 from weaviate.exceptions import WeaviateStartUpError
@@ -64,6 +63,8 @@ class EmbeddedDB:
             r"^\d\.\d{1,2}\.\d{1,2}?(-rc\.\d{1,2}|-beta\.\d{1,2}|-alpha\.\d{1,2}|$)$"
         )
 
+        import validators
+
         valid_url = validators.url(self.options.version)
         if isinstance(valid_url, validators.ValidationError):
             valid_url = validators.url(self.options.version, simple_host=True)  # for localhost
@@ -3,6 +3,7 @@ Weaviate Exceptions.
 """
 
 from requests import Response, exceptions
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 ERROR_CODE_EXPLANATION = {
     413: """Payload Too Large. Try to decrease the batch size or increase the maximum request size on your weaviate
@@ -145,6 +146,14 @@ class WeaviateStartUpError(WeaviateBaseError):
     """Is raised if weaviate does not start up in time."""
 
 
+class WeaviateCircuitOpenError(WeaviateBaseError, RequestsConnectionError):
+    """
+    Is raised instead of sending a request to a weaviate node while its circuit breaker is open,
+    i.e. after repeated failures, see `weaviate.CircuitBreakerConfig`. It is a
+    `requests.ConnectionError`, so it is handled like a node that cannot be reached.
+    """
+
+
 class WeaviateEmbeddedInvalidVersion(WeaviateBaseError):
     """Invalid version provided to Weaviate embedded."""
 
@@ -0,0 +1,220 @@
+"""
+Asynchronous GraphQL query module.
+"""
+from typing import Any, Dict, List, Optional
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.connect.async_connection import AsyncConnection
+from .aggregate import AggregateBuilder
+from .get import GetBuilder, PROPERTIES
+from .multi_get import MultiGetBuilder
+from ..util import _decode_json_response_dict
+
+
+async def _do_graphql(connection: AsyncConnection, query: str) -> Dict[str, Any]:
+    try:
+        response = await connection.post(path="/graphql", weaviate_object={"query": query})
+    except RequestsConnectionError as conn_err:
+        raise RequestsConnectionError("Query was not successful.") from conn_err
+
+    res = _decode_json_response_dict(response, "Query was not successful")
+    assert res is not None
+    return res
+
+
+class AsyncGetBuilder(GetBuilder):
+    """
+    GetBuilder whose `do` is a coroutine. Supported queries are sent through `grpc.aio` if the
+    client was created with a gRPC port.
+    """
+
+    def __init__(
+        self, class_name: str, properties: Optional[PROPERTIES], connection: AsyncConnection
+    ):
+        super().__init__(class_name, properties, connection)  # type: ignore[arg-type]
+        self._async_connection = connection
+
+    async def do(self) -> dict:  # type: ignore[override]
+        """
+        Builds and runs the query.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+        if self._grpc_enabled():
+            import grpc  # type: ignore
+
+            try:
+                res = await self._async_connection.grpc_stub.Search(  # type: ignore
+                    self._grpc_request(),
+                    metadata=self._grpc_metadata(),
+                )
+                return self._grpc_results(res)
+            except grpc.RpcError as e:
+                return {"errors": [e.details()]}
+        return await _do_graphql(self._async_connection, self.build())
+
+
+class AsyncMultiGetBuilder(MultiGetBuilder):
+    """
+    MultiGetBuilder whose `do` is a coroutine.
+    """
+
+    def __init__(self, get_builder: List[GetBuilder], connection: AsyncConnection):
+        super().__init__(get_builder, connection)  # type: ignore[arg-type]
+        self._async_connection = connection
+
+    async def do(self) -> dict:  # type: ignore[override]
+        """
+        Builds and runs the query, see `AsyncGetBuilder.do`.
+        """
+        return await _do_graphql(self._async_connection, self.build())
+
+
+class AsyncAggregateBuilder(AggregateBuilder):
+    """
+    AggregateBuilder whose `do` is a coroutine.
+    """
+
+    def __init__(self, class_name: str, connection: AsyncConnection):
+        super().__init__(class_name, connection)  # type: ignore[arg-type]
+        self._async_connection = connection
+
+    async def do(self) -> dict:  # type: ignore[override]
+        """
+        Builds and runs the query, see `AsyncGetBuilder.do`.
+        """
+        return await _do_graphql(self._async_connection, self.build())
+
+
+class AsyncQuery:
+    """
+    Query class used to make asynchronous `get` and/or `aggregate` GraphQL queries. The builders
+    are the same as the ones of `weaviate.gql.Query`, only their `do` method has to be awaited.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncQuery class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.connect.async_connection.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+
+    def get(
+        self,
+        class_name: str,
+        properties: Optional[PROPERTIES] = None,
+    ) -> AsyncGetBuilder:
+        """
+        Instantiate an AsyncGetBuilder for GraphQL `get` requests.
+
+        Parameters
+        ----------
+        class_name : str
+            Class name of the objects to interact with.
+        properties : list of str and ReferenceProperty, str or None
+            Properties of the objects to get, by default None
+
+        Returns
+        -------
+        AsyncGetBuilder
+            An AsyncGetBuilder to make GraphQL `get` requests from weaviate.
+
+        Examples
+        --------
+        >>> async with weaviate.AsyncClient("http://localhost:8080") as client:
+        ...     result = await client.query.get("Article", ["title"]).with_limit(2).do()
+        """
+        return AsyncGetBuilder(class_name, properties, self._connection)
+
+    def multi_get(
+        self,
+        get_builder: List[GetBuilder],
+    ) -> AsyncMultiGetBuilder:
+        """
+        Instantiate an AsyncMultiGetBuilder for GraphQL `multi_get` requests.
+        Bundles multiple get requests into one.
+
+        Parameters
+        ----------
+        get_builder : list of GetBuilder
+            List of GetBuilder objects for a single request each.
+
+        Returns
+        -------
+        AsyncMultiGetBuilder
+            An AsyncMultiGetBuilder to make GraphQL `get` multiple requests from weaviate.
+        """
+
+        return AsyncMultiGetBuilder(get_builder, self._connection)
+
+    def aggregate(self, class_name: str) -> AsyncAggregateBuilder:
+        """
+        Instantiate an AsyncAggregateBuilder for GraphQL `aggregate` requests.
+
+        Parameters
+        ----------
+        class_name : str
+            Class name of the objects to be aggregated.
+
+        Returns
+        -------
+        AsyncAggregateBuilder
+            An AsyncAggregateBuilder to make GraphQL `aggregate` requests from weaviate.
+        """
+
+        return AsyncAggregateBuilder(class_name, self._connection)
+
+    async def raw(self, gql_query: str) -> Dict[str, Any]:
+        """
+        Allows to send simple graph QL string queries, see `weaviate.gql.Query.raw`.
+        Be cautious of injection risks when generating query strings.
+
+        Parameters
+        ----------
+        gql_query : str
+            GraphQL query as a string.
+
+        Returns
+        -------
+        dict
+            Data response of the query.
+
+        Raises
+        ------
+        TypeError
+            If 'gql_query' is not of type str.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if not isinstance(gql_query, str):
+            raise TypeError("Query is expected to be a string")
+
+        try:
+            response = await self._connection.post(
+                path="/graphql", weaviate_object={"query": gql_query}
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Query not executed.") from conn_err
+
+        res = _decode_json_response_dict(response, "GQL query failed")
+        assert res is not None
+        return res
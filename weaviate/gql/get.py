@@ -4,7 +4,7 @@ GraphQL `Get` command.
 from dataclasses import dataclass, Field, fields
 from enum import Enum
 from json import dumps
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union, TYPE_CHECKING
 
 from weaviate import util
 from weaviate.connect import Connection
@@ -37,11 +37,9 @@ from weaviate.util import (
 )
 from weaviate.warnings import _Warnings
 
-try:
+# the generated gRPC modules are slow to import and only needed for gRPC queries
+if TYPE_CHECKING:
     from weaviate.proto.v1 import search_get_pb2
-    import grpc  # type: ignore
-except ImportError:
-    pass
 
 
 @dataclass
@@ -1809,7 +1807,28 @@ class GetBuilder(GraphQL):
         weaviate.UnexpectedStatusCodeException
             If weaviate reports a none OK status.
         """
-        grpc_enabled = (  # only implemented for some scenarios
+        if self._grpc_enabled():
+            import grpc  # type: ignore
+
+            try:
+                res, _ = self._connection.grpc_stub.Search.with_call(  # type: ignore
+                    self._grpc_request(),
+                    metadata=self._grpc_metadata(),
+                )
+                results: Union[
+                    Dict[str, Dict[str, Dict[str, List]]], Dict[str, List]
+                ] = self._grpc_results(res)
+            except grpc.RpcError as e:
+                results = {"errors": [e.details()]}
+            return results
+        else:
+            return super().do()
+
+    def _grpc_enabled(self) -> bool:
+        """
+        Whether the query can be sent through gRPC, which is only implemented for some scenarios.
+        """
+        return (
             self._connection.grpc_stub is not None
             and (
                 self._near_clause is None
@@ -1830,79 +1849,72 @@ class GetBuilder(GraphQL):
                 if isinstance(prop, str)
             )  # no ref props as strings
         )
-        if grpc_enabled:
-            metadata: Union[Tuple, Tuple[Tuple[Literal["authorization"], str]]] = ()
-            access_token = self._connection.get_current_bearer_token()
-            if len(access_token) > 0:
-                metadata = (("authorization", access_token),)
-
-            try:
-                res, _ = self._connection.grpc_stub.Search.with_call(  # type: ignore
-                    search_get_pb2.SearchRequest(
-                        collection=self._class_name,
-                        limit=self._limit,
-                        near_vector=search_get_pb2.NearVector(
-                            vector=self._near_clause.content["vector"],
-                            certainty=self._near_clause.content.get("certainty", None),
-                            distance=self._near_clause.content.get("distance", None),
-                        )
-                        if self._near_clause is not None
-                        and isinstance(self._near_clause, NearVector)
-                        else None,
-                        near_object=search_get_pb2.NearObject(
-                            id=self._near_clause.content["id"],
-                            certainty=self._near_clause.content.get("certainty", None),
-                            distance=self._near_clause.content.get("distance", None),
-                        )
-                        if self._near_clause is not None
-                        and isinstance(self._near_clause, NearObject)
-                        else None,
-                        properties=self._convert_references_to_grpc(self._properties),
-                        metadata=search_get_pb2.MetadataRequest(
-                            uuid=self._additional_dataclass.uuid,
-                            vector=self._additional_dataclass.vector,
-                            creation_time_unix=self._additional_dataclass.creationTimeUnix,
-                            last_update_time_unix=self._additional_dataclass.lastUpdateTimeUnix,
-                            distance=self._additional_dataclass.distance,
-                            explain_score=self._additional_dataclass.explainScore,
-                            score=self._additional_dataclass.score,
-                        )
-                        if self._additional_dataclass is not None
-                        else None,
-                        bm25_search=search_get_pb2.BM25(
-                            properties=self._bm25.properties, query=self._bm25.query
-                        )
-                        if self._bm25 is not None
-                        else None,
-                        hybrid_search=search_get_pb2.Hybrid(
-                            properties=self._hybrid.properties,
-                            query=self._hybrid.query,
-                            alpha=self._hybrid.alpha,
-                            vector=self._hybrid.vector,
-                        )
-                        if self._hybrid is not None
-                        else None,
-                    ),
-                    metadata=metadata,
-                )
 
-                objects = []
-                for result in res.results:
-                    obj = self._convert_references_to_grpc_result(result.properties)
-                    additional = self._extract_additional_properties(result.metadata)
-                    if len(additional) > 0:
-                        obj["_additional"] = additional
-                    objects.append(obj)
+    def _grpc_metadata(self) -> Union[Tuple, Tuple[Tuple[Literal["authorization"], str]]]:
+        access_token = self._connection.get_current_bearer_token()
+        if len(access_token) > 0:
+            return (("authorization", access_token),)
+        return ()
+
+    def _grpc_request(self) -> "search_get_pb2.SearchRequest":
+        from weaviate.proto.v1 import search_get_pb2
+
+        return search_get_pb2.SearchRequest(
+            collection=self._class_name,
+            limit=self._limit,
+            near_vector=search_get_pb2.NearVector(
+                vector=self._near_clause.content["vector"],
+                certainty=self._near_clause.content.get("certainty", None),
+                distance=self._near_clause.content.get("distance", None),
+            )
+            if self._near_clause is not None and isinstance(self._near_clause, NearVector)
+            else None,
+            near_object=search_get_pb2.NearObject(
+                id=self._near_clause.content["id"],
+                certainty=self._near_clause.content.get("certainty", None),
+                distance=self._near_clause.content.get("distance", None),
+            )
+            if self._near_clause is not None and isinstance(self._near_clause, NearObject)
+            else None,
+            properties=self._convert_references_to_grpc(self._properties),
+            metadata=search_get_pb2.MetadataRequest(
+                uuid=self._additional_dataclass.uuid,
+                vector=self._additional_dataclass.vector,
+                creation_time_unix=self._additional_dataclass.creationTimeUnix,
+                last_update_time_unix=self._additional_dataclass.lastUpdateTimeUnix,
+                distance=self._additional_dataclass.distance,
+                explain_score=self._additional_dataclass.explainScore,
+                score=self._additional_dataclass.score,
+            )
+            if self._additional_dataclass is not None
+            else None,
+            bm25_search=search_get_pb2.BM25(
+                properties=self._bm25.properties, query=self._bm25.query
+            )
+            if self._bm25 is not None
+            else None,
+            hybrid_search=search_get_pb2.Hybrid(
+                properties=self._hybrid.properties,
+                query=self._hybrid.query,
+                alpha=self._hybrid.alpha,
+                vector=self._hybrid.vector,
+            )
+            if self._hybrid is not None
+            else None,
+        )
 
-                results: Union[Dict[str, Dict[str, Dict[str, List]]], Dict[str, List]] = {
-                    "data": {"Get": {self._class_name: objects}}
-                }
+    def _grpc_results(
+        self, res: "search_get_pb2.SearchReply"
+    ) -> Dict[str, Dict[str, Dict[str, List]]]:
+        objects = []
+        for result in res.results:
+            obj = self._convert_references_to_grpc_result(result.properties)
+            additional = self._extract_additional_properties(result.metadata)
+            if len(additional) > 0:
+                obj["_additional"] = additional
+            objects.append(obj)
 
-            except grpc.RpcError as e:
-                results = {"errors": [e.details()]}
-            return results
-        else:
-            return super().do()
+        return {"data": {"Get": {self._class_name: objects}}}
 
     def _extract_additional_properties(
         self, props: "search_get_pb2.MetadataResult"
@@ -1954,6 +1966,8 @@ class GetBuilder(GraphQL):
     def _convert_references_to_grpc(
         self, properties: List[Union[LinkTo, str]]
     ) -> "search_get_pb2.PropertiesRequest":
+        from weaviate.proto.v1 import search_get_pb2
+
         return search_get_pb2.PropertiesRequest(
             non_ref_properties=[prop for prop in properties if isinstance(prop, str)],
             ref_properties=[
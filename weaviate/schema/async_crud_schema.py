@@ -0,0 +1,292 @@
+"""
+AsyncSchema class definition.
+"""
+from typing import List, Optional, Union
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.connect.async_connection import AsyncConnection
+from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.schema.crud_schema import (
+    Tenant,
+    _get_class_with_primitives,
+    _get_complex_properties,
+    _update_nested_dict,
+)
+from weaviate.util import (
+    _get_dict_from_object,
+    _is_sub_schema,
+    _capitalize_first_letter,
+    _decode_json_response_dict,
+    _decode_json_response_list,
+)
+
+
+class AsyncSchema:
+    """
+    AsyncSchema class used to interact with and manipulate the schema or classes asynchronously. The
+    methods take the same arguments and raise the same exceptions as the ones of
+    `weaviate.schema.Schema`.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncSchema class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.connect.async_connection.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+
+    async def create(self, schema: Union[dict, str]) -> None:
+        """
+        Create the schema of the Weaviate instance, with all classes at once, see `Schema.create`.
+        """
+
+        loaded_schema = _get_dict_from_object(schema)
+        for weaviate_class in loaded_schema["classes"]:
+            await self._create_class_with_primitives(weaviate_class)
+        for weaviate_class in loaded_schema["classes"]:
+            await self._create_complex_properties_from_class(weaviate_class)
+
+    async def create_class(self, schema_class: Union[dict, str]) -> None:
+        """
+        Create a single class as part of the schema in Weaviate, see `Schema.create_class`.
+        """
+
+        loaded_schema_class = _get_dict_from_object(schema_class)
+        await self._create_class_with_primitives(loaded_schema_class)
+        await self._create_complex_properties_from_class(loaded_schema_class)
+
+    async def delete_class(self, class_name: str) -> None:
+        """
+        Delete a schema class from Weaviate. This deletes all associated data.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"Class name was {type(class_name)} instead of str")
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}"
+        try:
+            response = await self._connection.delete(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Deletion of class.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Delete class from schema", response)
+
+    async def delete_all(self) -> None:
+        """
+        Remove the entire schema from the Weaviate instance and all data associated with it.
+        """
+
+        schema = await self.get()
+        for _class in schema.get("classes", []):
+            await self.delete_class(_class["class"])
+
+    async def exists(self, class_name: str) -> bool:
+        """
+        Check if class exists in Weaviate.
+
+        Returns
+        -------
+        bool
+            True if the class exists,
+            False otherwise.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(
+                f"'class_name' argument must be of type `str`! Given type: {type(class_name)}."
+            )
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}"
+        try:
+            response = await self._connection.get(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Checking class existence could not be done."
+            ) from conn_err
+        if response.status_code == 200:
+            return True
+        elif response.status_code == 404:
+            return False
+
+        raise UnexpectedStatusCodeException("Check if class exists", response)
+
+    async def contains(self, schema: Optional[Union[dict, str]] = None) -> bool:
+        """
+        Check if Weaviate already contains a schema, see `Schema.contains`.
+
+        Returns
+        -------
+        bool
+            True if a schema is present,
+            False otherwise.
+        """
+
+        loaded_schema = await self.get()
+
+        if schema is not None:
+            sub_schema = _get_dict_from_object(schema)
+            return _is_sub_schema(sub_schema, loaded_schema)
+
+        return len(loaded_schema["classes"]) > 0
+
+    async def update_config(self, class_name: str, config: dict) -> None:
+        """
+        Update a schema configuration for a specific class, see `Schema.update_config`.
+        """
+
+        class_name = _capitalize_first_letter(class_name)
+        class_schema = await self.get(class_name)
+        new_class_schema = _update_nested_dict(class_schema, config)
+
+        path = "/schema/" + class_name
+        try:
+            response = await self._connection.put(path=path, weaviate_object=new_class_schema)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Class schema configuration could not be updated."
+            ) from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Update class schema configuration", response)
+
+    async def get(self, class_name: Optional[str] = None) -> dict:
+        """
+        Get the schema from Weaviate, or only the one of `class_name`.
+
+        Returns
+        -------
+        dict
+            A dict containing the schema. The schema may be empty.
+        """
+
+        path = "/schema"
+        if class_name is not None:
+            if not isinstance(class_name, str):
+                raise TypeError(
+                    "'class_name' argument must be of type `str`! "
+                    f"Given type: {type(class_name)}"
+                )
+            path = f"/schema/{_capitalize_first_letter(class_name)}"
+
+        try:
+            response = await self._connection.get(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Schema could not be retrieved.") from conn_err
+
+        res = _decode_json_response_dict(response, "Get schema")
+        assert res is not None
+        return res
+
+    async def get_class_shards(self, class_name: str) -> list:
+        """
+        Get the status of all shards in an index.
+
+        Returns
+        -------
+        list
+            The list of shards configuration.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(
+                "'class_name' argument must be of type `str`! " f"Given type: {type(class_name)}."
+            )
+        path = f"/schema/{_capitalize_first_letter(class_name)}/shards"
+
+        try:
+            response = await self._connection.get(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Class shards' status could not be retrieved due to connection error."
+            ) from conn_err
+
+        res = _decode_json_response_list(response, "Get shards' status")
+        assert res is not None
+        return res
+
+    async def add_class_tenants(self, class_name: str, tenants: List[Tenant]) -> None:
+        """
+        Add class's tenants in Weaviate.
+        """
+
+        loaded_tenants = [tenant._to_weaviate_object() for tenant in tenants]
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}/tenants"
+        try:
+            response = await self._connection.post(path=path, weaviate_object=loaded_tenants)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Classes tenants may not have been added properly."
+            ) from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Add classes tenants", response)
+
+    async def remove_class_tenants(self, class_name: str, tenants: List[str]) -> None:
+        """
+        Remove class's tenants in Weaviate.
+        """
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}/tenants"
+        try:
+            response = await self._connection.delete(path=path, weaviate_object=tenants)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Classes tenants may not have been deleted."
+            ) from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Delete classes tenants", response)
+
+    async def get_class_tenants(self, class_name: str) -> List[Tenant]:
+        """
+        Get class's tenants in Weaviate.
+        """
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}/tenants"
+        try:
+            response = await self._connection.get(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Could not get class tenants.") from conn_err
+
+        tenant_resp = _decode_json_response_list(response, "Get class tenants")
+        assert tenant_resp is not None
+        return [Tenant._from_weaviate_object(tenant) for tenant in tenant_resp]
+
+    async def update_class_tenants(self, class_name: str, tenants: List[Tenant]) -> None:
+        """
+        Update class tenants, e.g. to move them from one activity state to another.
+        """
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}/tenants"
+        loaded_tenants = [tenant._to_weaviate_object() for tenant in tenants]
+        try:
+            response = await self._connection.put(path=path, weaviate_object=loaded_tenants)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Could not update class tenants.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Update classes tenants", response)
+
+    async def _create_complex_properties_from_class(self, schema_class: dict) -> None:
+        for schema_property in _get_complex_properties(schema_class):
+            path = "/schema/" + _capitalize_first_letter(schema_class["class"]) + "/properties"
+            try:
+                response = await self._connection.post(path=path, weaviate_object=schema_property)
+            except RequestsConnectionError as conn_err:
+                raise RequestsConnectionError(
+                    "Property may not have been created properly."
+                ) from conn_err
+            if response.status_code != 200:
+                raise UnexpectedStatusCodeException("Add properties to classes", response)
+
+    async def _create_class_with_primitives(self, weaviate_class: dict) -> None:
+        schema_class = _get_class_with_primitives(weaviate_class)
+        try:
+            response = await self._connection.post(path="/schema", weaviate_object=schema_class)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Class may not have been created properly.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Create class", response)
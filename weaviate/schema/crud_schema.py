@@ -737,23 +737,7 @@ class Schema:
             If Weaviate reports a non-OK status.
         """
 
-        if "properties" not in schema_class:
-            # Class has no properties - nothing to do
-            return
-        for property_ in schema_class["properties"]:
-            if _property_is_primitive(property_["dataType"]):
-                continue
-
-            # Create the property object. All complex dataTypes should be capitalized.
-            schema_property = {
-                "dataType": [_capitalize_first_letter(dtype) for dtype in property_["dataType"]],
-                "name": property_["name"],
-            }
-
-            for property_field in PROPERTY_KEYS - {"name", "dataType"}:
-                if property_field in property_:
-                    schema_property[property_field] = property_[property_field]
-
+        for schema_property in _get_complex_properties(schema_class):
             path = "/schema/" + _capitalize_first_letter(schema_class["class"]) + "/properties"
             try:
                 response = self._connection.post(path=path, weaviate_object=schema_property)
@@ -794,20 +778,7 @@ class Schema:
             If Weaviate reports a non-OK status.
         """
 
-        # Create the class
-        schema_class = {
-            "class": _capitalize_first_letter(weaviate_class["class"]),
-            "properties": [],
-        }
-
-        for class_field in CLASS_KEYS - {"class", "properties"}:
-            if class_field in weaviate_class:
-                schema_class[class_field] = weaviate_class[class_field]
-
-        if "properties" in weaviate_class:
-            schema_class["properties"] = _get_primitive_properties(weaviate_class["properties"])
-
-        # Add the item
+        schema_class = _get_class_with_primitives(weaviate_class)
         try:
             response = self._connection.post(path="/schema", weaviate_object=schema_class)
         except RequestsConnectionError as conn_err:
@@ -985,6 +956,71 @@ class Schema:
             raise UnexpectedStatusCodeException("Update classes tenants", response)
 
 
+def _get_class_with_primitives(weaviate_class: dict) -> dict:
+    """
+    Get the class without the properties that reference other classes.
+
+    Parameters
+    ----------
+    weaviate_class : dict
+        A single Weaviate formatted class
+
+    Returns
+    -------
+    dict
+        The class with only primitive properties.
+    """
+
+    schema_class = {
+        "class": _capitalize_first_letter(weaviate_class["class"]),
+        "properties": [],
+    }
+
+    for class_field in CLASS_KEYS - {"class", "properties"}:
+        if class_field in weaviate_class:
+            schema_class[class_field] = weaviate_class[class_field]
+
+    if "properties" in weaviate_class:
+        schema_class["properties"] = _get_primitive_properties(weaviate_class["properties"])
+    return schema_class
+
+
+def _get_complex_properties(schema_class: dict) -> List[dict]:
+    """
+    Get the properties of the class that reference other classes.
+
+    Parameters
+    ----------
+    schema_class : dict
+        Description of the class.
+
+    Returns
+    -------
+    List[dict]
+        The cross-reference properties, ready to be added to the existing class.
+    """
+
+    if "properties" not in schema_class:
+        # Class has no properties - nothing to do
+        return []
+    complex_properties = []
+    for property_ in schema_class["properties"]:
+        if _property_is_primitive(property_["dataType"]):
+            continue
+
+        # Create the property object. All complex dataTypes should be capitalized.
+        schema_property = {
+            "dataType": [_capitalize_first_letter(dtype) for dtype in property_["dataType"]],
+            "name": property_["name"],
+        }
+
+        for property_field in PROPERTY_KEYS - {"name", "dataType"}:
+            if property_field in property_:
+                schema_property[property_field] = property_[property_field]
+        complex_properties.append(schema_property)
+    return complex_properties
+
+
 def _property_is_primitive(data_type_list: list) -> bool:
     """
     Check if the property is primitive.
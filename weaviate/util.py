@@ -11,7 +11,6 @@ from typing import Union, Sequence, Any, Optional, List, Dict, Tuple, cast
 
 import requests
 import uuid as uuid_lib
-import validators  # type: ignore
 from requests.exceptions import JSONDecodeError
 
 from weaviate.exceptions import (
@@ -235,6 +234,8 @@ def _get_dict_from_object(object_: Union[str, dict]) -> dict:
         # Object is already a dict
         return object_
     if isinstance(object_, str):
+        import validators
+
         if validators.url(object_):
             # Object is URL
             response = requests.get(object_)
@@ -280,6 +281,8 @@ def is_weaviate_object_url(url: str) -> bool:
     if len(split) not in (2, 3):
         return False
     if split[0] != "localhost":
+        import validators
+
         if not validators.domain(split[0]):
             return False
     try: